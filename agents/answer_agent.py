@@ -1,8 +1,8 @@
 from typing import Dict, Any
-from core import BaseAgent
+from core import StreamAgent
 
 
-class AnswerAgent(BaseAgent):
+class AnswerAgent(StreamAgent):
     """
     Answer Agent
     Task Management Agent의 결과를
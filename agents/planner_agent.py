@@ -9,6 +9,9 @@ from core import BaseAgent
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 핵심 엔터티 없이 이 단어 수 미만인 질문은 RAG 검색 생략
+RAG_MIN_QUERY_WORDS = 3
+
 
 class PlannerAgent(BaseAgent):
     """
@@ -37,8 +40,10 @@ class PlannerAgent(BaseAgent):
         key_entities = inputs.get("key_entities", [])
         user_input = inputs.get("user_input", "")
 
-        # 현재 의도를 인스턴스 변수에 저장 (검증 시 사용)
+        # 현재 의도와 입력을 인스턴스 변수에 저장 (검증 및 RAG 필요 여부 판단 시 사용)
         self._current_intent = intent
+        self._current_user_input = user_input
+        self._current_key_entities = key_entities
 
         prompt = f"""
 당신은 클라우드 거버넌스 AI 시스템의 Enhanced Planner Agent입니다.
@@ -162,6 +167,9 @@ Intent가 "slide_generation"인 경우:
                 dependency_graph = self._build_dependency_graph(validated_steps)
                 result["dependency_graph"] = dependency_graph
 
+                # RAG 검색 필요 여부 (일반 대화는 문서 검색 생략)
+                result["needs_rag"] = self._needs_rag()
+
                 # MCP context 업데이트
                 result["mcp_context"] = {
                     **self.mcp_context,
@@ -293,6 +301,21 @@ Intent가 "slide_generation"인 경우:
 
         return validated_steps
 
+    def _needs_rag(self) -> bool:
+        """
+        RAG 문서 검색 필요 여부 판단
+
+        일반 대화/인사, 또는 핵심 엔터티 없이 RAG_MIN_QUERY_WORDS 단어 미만인
+        짧은 질문("고마워요", "시스템 상태")은 검색 불필요
+        """
+        intent = getattr(self, "_current_intent", "general")
+        if intent == "general":
+            return False
+        if intent == "question" and not getattr(self, "_current_key_entities", []):
+            user_input = getattr(self, "_current_user_input", "")
+            return len(user_input.split()) >= RAG_MIN_QUERY_WORDS
+        return True
+
     def _build_dependency_graph(self, steps: List[Dict[str, Any]]) -> Dict[str, Any]:
         """의존성 그래프 구성"""
         graph = {
@@ -397,6 +420,7 @@ Intent가 "slide_generation"인 경우:
                 "parallel_execution": False,
             },
             "execution_steps": execution_steps,
+            "needs_rag": self._needs_rag(),
             "failure_recovery": {
                 "auto_retry": True,
                 "max_retries": 1,
@@ -655,10 +655,16 @@ class ReActExecutorAgent(BaseAgent):
 
             # 다른 도구들은 MCP를 통해 실행
             elif tool_name == "rag_retriever":
-                logger.info(f"       🔍 MCP RAG 검색 도구 실행")
-                query = tool_params.get("query", "클라우드 거버넌스")
-                top_k = tool_params.get("top_k", 5)
-                result = self.mcp_client.search_documents(query=query, top_k=top_k)
+                execution_context = getattr(self, "_current_context", {})
+                if execution_context.get("needs_rag") is False:
+                    # 플래너가 RAG 불필요로 분류한 요청은 MCP 검색 왕복 생략
+                    logger.info(f"       ⏭️ RAG 불필요 요청 - 문서 검색 생략")
+                    result = {"result": {"results": []}, "status": "skipped"}
+                else:
+                    logger.info(f"       🔍 MCP RAG 검색 도구 실행")
+                    query = tool_params.get("query", "클라우드 거버넌스")
+                    top_k = tool_params.get("top_k", 5)
+                    result = self.mcp_client.search_documents(query=query, top_k=top_k)
 
             elif tool_name == "slide_draft":
                 logger.info(f"       📝 MCP 슬라이드 초안 생성 도구 실행")
@@ -1,9 +1,18 @@
+import copy
 import json
 import re
+import threading
+from collections import OrderedDict
 from typing import Dict, Any
 
 from core import BaseAgent
 
+# 슬라이드 생성 의도가 명확한 키워드 (LLM 호출 없이 사전 분류)
+_SLIDE_RE = re.compile(r"(슬라이드|프레젠테이션|발표\s*자료|ppt|presentation|slide)", re.I)
+
+# 동일 질의에 대한 LLM 의도 분석 결과 캐시 크기
+INTENT_CACHE_SIZE = 4096
+
 
 class RouterAgent(BaseAgent):
     """
@@ -15,6 +24,53 @@ class RouterAgent(BaseAgent):
     def __init__(self):
         super().__init__("RouterAgent")
         self.mcp_context = {"role": "router", "function": "intent_extraction"}
+        self._intent_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._intent_cache_lock = threading.Lock()
+
+    def __call__(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        의도가 명확한 입력은 정규식으로 사전 분류하고, 나머지만 LLM으로 분석
+        LLM 분석에 성공한 결과는 질의 문자열 기준 LRU 캐시에 보관하여
+        동일한 질의가 반복되면 LLM 호출을 생략
+
+        Args:
+            inputs (Dict[str, Any]): {"user_input": str}
+
+        Returns:
+            Dict[str, Any]: 의도 분석 결과
+        """
+        user_input = inputs.get("user_input", "")
+        keyword_match = _SLIDE_RE.search(user_input)
+        if keyword_match:
+            return {
+                "intent": "slide_generation",
+                "confidence": 0.9,
+                "key_entities": [keyword_match.group()],
+                "analysis": "슬라이드 생성 키워드 기반 사전 분류",
+                "mcp_context": {
+                    **self.mcp_context,
+                    "status": "success",
+                    "intent_detected": "slide_generation",
+                    "confidence": 0.9,
+                    "classified_by": "keyword",
+                },
+            }
+
+        with self._intent_cache_lock:
+            cached = self._intent_cache.get(user_input)
+            if cached is not None:
+                self._intent_cache.move_to_end(user_input)
+                return copy.deepcopy(cached)
+
+        result = super().__call__(inputs)
+
+        # 파싱 실패 등 오류 결과는 캐시하지 않음
+        if result.get("mcp_context", {}).get("status") == "success":
+            with self._intent_cache_lock:
+                self._intent_cache[user_input] = copy.deepcopy(result)
+                if len(self._intent_cache) > INTENT_CACHE_SIZE:
+                    self._intent_cache.popitem(last=False)
+        return result
 
     def _create_prompt(self, inputs: Dict[str, Any]) -> str:
         """
@@ -6,21 +6,31 @@
 사용자 입력을 받아 처리하는 API 엔드포인트를 제공합니다.
 """
 
-import sys
 import os
-from typing import Dict, Any, Generator
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import StreamingResponse
+import time
+from datetime import datetime
+from typing import Annotated, Dict, Any, AsyncGenerator
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from watchfiles import DefaultFilter
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    ValidationError,
+)
+from sse_starlette.sse import EventSourceResponse
 import logging
+import logging.handlers
+import queue
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
 from contextlib import asynccontextmanager
-import json
-from uvicorn import Config, Server
-
-# 현재 디렉토리를 Python 패스에 추가
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import msgpack
+import orjson
+import uvicorn
 
 from orchestrator import CloudGovernanceOrchestrator
 
@@ -31,8 +41,16 @@ if not os.path.exists(log_dir):
 
 
 # 로깅 설정 강화
-def setup_logging():
-    """로깅 설정"""
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    로깅 설정
+
+    요청 처리 경로에서는 QueueHandler로 메모리 큐에 적재만 하고,
+    파일/콘솔 쓰기는 QueueListener 백그라운드 스레드에서 수행합니다.
+
+    Returns:
+        logging.handlers.QueueListener: 시작된 로그 리스너
+    """
     # 로그 파일 경로
     log_file_path = os.path.join(log_dir, "api_server.log")
 
@@ -65,50 +83,165 @@ def setup_logging():
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
 
-    # 루트 로거에 핸들러 추가
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    # 루트 로거에는 큐 핸들러만 추가하고 실제 출력은 리스너가 담당
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    return listener
 
 
 # 로깅 설정 실행
-setup_logging()
+log_listener = setup_logging()
 logger = logging.getLogger(__name__)
 
-# 오케스트레이터 인스턴스 (전역)
-orchestrator = None
+# 동기 이터레이터 종료 표시용 센티널
+_SENTINEL = object()
+
+# MessagePack 스트리밍 응답 미디어 타입 (?format=msgpack 또는 Accept 헤더로 선택)
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+# 고정 구조 SSE 프레임의 불변 부분을 미리 인코딩 (가변 필드만 런타임에 직렬화)
+_START_PREFIX = (
+    'event: start\ndata: {"type":"start","message":"요청 처리를 시작합니다...",'
+    '"timestamp":'
+).encode()
+_START_MID = b',"intent":'
+_END_PREFIX = (
+    'event: stream_end\ndata: {"type":"stream_end","message":"처리가 완료되었습니다.",'
+    '"timestamp":'
+).encode()
+_ERROR_PREFIX = b'event: error\ndata: {"type":"error","message":'
+_ERROR_MID = b',"error":'
+_TIMESTAMP_MID = b',"timestamp":'
+_FRAME_SUFFIX = b"}\n\n"
+
+
+def _sse_frame(payload: Dict[str, Any]) -> bytes:
+    """
+    SSE 프레임 직렬화 (orjson은 UTF-8 bytes를 바로 반환하여 인코딩 단계 생략)
+
+    EventSourceResponse는 bytes를 그대로 전송하므로 프레임을 직접 구성합니다.
+    """
+    body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    event_type = payload.get("type")
+    # 중간 bytes 객체 없이 최종 프레임을 한 번에 할당
+    if event_type:
+        return b"".join(
+            (b"event: ", event_type.encode(), b"\ndata: ", body, b"\n\n")
+        )
+    return b"".join((b"data: ", body, b"\n\n"))
+
+
+async def _iterate_in_thread(
+    iterator, executor: Executor
+) -> AsyncGenerator[Any, None]:
+    """동기 이터레이터를 순회하되 블로킹되는 next() 호출만 전용 스레드 풀로 보냄"""
+    loop = asyncio.get_running_loop()
+    iterator = iter(iterator)
+    while True:
+        item = await loop.run_in_executor(executor, next, iterator, _SENTINEL)
+        if item is _SENTINEL:
+            break
+        yield item
+
+
+def _wants_msgpack(request: Request) -> bool:
+    """클라이언트가 MessagePack 프레임 응답을 요청했는지 확인"""
+    return request.query_params.get(
+        "format"
+    ) == "msgpack" or MSGPACK_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _start_frame(timestamp: str, intent: Any) -> bytes:
+    """스트림 시작(start) 프레임 생성"""
+    return (
+        _START_PREFIX
+        + orjson.dumps(timestamp)
+        + _START_MID
+        + orjson.dumps(intent)
+        + _FRAME_SUFFIX
+    )
 
 
-class IgnoreLogsFilter(DefaultFilter):
-    def __call__(self, change, path):
-        # logs 디렉토리 내 파일은 감시 제외
-        if "/logs/" in path or path.endswith(".log"):
-            return False
-        return super().__call__(change, path)
+def _end_frame(timestamp: str) -> bytes:
+    """스트림 종료(stream_end) 프레임 생성"""
+    return _END_PREFIX + orjson.dumps(timestamp) + _FRAME_SUFFIX
+
+
+def _error_frame(message: str, error: str, timestamp: str) -> bytes:
+    """오류(error) 프레임 생성"""
+    return (
+        _ERROR_PREFIX
+        + orjson.dumps(message)
+        + _ERROR_MID
+        + orjson.dumps(error)
+        + _TIMESTAMP_MID
+        + orjson.dumps(timestamp)
+        + _FRAME_SUFFIX
+    )
 
 
 class UserInput(BaseModel):
     """사용자 입력 요청 모델"""
 
-    query: str
-    options: Dict[str, Any] = {}
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    # 공백 제거 및 빈 문자열 검사를 검증 단계(pydantic-core)에서 처리
+    query: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+    options: Dict[str, Any] = Field(default_factory=dict)
+
+
+def get_orchestrator(request: Request) -> CloudGovernanceOrchestrator:
+    """lifespan에서 워커 프로세스별로 생성된 오케스트레이터 반환"""
+    return request.app.state.orchestrator
 
 
-def startup_event():
-    """서버 시작 시 초기화"""
-    global orchestrator
+# 시스템 상태 TTL 캐시 (헬스 체크 프로브마다 재계산하지 않도록)
+STATUS_CACHE_TTL = 2.0
+_status_cache = {"t": 0.0, "v": None}
+
+
+def get_cached_system_status(
+    orchestrator: CloudGovernanceOrchestrator,
+) -> Dict[str, Any]:
+    """TTL 동안 캐시된 오케스트레이터 시스템 상태 반환"""
+    now = time.monotonic()
+    if _status_cache["v"] is None or now - _status_cache["t"] > STATUS_CACHE_TTL:
+        _status_cache["v"] = orchestrator.get_system_status()
+        _status_cache["t"] = now
+    return _status_cache["v"]
+
+
+def startup_event() -> CloudGovernanceOrchestrator:
+    """서버 시작 시 초기화 (첫 요청이 초기화 비용을 부담하지 않도록 미리 생성)"""
     try:
         logger.info("🔧 클라우드 거버넌스 AI 시스템 초기화 중...")
         orchestrator = CloudGovernanceOrchestrator()
         logger.info("✅ 시스템 초기화 완료")
+        return orchestrator
     except Exception as e:
         logger.error(f"❌ 시스템 초기화 실패: {str(e)}")
         raise
 
 
+# 오케스트레이터 스트리밍 전용 스레드 수 (동시 LLM 처리 상한)
+ORCHESTRATOR_MAX_WORKERS = 8
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    startup_event()
+    # 워커 프로세스마다 lifespan이 실행되므로 상태를 전역 대신 app.state에 보관
+    app.state.orchestrator = startup_event()
+    app.state.pool = ThreadPoolExecutor(
+        max_workers=ORCHESTRATOR_MAX_WORKERS, thread_name_prefix="orch"
+    )
     yield
+    app.state.pool.shutdown(wait=False, cancel_futures=True)
+    # 큐에 남은 로그를 모두 기록한 뒤 리스너 종료
+    app.state.log_listener.stop()
 
 
 # FastAPI 앱 초기화
@@ -117,7 +250,9 @@ app = FastAPI(
     description="클라우드 거버넌스 관련 질문 답변 및 슬라이드 생성 AI 서비스",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
+app.state.log_listener = log_listener
 
 # CORS 미들웨어 추가
 app.add_middleware(
@@ -132,132 +267,200 @@ app.add_middleware(
 @app.get("/")
 async def root():
     """루트 엔드포인트"""
-    return {
-        "message": "클라우드 거버넌스 AI 서비스",
-        "version": "1.0.0",
-        "status": "running",
-    }
+    return ORJSONResponse(
+        {
+            "message": "클라우드 거버넌스 AI 서비스",
+            "version": "1.0.0",
+            "status": "running",
+        }
+    )
 
 
 @app.get("/health")
-async def health_check():
+async def health_check(
+    orchestrator: CloudGovernanceOrchestrator = Depends(get_orchestrator),
+):
     """헬스 체크 엔드포인트"""
     try:
-        status = orchestrator.get_system_status()
-        return {
-            "status": "healthy",
-            "system_status": status,
-            "timestamp": get_timestamp(),
-        }
+        status = get_cached_system_status(orchestrator)
+        return ORJSONResponse(
+            {
+                "status": "healthy",
+                "system_status": status,
+                "timestamp": get_timestamp(),
+            }
+        )
     except Exception as e:
         logger.error(f"헬스 체크 실패: {str(e)}")
         raise HTTPException(status_code=500, detail="시스템 상태 확인 실패")
 
 
-@app.post("/chat")
-async def process_user_input(user_input: UserInput):
+@app.post(
+    "/chat",
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": UserInput.model_json_schema()}},
+            "required": True,
+        }
+    },
+)
+async def process_user_input(
+    request: Request,
+    orchestrator: CloudGovernanceOrchestrator = Depends(get_orchestrator),
+):
     """
     사용자 입력 처리 엔드포인트 (스트리밍 응답)
 
     모든 요청을 스트리밍 방식으로 처리합니다.
+    요청 본문은 pydantic-core가 bytes에서 바로 파싱/검증합니다.
     """
     try:
-        logger.info(f"📨 사용자 요청 수신: {user_input.query[:50]}...")
+        user_input = UserInput.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
 
-        if not user_input.query.strip():
-            raise HTTPException(status_code=400, detail="질문을 입력해주세요.")
+    try:
+        started = time.perf_counter()
 
         # RouterAgent를 통해 의도 먼저 분석
         router_result = orchestrator.router_agent({"user_input": user_input.query})
         intent = router_result.get("intent", "general")
 
-        logger.info(f"🎯 감지된 의도: {intent}")
-        logger.info("📊 스트리밍 응답으로 처리")
-
-        def generate_streaming_response() -> Generator[str, None, None]:
+        wants_msgpack = _wants_msgpack(request)
+
+        # 요청당 로그 레코드를 하나로 묶고, INFO 비활성 시 포맷팅 자체를 생략
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "📨 요청 수신 query=%.50s intent=%s stream=%s routed_in=%.3fs",
+                user_input.query,
+                intent,
+                "msgpack" if wants_msgpack else "sse",
+                time.perf_counter() - started,
+            )
+
+        if wants_msgpack:
+
+            async def generate_msgpack_response() -> AsyncGenerator[bytes, None]:
+                # JSON 이스케이프 없이 자기 구분(self-delimiting) MessagePack 프레임으로 전송
+                packer = msgpack.Packer(use_bin_type=True)
+                try:
+                    stream_ts = get_timestamp()
+                    yield packer.pack(
+                        {
+                            "type": "start",
+                            "message": "요청 처리를 시작합니다...",
+                            "timestamp": stream_ts,
+                            "intent": intent,
+                        }
+                    )
+                    seq = 0
+                    async for chunk in _iterate_in_thread(
+                        orchestrator.process_request_streaming(user_input.query),
+                        request.app.state.pool,
+                    ):
+                        yield packer.pack(
+                            {"timestamp": stream_ts, "seq": seq, "chunk": chunk}
+                        )
+                        seq += 1
+                    yield packer.pack(
+                        {
+                            "type": "stream_end",
+                            "message": "처리가 완료되었습니다.",
+                            "timestamp": get_timestamp(),
+                        }
+                    )
+                except Exception as e:
+                    yield packer.pack(
+                        {
+                            "type": "error",
+                            "message": f"스트리밍 처리 중 오류: {str(e)}",
+                            "error": str(e),
+                            "timestamp": get_timestamp(),
+                        }
+                    )
+
+            return StreamingResponse(
+                generate_msgpack_response(), media_type=MSGPACK_MEDIA_TYPE
+            )
+
+        async def generate_streaming_response() -> AsyncGenerator[bytes, None]:
             try:
                 # 스트리밍 처리 시작 신호
-                start_chunk = {
-                    "type": "start",
-                    "message": "요청 처리를 시작합니다...",
-                    "timestamp": get_timestamp(),
-                    "intent": intent,
-                }
-                yield f"data: {json.dumps(start_chunk, ensure_ascii=False)}\n\n"
+                stream_ts = get_timestamp()
+                yield _start_frame(stream_ts, intent)
 
                 # 오케스트레이터를 통한 스트리밍 처리
-                for chunk in orchestrator.process_request_streaming(user_input.query):
-                    chunk_data = {"timestamp": get_timestamp(), "chunk": chunk}
-                    yield f"data: {json.dumps(chunk_data, ensure_ascii=False)}\n\n"
+                # 블로킹되는 next() 호출만 스레드로 보내고 yield는 이벤트 루프에서 처리
+                # 청크에는 스트림 시작 시각과 순번(seq)을 함께 전달
+                seq = 0
+                async for chunk in _iterate_in_thread(
+                    orchestrator.process_request_streaming(user_input.query),
+                    request.app.state.pool,
+                ):
+                    chunk_data = {"timestamp": stream_ts, "seq": seq, "chunk": chunk}
+                    yield _sse_frame(chunk_data)
+                    seq += 1
 
                 # 스트림 종료 신호
-                final_chunk = {
-                    "type": "stream_end",
-                    "message": "처리가 완료되었습니다.",
-                    "timestamp": get_timestamp(),
-                }
-                yield f"data: {json.dumps(final_chunk, ensure_ascii=False)}\n\n"
+                yield _end_frame(get_timestamp())
 
             except Exception as e:
-                error_chunk = {
-                    "type": "error",
-                    "message": f"스트리밍 처리 중 오류: {str(e)}",
-                    "error": str(e),
-                    "timestamp": get_timestamp(),
-                }
-                yield f"data: {json.dumps(error_chunk, ensure_ascii=False)}\n\n"
-
-        return StreamingResponse(
-            generate_streaming_response(),
-            media_type="text/plain",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "Content-Type": "text/plain; charset=utf-8",
-            },
-        )
+                yield _error_frame(
+                    f"스트리밍 처리 중 오류: {str(e)}", str(e), get_timestamp()
+                )
+
+        return EventSourceResponse(generate_streaming_response(), ping=15)
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"❌ 요청 처리 실패: {str(e)}")
 
-        def generate_error_stream():
-            error_response = {
-                "type": "error",
-                "message": f"요청 처리 중 오류가 발생했습니다: {str(e)}",
-                "error": str(e),
-                "timestamp": get_timestamp(),
-            }
-            yield f"data: {json.dumps(error_response, ensure_ascii=False)}\n\n"
-
-        return StreamingResponse(
-            generate_error_stream(),
-            media_type="text/plain",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "Content-Type": "text/plain; charset=utf-8",
-            },
-        )
+        # except 블록 종료 시 e가 해제되므로 메시지를 미리 바인딩
+        error_message = str(e)
+
+        async def generate_error_stream() -> AsyncGenerator[bytes, None]:
+            yield _error_frame(
+                f"요청 처리 중 오류가 발생했습니다: {error_message}",
+                error_message,
+                get_timestamp(),
+            )
+
+        return EventSourceResponse(generate_error_stream(), ping=15)
 
 
 @app.get("/system/status")
-async def get_system_status():
+async def get_system_status(
+    orchestrator: CloudGovernanceOrchestrator = Depends(get_orchestrator),
+):
     """시스템 상태 조회 엔드포인트"""
     try:
-        status = orchestrator.get_system_status()
-        return {"success": True, "data": status, "timestamp": get_timestamp()}
+        status = get_cached_system_status(orchestrator)
+        return ORJSONResponse(
+            {"success": True, "data": status, "timestamp": get_timestamp()}
+        )
     except Exception as e:
         logger.error(f"시스템 상태 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail="시스템 상태 조회 실패")
 
 
-def get_timestamp() -> str:
-    """현재 타임스탬프 반환"""
-    from datetime import datetime
+class _SecondTimestamp:
+    """초 단위로 포맷 결과를 캐시하는 타임스탬프 생성기"""
+
+    def __init__(self):
+        self._last_sec = -1
+        self._last_iso = ""
+
+    def __call__(self) -> str:
+        sec = int(time.time())
+        if sec != self._last_sec:
+            self._last_iso = datetime.fromtimestamp(sec).isoformat()
+            self._last_sec = sec
+        return self._last_iso
+
 
-    return datetime.now().isoformat()
+# 현재 타임스탬프 반환 (같은 초 안에서는 datetime 생성/포맷팅 생략)
+get_timestamp = _SecondTimestamp()
 
 
 if __name__ == "__main__":
@@ -273,13 +476,17 @@ if __name__ == "__main__":
     logger.info("💡 모든 요청이 스트리밍 방식으로 처리됩니다.")
     logger.info("=" * 60)
 
-    config = Config(
+    # 개발 모드(DEV=1)에서만 코드 변경 감지 재시작 사용
+    # 운영 환경은 WORKERS>1로 멀티 프로세스 확장 (reload 사용 시 workers는 무시됨)
+    dev_mode = os.getenv("DEV") == "1"
+    uvicorn.run(
         "api_server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        reload_excludes=["log/*"],
+        loop="uvloop",
+        http="httptools",
+        reload=dev_mode,
+        reload_excludes=["log/*"] if dev_mode else None,
+        workers=int(os.getenv("WORKERS", "1")),
         log_level="info",
     )
-    server = Server(config)
-    server.run()
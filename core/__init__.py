@@ -1,5 +1,5 @@
 # conf 패키지
-from core.settings import get_llm, get_embeddings, config, get_claude_llm
+from core.settings import get_llm, get_embeddings, config, get_claude_llm, get_settings
 from core.base_agent import BaseAgent
 from core.stream_agent import StreamAgent
 from core.base_tool import BaseTool
@@ -12,4 +12,5 @@ __all__ = [
     "StreamAgent",
     "BaseTool",
     "get_claude_llm",
+    "get_settings",
 ]
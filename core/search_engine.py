@@ -13,16 +13,307 @@ Features:
 
 import os
 import re
+import sys
+import asyncio
+import json
+import functools
 import time
+import heapq
+import itertools
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import operator
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from bisect import bisect_right
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Union
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import ahocorasick
 import chromadb
+import numpy as np
+import orjson
 from chromadb.utils import embedding_functions
 
+# 확장 키워드 집합별 단어 경계 매칭 정규식 캐시 크기
+KEYWORD_PATTERN_CACHE_SIZE = 256
 
-class SearchMethod(Enum):
+# 파일명별 (최신성, 출처 신뢰도) 태그 캐시 크기
+DOC_TAG_CACHE_SIZE = 4096
+
+# 키워드 매칭기: (단어 경계 alternation 정규식, 경계 없는 alternation 정규식,
+# 소문자 키워드별 원본 키워드 개수, 소문자 키워드별 단어 경계 정규식)
+_KeywordMatcher = Tuple[
+    "re.Pattern[str]", "re.Pattern[str]", Dict[str, int], Dict[str, "re.Pattern[str]"]
+]
+
+# 전체 문서 스캔 시 collection.get 페이지 크기
+DOCUMENT_PAGE_SIZE = 5000
+
+# 검색 컨텍스트가 공유 캐시로 보관하는 최대 문서 수 (초과 시 페이지 스트리밍)
+SEARCH_CONTEXT_MAX_DOCS = 2 * DOCUMENT_PAGE_SIZE
+
+# 키워드 사전 필터링 시 where_document $or 조건 최대 개수 (초과 시 전체 문서 스캔)
+MAX_WHERE_DOCUMENT_CLAUSES = 32
+
+# get_collection_info의 문서 수/샘플 메타데이터 키 캐시 유지 시간 (초)
+COLLECTION_INFO_TTL = 5.0
+
+# 최종 결과 구성 시 점수 통계를 NumPy로 계산하는 최소 결과 수
+NUMPY_STATS_MIN_RESULTS = 64
+
+# 키워드 검색용 SQLite FTS5 보조 인덱스 파일명 (vectorstore_path 하위, 벡터화 시 생성)
+FTS_DB_FILENAME = "fts.db"
+
+# FTS5 trigram 토크나이저가 부분 문자열로 찾을 수 있는 최소 키워드 길이
+FTS_MIN_KEYWORD_LENGTH = 3
+
+# 메타데이터 필드 연결 구분자 (str.split() 기준 공백이므로 검색어에 포함될 수 없음)
+_FIELD_SEP = "\x1f"
+
+
+# 쿼리 임베딩 캐시 크기 및 요청 병합 대기 시간
+EMBEDDING_CACHE_SIZE = 4096
+EMBEDDING_BATCH_WINDOW = 0.01
+EMBEDDING_MAX_BATCH = 64
+
+# 동일 검색 요청 (쿼리, 방법, 결과 수, 필터) 결과 캐시 크기와 유효 시간 (초)
+# (엔진 생성 이후 적재된 문서가 캐시된 쿼리에도 반영되도록 만료)
+RESULT_CACHE_SIZE = 256
+RESULT_CACHE_TTL = 30.0
+
+
+class _BatchedEmbedder:
+    """
+    짧은 시간 창 안에 들어온 임베딩 요청을 모아 한 번의 호출로 처리하는 클래스
+    동시 요청이 많을 때 임베딩 API 왕복 횟수를 줄입니다.
+    """
+
+    def __init__(
+        self,
+        embedding_function,
+        window: float = EMBEDDING_BATCH_WINDOW,
+        max_batch: int = EMBEDDING_MAX_BATCH,
+    ):
+        self.embedding_function = embedding_function
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: "queue.Queue[Optional[Tuple[str, Future]]]" = queue.Queue()
+        self._worker = threading.Thread(
+            target=self._run, name="search-embedder", daemon=True
+        )
+        self._worker.start()
+
+    def embed(self, text: str) -> List[float]:
+        """텍스트 하나의 임베딩 반환 (배치 처리 완료까지 대기)"""
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future.result()
+
+    def close(self):
+        """배치 처리 스레드 종료"""
+        self._queue.put(None)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._embed_batch(batch)
+                    return
+                batch.append(item)
+
+            self._embed_batch(batch)
+
+    def _embed_batch(self, batch: List[Tuple[str, Future]]):
+        try:
+            embeddings = self.embedding_function([text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), embedding in zip(batch, embeddings):
+            future.set_result(embedding)
+
+
+class _LocalEmbeddingFunction:
+    """
+    sentence-transformers 로컬 임베딩 함수
+
+    입력 목록을 한 번의 encode 호출로 배치 처리하며(길이순 정렬은 encode 내부에서 수행),
+    CUDA 사용 가능 시 FP16으로, CPU에서는 전체 코어를 사용해 FP32로 인코딩합니다.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        batch_size: int = 64,
+        normalize_embeddings: bool = False,
+    ):
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.model = SentenceTransformer(model_name, device=device)
+        if device == "cuda":
+            self.model.half()
+        else:
+            torch.set_num_threads(os.cpu_count() or 1)
+
+        self.batch_size = batch_size
+        self.normalize_embeddings = normalize_embeddings
+
+    def __call__(self, input: List[str]) -> List[np.ndarray]:
+        embeddings = self.model.encode(
+            list(input),
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=self.normalize_embeddings,
+            show_progress_bar=False,
+        )
+        return [embedding.astype(np.float32) for embedding in embeddings]
+
+
+def _iter_collection_pages(
+    collection, filters: Optional[Dict], where_document: Optional[Dict] = None
+):
+    """필터(및 본문 조건)에 해당하는 문서를 DOCUMENT_PAGE_SIZE 단위 페이지로 순차 조회"""
+    offset = 0
+    while True:
+        page = collection.get(
+            where=filters or {},
+            where_document=where_document,
+            include=["documents", "metadatas"],
+            limit=DOCUMENT_PAGE_SIZE,
+            offset=offset,
+        )
+        if not page or not page["ids"]:
+            return
+        yield page
+        if len(page["ids"]) < DOCUMENT_PAGE_SIZE:
+            return
+        offset += DOCUMENT_PAGE_SIZE
+
+
+def _iter_id_pages(collection, ids: List[str], filters: Optional[Dict]):
+    """지정한 문서 ID를 DOCUMENT_PAGE_SIZE 단위로 나누어 필터와 함께 조회"""
+    for start in range(0, len(ids), DOCUMENT_PAGE_SIZE):
+        page = collection.get(
+            ids=ids[start : start + DOCUMENT_PAGE_SIZE],
+            where=filters or {},
+            include=["documents", "metadatas"],
+        )
+        if page and page["ids"]:
+            yield page
+
+
+class _SearchContext:
+    """
+    단일 검색 호출 범위의 collection.get 결과 캐시
+
+    같은 필터로 전체 문서를 조회하는 하위 검색(키워드 전체 스캔, 메타데이터)이
+    ChromaDB 조회를 한 번만 수행하도록 공유합니다.
+    컬렉션 문서 수가 SEARCH_CONTEXT_MAX_DOCS를 넘으면 캐시하지 않고 페이지를
+    스트리밍해 메모리 사용량을 페이지 크기로 유지합니다.
+    """
+
+    def __init__(self, collection):
+        self._collection = collection
+        # 필터 결과는 전체 문서 수 이하이므로 전체 문서 수로 캐시 여부 결정
+        self._cacheable = collection.count() <= SEARCH_CONTEXT_MAX_DOCS
+        self._pages: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def iter_pages(self, filters: Optional[Dict]):
+        """
+        필터에 해당하는 전체 문서 페이지 순회
+
+        최초 조회는 잠금 안에서 수행하므로, 동시에 실행된 하위 검색은 진행 중인
+        조회가 끝날 때까지 기다렸다가 같은 결과를 재사용합니다.
+        """
+        if not self._cacheable:
+            return _iter_collection_pages(self._collection, filters)
+
+        cache_key = json.dumps(filters or {}, sort_keys=True, default=str)
+        with self._lock:
+            if cache_key not in self._pages:
+                self._pages[cache_key] = list(
+                    _iter_collection_pages(self._collection, filters)
+                )
+            return iter(self._pages[cache_key])
+
+
+# 관련성 특징 행렬 열 순서
+RELEVANCE_FEATURES = (
+    "exact_hits",
+    "partial_hits",
+    "domain_hits",
+    "filename_hits",
+    "content_length",
+    "is_recent",
+    "is_authority",
+)
+
+
+def _relevance_kernel(features: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """특징 행렬의 가중합, 본문 길이 품질 구간 및 1.0 상한을 적용한 관련성 점수"""
+    length = features[:, 4]
+    quality = np.where(
+        length > 2000, weights[4], np.where(length > 1000, weights[4] * 0.5, 0.0)
+    )
+    score = features[:, [0, 1, 2, 3, 5, 6]] @ weights[[0, 1, 2, 3, 5, 6]]
+    return np.minimum(score + quality, 1.0)
+
+
+@functools.lru_cache(maxsize=65536)
+def _intern_lower(text: str) -> str:
+    """
+    소문자로 변환한 문자열을 intern하여 반환
+
+    파일명 등 메타데이터 값은 같은 문서의 청크마다 반복되므로
+    한 번만 변환하고 동일한 문자열 객체를 재사용
+    """
+    return sys.intern(text.lower())
+
+
+def _compile_alternation(words) -> "re.Pattern[str]":
+    """단어 목록을 긴 단어 우선 alternation 정규식으로 컴파일"""
+    return re.compile(
+        "|".join(re.escape(w) for w in sorted(set(words), key=len, reverse=True))
+    )
+
+
+def _build_automaton(words) -> ahocorasick.Automaton:
+    """소문자 단어 → 원본 키워드 인덱스 목록을 값으로 갖는 오토마톤 생성"""
+    automaton = ahocorasick.Automaton()
+    for idx, word in enumerate(words):
+        word_lower = word.lower()
+        if not word_lower:
+            continue
+        if word_lower in automaton:
+            automaton.get(word_lower)[1].append(idx)
+        else:
+            automaton.add_word(word_lower, (word_lower, [idx]))
+    automaton.make_automaton()
+    return automaton
+
+
+class SearchMethod(str, Enum):
     """검색 방법 열거형"""
 
     VECTOR_ONLY = "vector_only"
@@ -32,6 +323,10 @@ class SearchMethod(Enum):
     ADAPTIVE = "adaptive"
 
 
+# 지원 검색 방법 값 목록 (통계 응답용)
+_SUPPORTED_METHODS = tuple(method.value for method in SearchMethod)
+
+
 class QueryComplexity(Enum):
     """쿼리 복잡도"""
 
@@ -68,7 +363,19 @@ class SearchConfig:
     complex_query_results: int = 80
 
 
-@dataclass
+# SearchResult.to_dict의 점수 필드 이름과 일괄 조회기
+_SCORE_KEYS = (
+    "vector_score",
+    "keyword_score",
+    "metadata_score",
+    "relevance_score",
+    "final_score",
+)
+_get_scores = operator.attrgetter(*_SCORE_KEYS)
+_get_relevance_score = operator.attrgetter("relevance_score")
+
+
+@dataclass(slots=True)
 class SearchResult:
     """검색 결과 클래스"""
 
@@ -82,6 +389,198 @@ class SearchResult:
     final_score: float = 0.0
     rank: int = 0
     distance: float = 0.0
+    # 키워드 검색 단계에서 계산한 소문자 본문 (관련성 계산 시 재사용)
+    content_lower: Optional[str] = field(default=None, repr=False, compare=False)
+
+    def get_content_lower(self) -> str:
+        """소문자 본문 반환 (최초 호출 시 한 번만 계산)"""
+        if self.content_lower is None:
+            self.content_lower = self.content.lower()
+        return self.content_lower
+
+    def content_preview(self, n: int = 200) -> str:
+        """본문 앞 n자 미리보기 (n자 이하면 복사 없이 원본 반환)"""
+        content = self.content
+        return content if len(content) <= n else content[:n]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """응답용 딕셔너리 변환"""
+        return {
+            "id": self.id,
+            "content": self.content,
+            "metadata": self.metadata,
+            "scores": dict(zip(_SCORE_KEYS, _get_scores(self))),
+            "rank": self.rank,
+            "distance": self.distance,
+        }
+
+
+def _search_result_default(obj: Any) -> Dict[str, Any]:
+    """orjson 직렬화 시 SearchResult를 응답 형식 딕셔너리로 변환"""
+    if isinstance(obj, SearchResult):
+        return obj.to_dict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+@dataclass(slots=True)
+class SearchResultBatch:
+    """
+    검색 결과 열(column) 저장소
+
+    점수 계산/정렬/선택 단계에서는 점수를 NumPy 배열로 다루고,
+    최종 선택된 문서만 SearchResult로 변환합니다.
+    """
+
+    ids: List[str]
+    contents: List[str]
+    contents_lower: List[Optional[str]]
+    metadatas: List[Dict[str, Any]]
+    vector: np.ndarray
+    keyword: np.ndarray
+    metadata_s: np.ndarray
+    relevance: np.ndarray
+    final: np.ndarray
+    distance: np.ndarray
+
+    @classmethod
+    def from_results(cls, results: List[SearchResult]) -> "SearchResultBatch":
+        """SearchResult 목록을 열 저장소로 변환"""
+        count = len(results)
+
+        def column(attr: str) -> np.ndarray:
+            return np.fromiter(
+                (getattr(r, attr) for r in results), dtype=np.float64, count=count
+            )
+
+        return cls(
+            ids=[r.id for r in results],
+            contents=[r.content for r in results],
+            contents_lower=[r.content_lower for r in results],
+            metadatas=[r.metadata for r in results],
+            vector=column("vector_score"),
+            keyword=column("keyword_score"),
+            metadata_s=column("metadata_score"),
+            relevance=column("relevance_score"),
+            final=column("final_score"),
+            distance=column("distance"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def take(self, order: np.ndarray) -> "SearchResultBatch":
+        """주어진 인덱스 순서대로 행을 선택한 새 배치 반환"""
+        indices = order.tolist()
+        return SearchResultBatch(
+            ids=[self.ids[i] for i in indices],
+            contents=[self.contents[i] for i in indices],
+            contents_lower=[self.contents_lower[i] for i in indices],
+            metadatas=[self.metadatas[i] for i in indices],
+            vector=self.vector[order],
+            keyword=self.keyword[order],
+            metadata_s=self.metadata_s[order],
+            relevance=self.relevance[order],
+            final=self.final[order],
+            distance=self.distance[order],
+        )
+
+    def to_results(self, indices: List[int]) -> List[SearchResult]:
+        """선택된 행을 순위가 매겨진 SearchResult 목록으로 변환"""
+        return [
+            SearchResult(
+                id=self.ids[i],
+                content=self.contents[i],
+                metadata=self.metadatas[i],
+                vector_score=float(self.vector[i]),
+                keyword_score=float(self.keyword[i]),
+                metadata_score=float(self.metadata_s[i]),
+                relevance_score=float(self.relevance[i]),
+                final_score=float(self.final[i]),
+                rank=rank,
+                distance=float(self.distance[i]),
+            )
+            for rank, i in enumerate(indices, 1)
+        ]
+
+
+# 쿼리 복잡도 판단 지표
+_COMPLEXITY_INDICATORS = {
+    QueryComplexity.HIGH: [
+        "거버넌스",
+        "자동화",
+        "종합",
+        "체계",
+        "프레임워크",
+        "로드맵",
+        "구현",
+        "설계",
+        "아키텍처",
+    ],
+    QueryComplexity.MEDIUM: [
+        "요구사항",
+        "규정",
+        "준수",
+        "보안",
+        "인증",
+        "가이드라인",
+        "분석",
+        "평가",
+    ],
+    QueryComplexity.LOW: [
+        "무엇",
+        "어떤",
+        "언제",
+        "어디서",
+        "누가",
+        "왜",
+        "어떻게",
+    ],
+}
+# 쿼리 타입 분류 키워드 (앞선 타입이 우선)
+_QUERY_TYPE_KEYWORDS = [
+    ("information_retrieval", ["무엇", "어떤", "어떻게", "what", "how"]),
+    ("compliance_check", ["규정", "준수", "인증", "compliance"]),
+    ("problem_solving", ["문제", "오류", "해결", "error", "problem"]),
+    ("comparison", ["비교", "차이", "구분", "compare", "difference"]),
+]
+
+# 관련성 점수 계산용 최신성/출처 신뢰도 패턴
+_RECENCY_RE = _compile_alternation(["2023", "2024", "2025"])
+_AUTHORITY_RE = _compile_alternation(
+    ["금융보안원", "금융위원회", "kisa", "한국인터넷진흥원"]
+)
+
+# 키워드 추출용 불용어 및 특수문자 패턴
+_STOP_WORDS = frozenset(
+    {
+        "이",
+        "그",
+        "저",
+        "것",
+        "수",
+        "등",
+        "및",
+        "또는",
+        "그리고",
+        "하는",
+        "있는",
+        "되는",
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "is",
+        "are",
+    }
+)
+_NON_WORD_RE = re.compile(r"[^\w\s]")
 
 
 class CloudRegiXSearchEngine:
@@ -90,6 +589,9 @@ class CloudRegiXSearchEngine:
     다른 서비스에서 독립적으로 사용 가능한 클래스
     """
 
+    # 오류 응답 템플릿 (빈 결과는 공유 가능한 불변 튜플)
+    _ERROR_TEMPLATE = {"query": None, "results": (), "error": None, "success": False}
+
     def __init__(
         self,
         vectorstore_path: str,
@@ -110,20 +612,86 @@ class CloudRegiXSearchEngine:
         self.collection_name = collection_name
         self.config = search_config or SearchConfig()
 
+        # 관련성 특징 가중치 (RELEVANCE_FEATURES 순서)
+        self._relevance_weights = np.array(
+            [
+                self.config.exact_match_weight,
+                self.config.partial_match_weight,
+                self.config.domain_keyword_weight,
+                self.config.metadata_match_weight,
+                self.config.content_quality_weight,
+                self.config.recency_weight,
+                self.config.authority_weight,
+            ],
+            dtype=np.float64,
+        )
+
         # 로깅 설정
         self.logger = self._setup_logger()
 
         # ChromaDB 클라이언트 초기화
         self._init_chroma_client()
 
+        # 키워드 검색용 FTS5 보조 인덱스 연결
+        self._init_fts_index()
+
         # 임베딩 함수 설정
         self._init_embedding_function(embedding_config)
 
+        # 쿼리 임베딩 LRU 캐시 및 요청 병합기
+        self._batched_embedder = (
+            _BatchedEmbedder(self.embedding_function)
+            if self.embedding_function
+            else None
+        )
+        self._embedding_cache: "OrderedDict[str, Tuple[float, ...]]" = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
+
+        # 검색 결과 LRU 캐시 (동일 요청 시 ChromaDB/임베딩 호출 생략)
+        self._result_cache: "OrderedDict[Tuple, Tuple[float, bytes]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+
         # 도메인 특화 키워드 사전
         self._init_domain_keywords()
 
-        # 성능 통계
-        self.stats = {"total_searches": 0, "avg_search_time": 0.0, "cache_hits": 0}
+        # 키워드 단어 경계 매칭 정규식 캐시 (정규식, 소문자 키워드별 개수 및 정규식)
+        self._keyword_pattern_cache: "OrderedDict[frozenset, _KeywordMatcher]" = (
+            OrderedDict()
+        )
+        self._keyword_pattern_lock = threading.Lock()
+
+        # 쿼리 복잡도별 검색 개수 및 검색 방법별 실행 함수 테이블
+        self._count_by_complexity = {
+            QueryComplexity.HIGH: self.config.complex_query_results,
+            QueryComplexity.MEDIUM: self.config.medium_query_results,
+            QueryComplexity.LOW: self.config.simple_query_results,
+        }
+        self._search_dispatch = {
+            SearchMethod.VECTOR_ONLY: self._vector_only_search,
+            SearchMethod.KEYWORD_ONLY: self._keyword_only_search,
+            SearchMethod.HYBRID: self._hybrid_search,
+            SearchMethod.MULTI_MODAL: self._multi_modal_search,
+        }
+
+        # 파일명별 (최신성, 출처 신뢰도) 태그 LRU 캐시 (재벡터화로 문서 ID가 바뀌어도 유효)
+        self._doc_tags: "OrderedDict[str, Tuple[bool, bool]]" = OrderedDict()
+        self._doc_tags_lock = threading.Lock()
+
+        # 벡터/키워드/메타데이터 하위 검색 병렬 실행용 스레드 풀
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="search")
+
+        # 컬렉션 정보 TTL 캐시 (갱신 시각, 문서 수, 샘플 메타데이터 키)
+        self._collection_info_cache: Optional[Tuple[float, int, List[str]]] = None
+
+        # 성능 통계 (cache_hits: 쿼리 임베딩 캐시, result_cache_hits: 검색 결과 캐시)
+        # search_async는 실행기 스레드에서 검색하므로 잠금으로 갱신
+        self.stats = {
+            "total_searches": 0,
+            "avg_search_time": 0.0,
+            "cache_hits": 0,
+            "result_cache_hits": 0,
+        }
+        self._stats_lock = threading.Lock()
 
         self.logger.info(f"CloudRegiX 검색 엔진 초기화 완료: {collection_name}")
 
@@ -156,6 +724,60 @@ class CloudRegiXSearchEngine:
             self.logger.error(f"ChromaDB 클라이언트 초기화 실패: {e}")
             raise
 
+    def _init_fts_index(self):
+        """
+        FTS5 보조 인덱스 연결
+
+        키워드 점수는 부분 문자열 일치(한글 복합어 속 키워드 포함)도 반영하므로
+        trigram 토크나이저 인덱스만 사용합니다. 인덱스가 없거나 trigram이 아니거나
+        색인된 문서 수가 컬렉션 문서 수와 다르면(이전 적재분 또는 다른 경로로 저장된
+        문서 누락) ChromaDB 스캔을 사용합니다.
+        """
+        self._fts_conn: Optional[sqlite3.Connection] = None
+        self._fts_indexed_count = 0
+        self._fts_lock = threading.Lock()
+
+        fts_path = Path(self.vectorstore_path, FTS_DB_FILENAME).resolve()
+        if not fts_path.exists():
+            return
+
+        try:
+            conn = sqlite3.connect(
+                f"{fts_path.as_uri()}?mode=ro", uri=True, check_same_thread=False
+            )
+            (schema,) = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'docs'"
+            ).fetchone()
+            (indexed_count,) = conn.execute(
+                "SELECT count(*) FROM docs WHERE collection = ?",
+                (self.collection_name,),
+            ).fetchone()
+        except (sqlite3.Error, TypeError) as e:
+            self.logger.warning(f"FTS5 인덱스 연결 실패, ChromaDB 스캔 사용: {e}")
+            return
+
+        if "trigram" not in schema.lower():
+            self.logger.warning(
+                "FTS5 인덱스가 부분 문자열 검색(trigram)을 지원하지 않아 ChromaDB 스캔을 "
+                "사용합니다. 재벡터화하면 trigram 인덱스로 다시 생성됩니다."
+            )
+            conn.close()
+            return
+
+        collection_count = self.collection.count()
+        if indexed_count == 0 or indexed_count != collection_count:
+            if indexed_count:
+                self.logger.warning(
+                    f"FTS5 인덱스 문서 수({indexed_count:,})가 컬렉션 문서 수"
+                    f"({collection_count:,})와 달라 ChromaDB 스캔을 사용합니다."
+                )
+            conn.close()
+            return
+
+        self._fts_indexed_count = indexed_count
+        self._fts_conn = conn
+        self.logger.info(f"FTS5 키워드 인덱스 연결 완료: {fts_path}")
+
     def _init_embedding_function(self, embedding_config: Optional[Dict]):
         """임베딩 함수 초기화"""
         if embedding_config:
@@ -183,14 +805,14 @@ class CloudRegiXSearchEngine:
                     api_key=embedding_config["api_key"],
                     model_name=embedding_config.get("model", "text-embedding-3-small"),
                 )
-            # 로컬 모델 설정
+            # 로컬 모델 설정 (배치 인코딩, GPU 사용 시 FP16)
             elif embedding_config.get("provider") == "local":
-                from chromadb.utils.embedding_functions import (
-                    SentenceTransformerEmbeddingFunction,
-                )
-
-                self.embedding_function = SentenceTransformerEmbeddingFunction(
-                    model_name=embedding_config.get("model", "all-MiniLM-L6-v2")
+                self.embedding_function = _LocalEmbeddingFunction(
+                    model_name=embedding_config.get("model", "all-MiniLM-L6-v2"),
+                    batch_size=embedding_config.get("batch_size", 64),
+                    normalize_embeddings=embedding_config.get(
+                        "normalize_embeddings", False
+                    ),
                 )
         else:
             # 기본값: 컬렉션의 기존 임베딩 함수 사용
@@ -259,14 +881,47 @@ class CloudRegiXSearchEngine:
             "ISMS": ["정보보호관리체계", "정보보안관리체계", "보안인증"],
         }
 
+        # 도메인별 키워드 매칭 정규식 (한 번의 스캔으로 도메인 포함 여부 판단)
+        self._domain_re = {
+            domain: _compile_alternation(keywords)
+            for domain, keywords in self.domain_keywords.items()
+        }
+
+        # 쿼리 분석용 오토마톤: 복잡도 지표, 도메인, 쿼리 타입 키워드를 태그와 함께 등록
+        analyzer_tags: Dict[str, List[Tuple[str, Any]]] = {}
+        for complexity, indicators in _COMPLEXITY_INDICATORS.items():
+            for indicator in indicators:
+                analyzer_tags.setdefault(indicator, []).append(
+                    ("complexity", complexity)
+                )
+        for domain, keywords in self.domain_keywords.items():
+            for keyword in keywords:
+                analyzer_tags.setdefault(keyword, []).append(("domain", domain))
+        for query_type, keywords in _QUERY_TYPE_KEYWORDS:
+            for keyword in keywords:
+                analyzer_tags.setdefault(keyword, []).append(("query_type", query_type))
+
+        self._analyzer_ac = ahocorasick.Automaton()
+        for word, tags in analyzer_tags.items():
+            self._analyzer_ac.add_word(word, (word, tags))
+        self._analyzer_ac.make_automaton()
+
+        # 통계 조회용 사전 크기 (사전이 바뀌면 이 메서드에서 함께 갱신)
+        self._domain_keywords_count = sum(
+            len(keywords) for keywords in self.domain_keywords.values()
+        )
+        self._synonyms_count = len(self.synonyms)
+
     def search(
         self,
         query: str,
         method: SearchMethod = SearchMethod.ADAPTIVE,
         max_results: Optional[int] = None,
         filters: Optional[Dict] = None,
+        as_json_bytes: bool = False,
+        _raw: bool = False,
         **kwargs,
-    ) -> Dict[str, Any]:
+    ) -> Union[Dict[str, Any], bytes, List[SearchResult]]:
         """
         통합 검색 실행
 
@@ -275,14 +930,29 @@ class CloudRegiXSearchEngine:
             method: 검색 방법
             max_results: 최대 결과 수
             filters: 메타데이터 필터
+            as_json_bytes: True면 결과 딕셔너리 대신 orjson 직렬화된 JSON bytes 반환
+            _raw: True면 응답 구성 없이 선택된 SearchResult 목록 반환 (내부 재정렬 단계용)
             **kwargs: 추가 파라미터
 
         Returns:
-            검색 결과 딕셔너리
+            검색 결과 딕셔너리 (as_json_bytes=True면 JSON bytes, _raw=True면 SearchResult 목록)
         """
         start_time = time.time()
 
         try:
+            method = SearchMethod(method)
+            cache_key = (
+                query,
+                method.value,
+                max_results,
+                json.dumps(filters, sort_keys=True, default=str) if filters else None,
+            )
+            if not _raw:
+                cached = self._get_cached_result(cache_key, as_json_bytes)
+                if cached is not None:
+                    self._update_stats(time.time() - start_time)
+                    return cached
+
             self.logger.info(f"검색 시작: '{query}' (방법: {method.value})")
 
             # 1. 쿼리 분석
@@ -297,16 +967,8 @@ class CloudRegiXSearchEngine:
                 method = self._select_optimal_method(query_analysis)
 
             # 4. 검색 실행
-            if method == SearchMethod.VECTOR_ONLY:
-                raw_results = self._vector_search(query, max_results, filters)
-            elif method == SearchMethod.KEYWORD_ONLY:
-                raw_results = self._keyword_search(query, max_results, filters)
-            elif method == SearchMethod.HYBRID:
-                raw_results = self._hybrid_search(query, max_results, filters)
-            elif method == SearchMethod.MULTI_MODAL:
-                raw_results = self._multi_modal_search(query, max_results, filters)
-            else:
-                raw_results = self._hybrid_search(query, max_results, filters)
+            search_fn = self._search_dispatch.get(method, self._hybrid_search)
+            raw_results = search_fn(query, max_results, filters)
 
             # 5. 관련성 점수 재계산 및 문서 선택
             enhanced_results = self._enhance_relevance_scores(query, raw_results)
@@ -314,69 +976,62 @@ class CloudRegiXSearchEngine:
                 enhanced_results, query_analysis
             )
 
-            # 6. 최종 결과 구성
+            # 6. 통계 업데이트
             execution_time = time.time() - start_time
-            result = self._compose_final_result(
-                query, method, selected_results, query_analysis, execution_time
-            )
-
-            # 7. 통계 업데이트
             self._update_stats(execution_time)
 
             self.logger.info(
                 f"검색 완료: {len(selected_results)}개 결과 ({execution_time:.3f}초)"
             )
 
+            if _raw:
+                return selected_results
+
+            # 7. 최종 응답 구성 및 결과 캐시 저장
+            result = self._build_public_response(
+                query,
+                method,
+                selected_results,
+                query_analysis,
+                execution_time,
+                as_json_bytes=as_json_bytes,
+            )
+            self._store_result(cache_key, result)
+
             return result
 
         except Exception as e:
             self.logger.error(f"검색 중 오류 발생: {e}")
-            return self._error_result(query, str(e))
+            if _raw:
+                return []
+            error = self._error_result(query, str(e))
+            return orjson.dumps(error) if as_json_bytes else error
 
     def _analyze_query(self, query: str) -> Dict[str, Any]:
         """쿼리 분석"""
         query_lower = query.lower()
 
-        # 복잡도 평가
-        complexity_indicators = {
-            QueryComplexity.HIGH: [
-                "거버넌스",
-                "자동화",
-                "종합",
-                "체계",
-                "프레임워크",
-                "로드맵",
-                "구현",
-                "설계",
-                "아키텍처",
-            ],
-            QueryComplexity.MEDIUM: [
-                "요구사항",
-                "규정",
-                "준수",
-                "보안",
-                "인증",
-                "가이드라인",
-                "분석",
-                "평가",
-            ],
-            QueryComplexity.LOW: [
-                "무엇",
-                "어떤",
-                "언제",
-                "어디서",
-                "누가",
-                "왜",
-                "어떻게",
-            ],
+        # 오토마톤 한 번의 순회로 일치한 복잡도 지표, 도메인, 쿼리 타입 수집
+        matched_words = set()
+        complexity_words: Dict[QueryComplexity, set] = {
+            complexity: set() for complexity in QueryComplexity
         }
+        matched_tags = {"domain": set(), "query_type": set()}
+        for _, (word, tags) in self._analyzer_ac.iter(query_lower):
+            if word in matched_words:
+                continue
+            matched_words.add(word)
+            for tag_type, tag in tags:
+                if tag_type == "complexity":
+                    complexity_words[tag].add(word)
+                else:
+                    matched_tags[tag_type].add(tag)
+        matched_domains = matched_tags["domain"]
 
-        complexity_scores = {complexity: 0 for complexity in QueryComplexity}
-
-        for complexity, indicators in complexity_indicators.items():
-            for indicator in indicators:
-                if indicator in query_lower:
-                    complexity_scores[complexity] += 1
+        # 복잡도 평가 (그룹별로 일치한 지표 수)
+        complexity_scores = {
+            complexity: len(words) for complexity, words in complexity_words.items()
+        }
 
         # 가장 높은 점수의 복잡도
         max_score = max(complexity_scores.values())
@@ -388,12 +1043,12 @@ class CloudRegiXSearchEngine:
                     complexity = comp
                     break
 
-        # 도메인 키워드 분석
-        domain_matches = {}
-        for domain, keywords in self.domain_keywords.items():
-            matches = [kw for kw in keywords if kw in query_lower]
-            if matches:
-                domain_matches[domain] = matches
+        # 도메인 키워드 분석 (키워드 사전 순서 유지)
+        domain_matches = {
+            domain: [kw for kw in keywords if kw in matched_words]
+            for domain, keywords in self.domain_keywords.items()
+            if domain in matched_domains
+        }
 
         return {
             "complexity": complexity,
@@ -401,41 +1056,21 @@ class CloudRegiXSearchEngine:
             "char_count": len(query),
             "domain_matches": domain_matches,
             "has_technical_terms": len(domain_matches) > 0,
-            "query_type": self._classify_query_type(query),
+            "query_type": self._classify_query_type(matched_tags["query_type"]),
         }
 
-    def _classify_query_type(self, query: str) -> str:
-        """쿼리 타입 분류"""
-        query_lower = query.lower()
-
-        if any(
-            word in query_lower for word in ["무엇", "어떤", "어떻게", "what", "how"]
-        ):
-            return "information_retrieval"
-        elif any(
-            word in query_lower for word in ["규정", "준수", "인증", "compliance"]
-        ):
-            return "compliance_check"
-        elif any(
-            word in query_lower for word in ["문제", "오류", "해결", "error", "problem"]
-        ):
-            return "problem_solving"
-        elif any(
-            word in query_lower
-            for word in ["비교", "차이", "구분", "compare", "difference"]
-        ):
-            return "comparison"
-        else:
-            return "general"
+    def _classify_query_type(self, matched_types: set) -> str:
+        """쿼리 타입 분류 (쿼리에서 발견된 타입 중 우선순위가 가장 높은 타입)"""
+        for query_type, _ in _QUERY_TYPE_KEYWORDS:
+            if query_type in matched_types:
+                return query_type
+        return "general"
 
     def _determine_search_count(self, complexity: QueryComplexity) -> int:
         """쿼리 복잡도에 따른 검색 개수 결정"""
-        if complexity == QueryComplexity.HIGH:
-            return self.config.complex_query_results
-        elif complexity == QueryComplexity.MEDIUM:
-            return self.config.medium_query_results
-        else:
-            return self.config.simple_query_results
+        return self._count_by_complexity.get(
+            complexity, self.config.simple_query_results
+        )
 
     def _select_optimal_method(self, query_analysis: Dict) -> SearchMethod:
         """최적 검색 방법 선택"""
@@ -448,14 +1083,30 @@ class CloudRegiXSearchEngine:
         else:
             return SearchMethod.HYBRID
 
+    def _vector_only_search(
+        self, query: str, max_results: int, filters: Optional[Dict]
+    ) -> SearchResultBatch:
+        """벡터 단독 검색"""
+        return SearchResultBatch.from_results(
+            self._vector_search(query, max_results, filters)
+        )
+
+    def _keyword_only_search(
+        self, query: str, max_results: int, filters: Optional[Dict]
+    ) -> SearchResultBatch:
+        """키워드 단독 검색"""
+        return SearchResultBatch.from_results(
+            self._keyword_search(query, max_results, filters)
+        )
+
     def _vector_search(
         self, query: str, max_results: int, filters: Optional[Dict]
     ) -> List[SearchResult]:
         """벡터 검색"""
         try:
             if self.embedding_function:
-                # 쿼리 임베딩 생성
-                query_embedding = self.embedding_function([query])
+                # 쿼리 임베딩 생성 (캐시 우선)
+                query_embedding = [list(self._get_query_embedding(query))]
                 query_results = self.collection.query(
                     query_embeddings=query_embedding,
                     n_results=max_results,
@@ -493,150 +1144,425 @@ class CloudRegiXSearchEngine:
             self.logger.error(f"벡터 검색 오류: {e}")
             return []
 
-    def _keyword_search(
-        self, query: str, max_results: int, filters: Optional[Dict]
-    ) -> List[SearchResult]:
-        """키워드 검색"""
+    def _get_query_embedding(self, query: str) -> Tuple[float, ...]:
+        """쿼리 임베딩 반환 (LRU 캐시 우선, 없으면 배치 임베딩 후 저장)"""
+        with self._embedding_cache_lock:
+            embedding = self._embedding_cache.get(query)
+            if embedding is not None:
+                self._embedding_cache.move_to_end(query)
+                with self._stats_lock:
+                    self.stats["cache_hits"] += 1
+                return embedding
+
+        embedding = tuple(np.asarray(self._batched_embedder.embed(query)).tolist())
+        self._store_query_embedding(query, embedding)
+        return embedding
+
+    def _store_query_embedding(self, query: str, embedding: Tuple[float, ...]):
+        """쿼리 임베딩을 LRU 캐시에 저장"""
+        with self._embedding_cache_lock:
+            self._embedding_cache[query] = embedding
+            self._embedding_cache.move_to_end(query)
+            if len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+
+    def invalidate_embedding_cache(self):
+        """쿼리 임베딩 캐시 초기화 (임베딩 모델 변경 시 호출)"""
+        with self._embedding_cache_lock:
+            self._embedding_cache.clear()
+
+    def _get_cached_result(
+        self, cache_key: Tuple, as_json_bytes: bool
+    ) -> Union[Dict[str, Any], bytes, None]:
+        """
+        결과 캐시 조회 (만료된 항목은 제거)
+
+        캐시는 JSON bytes로 보관하므로 딕셔너리 요청에는 매번 새 객체를 만들어 반환합니다.
+        """
+        with self._result_cache_lock:
+            entry = self._result_cache.get(cache_key)
+            if entry is None:
+                return None
+            stored_at, payload = entry
+            if time.monotonic() - stored_at > RESULT_CACHE_TTL:
+                del self._result_cache[cache_key]
+                return None
+            self._result_cache.move_to_end(cache_key)
+        with self._stats_lock:
+            self.stats["result_cache_hits"] += 1
+
+        return payload if as_json_bytes else orjson.loads(payload)
+
+    def _store_result(self, cache_key: Tuple, result: Union[Dict[str, Any], bytes]):
+        """성공한 검색 결과를 JSON bytes 형태로 LRU 캐시에 저장"""
         try:
-            # 모든 문서 가져오기
-            all_results = self.collection.get(
-                where=filters or {}, include=["documents", "metadatas"]
+            payload = (
+                result
+                if isinstance(result, bytes)
+                else orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY)
             )
+        except TypeError as e:
+            self.logger.warning(f"검색 결과 캐시 저장 생략 (직렬화 불가): {e}")
+            return
+        with self._result_cache_lock:
+            self._result_cache[cache_key] = (time.monotonic(), payload)
+            self._result_cache.move_to_end(cache_key)
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+    def invalidate_result_cache(self):
+        """검색 결과 캐시 초기화 (컬렉션 갱신 시 호출)"""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+
+    def search_batch(
+        self,
+        queries: List[str],
+        method: SearchMethod = SearchMethod.ADAPTIVE,
+        max_results: Optional[int] = None,
+        filters: Optional[Dict] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 쿼리 일괄 검색
 
-            if not all_results or not all_results["documents"]:
-                return []
+        캐시에 없는 쿼리 임베딩을 한 번의 임베딩 호출로 생성한 뒤
+        각 쿼리를 검색합니다.
+
+        Args:
+            queries: 검색 쿼리 목록
+            method: 검색 방법
+            max_results: 최대 결과 수
+            filters: 메타데이터 필터
+
+        Returns:
+            쿼리 순서와 동일한 검색 결과 딕셔너리 목록
+        """
+        if self.embedding_function:
+            with self._embedding_cache_lock:
+                missing = [
+                    q for q in dict.fromkeys(queries) if q not in self._embedding_cache
+                ]
+            if missing:
+                try:
+                    embeddings = self.embedding_function(missing)
+                    for query, embedding in zip(missing, embeddings):
+                        self._store_query_embedding(
+                            query, tuple(np.asarray(embedding).tolist())
+                        )
+                except Exception as e:
+                    self.logger.error(f"일괄 임베딩 생성 오류: {e}")
+
+        return [
+            self.search(query, method=method, max_results=max_results, filters=filters)
+            for query in queries
+        ]
+
+    async def search_async(
+        self,
+        query: str,
+        method: SearchMethod = SearchMethod.ADAPTIVE,
+        max_results: Optional[int] = None,
+        filters: Optional[Dict] = None,
+        as_json_bytes: bool = False,
+    ) -> Union[Dict[str, Any], bytes]:
+        """
+        비동기 검색 실행
+
+        이벤트 루프를 막지 않도록 search를 기본 실행기 스레드에서 수행합니다.
+        동시에 들어온 요청의 쿼리 임베딩은 _BatchedEmbedder가 대기 시간 내에서
+        한 번의 임베딩 호출로 병합합니다.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.search,
+                query,
+                method=method,
+                max_results=max_results,
+                filters=filters,
+                as_json_bytes=as_json_bytes,
+            ),
+        )
+
+    def _iter_document_pages(
+        self, filters: Optional[Dict], context: Optional[_SearchContext]
+    ):
+        """
+        필터에 해당하는 전체 문서를 페이지 단위로 조회
 
+        검색 컨텍스트가 있으면 상한 이내의 공유 캐시를 사용하고,
+        없으면 페이지를 하나씩 가져와 메모리 사용량을 페이지 크기로 제한
+        """
+        if context is not None:
+            return context.iter_pages(filters)
+        return _iter_collection_pages(self.collection, filters)
+
+    def _keyword_search(
+        self,
+        query: str,
+        max_results: int,
+        filters: Optional[Dict],
+        context: Optional[_SearchContext] = None,
+    ) -> List[SearchResult]:
+        """키워드 검색"""
+        try:
             # 키워드 추출 및 확장
             keywords = self._extract_keywords(query)
             expanded_keywords = self._expand_keywords(keywords)
+            if not expanded_keywords:
+                return []
+            keyword_matcher = self._get_keyword_pattern(expanded_keywords)
 
-            # 키워드 매칭 점수 계산
+            # 키워드가 포함될 수 있는 문서를 모두 채점하고 페이지마다
+            # 상위 max_results개만 유지 (전체 정렬 없이 O(N log K))
             scored_results = []
-            for i, (doc_id, document, metadata) in enumerate(
-                zip(
-                    all_results["ids"],
-                    all_results["documents"],
-                    all_results["metadatas"],
-                )
+            for page in self._keyword_candidate_pages(
+                expanded_keywords, filters, context
             ):
-                keyword_score = self._calculate_keyword_score(
-                    document, expanded_keywords
+                scored_results = heapq.nlargest(
+                    max_results,
+                    itertools.chain(
+                        scored_results,
+                        self._score_keyword_candidates(
+                            page, expanded_keywords, keyword_matcher
+                        ),
+                    ),
+                    key=operator.attrgetter("keyword_score"),
                 )
+            return scored_results
 
-                if keyword_score > 0:
-                    result = SearchResult(
-                        id=doc_id,
-                        content=document,
-                        metadata=metadata,
-                        keyword_score=keyword_score,
-                        rank=i + 1,
-                    )
-                    scored_results.append(result)
+        except Exception as e:
+            self.logger.error(f"키워드 검색 오류: {e}")
+            return []
 
-            # 키워드 점수로 정렬
-            scored_results.sort(key=lambda x: x.keyword_score, reverse=True)
+    def _fts_keyword_ids(self, keywords: List[str]) -> Optional[List[str]]:
+        """
+        FTS5 trigram 인덱스에서 키워드를 부분 문자열로 포함하는 문서 ID 전체 조회
 
-            return scored_results[:max_results]
+        trigram은 FTS_MIN_KEYWORD_LENGTH 글자 이상의 검색어만 부분 문자열로 찾을 수
+        있으므로, 더 짧은 키워드가 있거나 인덱스 연결 이후 컬렉션에 문서가 추가되어
+        일치 문서를 빠짐없이 찾을 수 없으면 None 반환
+        """
+        if self._fts_conn is None or any(
+            len(keyword) < FTS_MIN_KEYWORD_LENGTH for keyword in keywords
+        ):
+            return None
+        if self.collection.count() != self._fts_indexed_count:
+            return None
 
-        except Exception as e:
-            self.logger.error(f"키워드 검색 오류: {e}")
+        # 키워드별 부분 문자열 일치 구문을 OR로 결합 (trigram은 대소문자 구분 없음)
+        match_expr = " OR ".join(
+            '"{}"'.format(keyword.replace('"', '""')) for keyword in keywords
+        )
+        try:
+            with self._fts_lock:
+                rows = self._fts_conn.execute(
+                    "SELECT id FROM docs WHERE docs MATCH ? AND collection = ?",
+                    (match_expr, self.collection_name),
+                ).fetchall()
+        except sqlite3.Error as e:
+            self.logger.warning(f"FTS5 키워드 검색 실패, ChromaDB 스캔 사용: {e}")
+            return None
+        return [row[0] for row in rows]
+
+    def _keyword_candidate_pages(
+        self,
+        keywords: List[str],
+        filters: Optional[Dict],
+        context: Optional[_SearchContext],
+    ):
+        """
+        키워드가 포함될 수 있는 문서를 페이지 단위로 조회
+
+        FTS5 trigram 인덱스나 where_document 사전 필터로 일치 문서를 빠짐없이
+        가져올 수 있으면 해당 문서만, 그렇지 않으면 전체 문서를 조회합니다.
+        """
+        fts_ids = self._fts_keyword_ids(keywords)
+        if fts_ids is not None:
+            return _iter_id_pages(self.collection, fts_ids, filters)
+
+        where_document = self._keyword_where_document(keywords)
+        if where_document is None:
+            return self._iter_document_pages(filters, context)
+        return _iter_collection_pages(self.collection, filters, where_document)
+
+    def _keyword_where_document(self, keywords: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        키워드 포함 여부 where_document 조건 생성
+
+        $contains는 대소문자를 구분하므로 한글/숫자처럼 대소문자가 없는 키워드로만
+        구성된 경우에만 조건을 만들고, 그 외이거나 조건 수가
+        MAX_WHERE_DOCUMENT_CLAUSES를 넘으면 None 반환
+        """
+        variants = sorted({keyword.lower() for keyword in keywords})
+        if len(variants) > MAX_WHERE_DOCUMENT_CLAUSES or any(
+            variant != variant.upper() for variant in variants
+        ):
+            return None
+        clauses = [{"$contains": variant} for variant in variants]
+        return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+    def _score_keyword_candidates(
+        self,
+        candidates: Optional[Dict[str, Any]],
+        keywords: List[str],
+        keyword_matcher: _KeywordMatcher,
+    ) -> List[SearchResult]:
+        """후보 문서 키워드 매칭 점수 계산 (문서당 1회 순회)"""
+        if not candidates or not candidates["documents"]:
             return []
 
+        scored_results = []
+        for i, (doc_id, document, metadata) in enumerate(
+            zip(
+                candidates["ids"],
+                candidates["documents"],
+                candidates["metadatas"],
+            )
+        ):
+            doc_lower = document.lower() if document else ""
+            keyword_score = self._calculate_keyword_score(
+                doc_lower, keywords, keyword_matcher
+            )
+
+            if keyword_score > 0:
+                result = SearchResult(
+                    id=doc_id,
+                    content=document,
+                    metadata=metadata,
+                    keyword_score=keyword_score,
+                    rank=i + 1,
+                    content_lower=doc_lower,
+                )
+                scored_results.append(result)
+
+        return scored_results
+
     def _hybrid_search(
         self, query: str, max_results: int, filters: Optional[Dict]
-    ) -> List[SearchResult]:
+    ) -> SearchResultBatch:
         """하이브리드 검색 (벡터 + 키워드)"""
-        # 벡터 검색
-        vector_results = self._vector_search(query, max_results * 2, filters)
-
-        # 키워드 검색
-        keyword_results = self._keyword_search(query, max_results * 2, filters)
+        # 벡터 검색과 키워드 검색을 병렬 실행
+        vector_future = self._executor.submit(
+            self._vector_search, query, max_results * 2, filters
+        )
+        keyword_future = self._executor.submit(
+            self._keyword_search, query, max_results * 2, filters
+        )
+        vector_results = vector_future.result()
+        keyword_results = keyword_future.result()
 
         # 결과 병합
-        combined_results = self._merge_search_results(vector_results, keyword_results)
+        batch = SearchResultBatch.from_results(
+            self._merge_search_results(vector_results, keyword_results)
+        )
 
-        # 하이브리드 점수 계산
-        for result in combined_results:
-            result.final_score = (
-                result.vector_score * self.config.vector_weight
-                + result.keyword_score * self.config.keyword_weight
-            )
+        # 하이브리드 점수 계산 (점수 배열 단위 연산)
+        batch.final = (
+            batch.vector * self.config.vector_weight
+            + batch.keyword * self.config.keyword_weight
+        )
 
         # 최종 점수로 정렬
-        combined_results.sort(key=lambda x: x.final_score, reverse=True)
-
-        return combined_results[:max_results]
+        return self._take_top(batch, max_results)
 
     def _multi_modal_search(
         self, query: str, max_results: int, filters: Optional[Dict]
-    ) -> List[SearchResult]:
+    ) -> SearchResultBatch:
         """멀티모달 검색 (벡터 + 키워드 + 메타데이터)"""
-        # 각각의 검색 실행
-        vector_results = self._vector_search(query, max_results * 2, filters)
-        keyword_results = self._keyword_search(query, max_results * 2, filters)
-        metadata_results = self._metadata_search(query, max_results, filters)
+        # 각각의 검색을 병렬 실행 (전체 문서 조회는 컨텍스트로 공유)
+        context = _SearchContext(self.collection)
+        vector_future = self._executor.submit(
+            self._vector_search, query, max_results * 2, filters
+        )
+        keyword_future = self._executor.submit(
+            self._keyword_search, query, max_results * 2, filters, context
+        )
+        metadata_future = self._executor.submit(
+            self._metadata_search, query, max_results, filters, context
+        )
+        vector_results = vector_future.result()
+        keyword_results = keyword_future.result()
+        metadata_results = metadata_future.result()
 
         # 결과 병합
-        all_results = self._merge_multi_modal_results(
-            vector_results, keyword_results, metadata_results
+        batch = SearchResultBatch.from_results(
+            self._merge_multi_modal_results(
+                vector_results, keyword_results, metadata_results
+            )
         )
 
-        # 멀티모달 점수 계산
-        for result in all_results:
-            result.final_score = (
-                result.vector_score * self.config.vector_weight
-                + result.keyword_score * self.config.keyword_weight
-                + result.metadata_score * self.config.metadata_weight
-            )
+        # 멀티모달 점수 계산 (점수 배열 단위 연산)
+        batch.final = (
+            batch.vector * self.config.vector_weight
+            + batch.keyword * self.config.keyword_weight
+            + batch.metadata_s * self.config.metadata_weight
+        )
 
         # 정규화
-        if all_results:
-            max_score = max(r.final_score for r in all_results)
+        if len(batch):
+            max_score = batch.final.max()
             if max_score > 0:
-                for result in all_results:
-                    result.final_score = result.final_score / max_score
+                batch.final /= max_score
 
         # 최종 점수로 정렬
-        all_results.sort(key=lambda x: x.final_score, reverse=True)
-
-        return all_results[:max_results]
+        return self._take_top(batch, max_results)
+
+    def _take_top(
+        self, batch: SearchResultBatch, max_results: int
+    ) -> SearchResultBatch:
+        """최종 점수 내림차순 상위 결과 반환 (동점 시 기존 순서 유지)"""
+        scores = batch.final
+        if max_results < len(scores):
+            # 상위 K개 후보만 분할 선택한 뒤 그 구간만 정렬
+            candidates = np.argpartition(-scores, max_results - 1)[:max_results]
+            candidates.sort()
+            order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        else:
+            order = np.argsort(-scores, kind="stable")
+        return batch.take(order)
 
     def _metadata_search(
-        self, query: str, max_results: int, filters: Optional[Dict]
+        self,
+        query: str,
+        max_results: int,
+        filters: Optional[Dict],
+        context: Optional[_SearchContext] = None,
     ) -> List[SearchResult]:
         """메타데이터 검색"""
         try:
-            all_results = self.collection.get(
-                where=filters or {}, include=["documents", "metadatas"]
-            )
-
-            if not all_results or not all_results["documents"]:
+            query_terms = set(query.lower().split())
+            if not query_terms:
                 return []
-
-            scored_results = []
-            query_lower = query.lower()
-
-            for i, (doc_id, document, metadata) in enumerate(
-                zip(
-                    all_results["ids"],
-                    all_results["documents"],
-                    all_results["metadatas"],
+            automaton = _build_automaton(sorted(query_terms))
+
+            scored_results: List[SearchResult] = []
+            for page in self._iter_document_pages(filters, context):
+                page_results = []
+                for i, (doc_id, document, metadata) in enumerate(
+                    zip(page["ids"], page["documents"], page["metadatas"])
+                ):
+                    metadata_score = self._calculate_metadata_score(automaton, metadata)
+
+                    if metadata_score > 0:
+                        result = SearchResult(
+                            id=doc_id,
+                            content=document,
+                            metadata=metadata,
+                            metadata_score=metadata_score,
+                            rank=i + 1,
+                        )
+                        page_results.append(result)
+
+                # 페이지마다 상위 max_results개만 유지
+                scored_results = heapq.nlargest(
+                    max_results,
+                    itertools.chain(scored_results, page_results),
+                    key=operator.attrgetter("metadata_score"),
                 )
-            ):
-                metadata_score = self._calculate_metadata_score(query_lower, metadata)
-
-                if metadata_score > 0:
-                    result = SearchResult(
-                        id=doc_id,
-                        content=document,
-                        metadata=metadata,
-                        metadata_score=metadata_score,
-                        rank=i + 1,
-                    )
-                    scored_results.append(result)
 
-            scored_results.sort(key=lambda x: x.metadata_score, reverse=True)
-            return scored_results[:max_results]
+            return scored_results
 
         except Exception as e:
             self.logger.error(f"메타데이터 검색 오류: {e}")
@@ -644,41 +1570,14 @@ class CloudRegiXSearchEngine:
 
     def _extract_keywords(self, query: str) -> List[str]:
         """키워드 추출"""
-        # 불용어 제거
-        stop_words = {
-            "이",
-            "그",
-            "저",
-            "것",
-            "수",
-            "등",
-            "및",
-            "또는",
-            "그리고",
-            "하는",
-            "있는",
-            "되는",
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "is",
-            "are",
-        }
-
         # 특수문자 제거 및 단어 분리
-        cleaned_query = re.sub(r"[^\w\s]", " ", query)
+        cleaned_query = _NON_WORD_RE.sub(" ", query)
         words = cleaned_query.split()
 
-        # 키워드 필터링
-        keywords = [word for word in words if len(word) >= 2 and word not in stop_words]
+        # 키워드 필터링 (불용어 제거)
+        keywords = [
+            word for word in words if len(word) >= 2 and word not in _STOP_WORDS
+        ]
 
         return keywords
 
@@ -693,86 +1592,114 @@ class CloudRegiXSearchEngine:
 
         return list(set(expanded))
 
-    def _calculate_keyword_score(self, document: str, keywords: List[str]) -> float:
-        """키워드 매칭 점수 계산"""
-        if not document or not keywords:
-            return 0.0
-
-        doc_lower = document.lower()
-        score = 0.0
-
+    def _get_keyword_pattern(self, keywords: List[str]) -> _KeywordMatcher:
+        """확장 키워드 집합에 대한 alternation 정규식 쌍 반환 (LRU 캐시)"""
+        cache_key = frozenset(keywords)
+        with self._keyword_pattern_lock:
+            matcher = self._keyword_pattern_cache.get(cache_key)
+            if matcher is not None:
+                self._keyword_pattern_cache.move_to_end(cache_key)
+                return matcher
+
+        # 대소문자만 다른 키워드는 하나의 대안으로 묶고 개수만큼 가중
+        keyword_counts: Dict[str, int] = {}
         for keyword in keywords:
             keyword_lower = keyword.lower()
+            keyword_counts[keyword_lower] = keyword_counts.get(keyword_lower, 0) + 1
+        partial_pattern = _compile_alternation(keyword_counts)
+        pattern = re.compile(r"\b(?:" + partial_pattern.pattern + r")\b")
+        keyword_patterns = {
+            keyword_lower: re.compile(r"\b" + re.escape(keyword_lower) + r"\b")
+            for keyword_lower in keyword_counts
+        }
+        matcher = (pattern, partial_pattern, keyword_counts, keyword_patterns)
 
-            # 정확한 매칭
-            if keyword_lower in doc_lower:
-                # 단어 경계 확인
-                if re.search(r"\b" + re.escape(keyword_lower) + r"\b", doc_lower):
-                    score += 1.0  # 완전 매칭
-                else:
-                    score += 0.5  # 부분 매칭
+        with self._keyword_pattern_lock:
+            self._keyword_pattern_cache[cache_key] = matcher
+            if len(self._keyword_pattern_cache) > KEYWORD_PATTERN_CACHE_SIZE:
+                self._keyword_pattern_cache.popitem(last=False)
+        return matcher
 
-        # 정규화
-        return min(score / len(keywords), 1.0) if keywords else 0.0
+    def _calculate_keyword_score(
+        self,
+        doc_lower: str,
+        keywords: List[str],
+        keyword_matcher: _KeywordMatcher,
+    ) -> float:
+        """
+        키워드 매칭 점수 계산 (소문자로 변환된 문서 입력)
+
+        단어 경계로 둘러싸인 키워드는 완전 매칭(1.0), 조사가 붙은 한글 토큰처럼
+        경계 없이 포함된 키워드는 부분 매칭(0.5)으로 계산합니다.
+        경계 없는 alternation으로 한 번 훑어 키워드가 없는 문서는 바로 제외합니다.
+        alternation은 겹치지 않는 일치만 찾으므로, 더 긴 키워드 일치 안에 들어 있는
+        키워드("application programming interface" 안의 "application")는
+        키워드별 단어 경계 정규식으로 다시 확인합니다.
+        """
+        if not doc_lower or not keywords:
+            return 0.0
+
+        pattern, partial_pattern, keyword_counts, keyword_patterns = keyword_matcher
+        if partial_pattern.search(doc_lower) is None:
+            return 0.0
 
-    def _calculate_metadata_score(self, query_lower: str, metadata: Dict) -> float:
-        """메타데이터 점수 계산"""
+        full_hits = set(pattern.findall(doc_lower))
         score = 0.0
+        for keyword_lower, count in keyword_counts.items():
+            if keyword_lower in full_hits:
+                score += count  # 완전 매칭
+            elif keyword_lower in doc_lower:
+                if keyword_patterns[keyword_lower].search(doc_lower) is not None:
+                    score += count  # 긴 키워드 일치에 가려진 완전 매칭
+                else:
+                    score += 0.5 * count  # 부분 매칭
+
+        # 정규화
+        return min(score / len(keywords), 1.0)
 
-        # 파일명 매칭
-        filename = metadata.get("filename", "").lower()
-        if any(term in filename for term in query_lower.split()):
-            score += 0.4
+    def _calculate_metadata_score(
+        self, automaton: ahocorasick.Automaton, metadata: Dict
+    ) -> float:
+        """
+        메타데이터 점수 계산
 
-        # 카테고리 매칭
-        category = metadata.get("category", "").lower()
-        if any(term in category for term in query_lower.split()):
-            score += 0.3
+        파일명/카테고리/문서 타입/도메인 필드를 연결하여 오토마톤으로 한 번에 매칭
+        """
+        fields = (
+            _intern_lower(metadata.get("filename", "")),
+            _intern_lower(metadata.get("category", "")),
+            _intern_lower(metadata.get("document_type", "")),
+            _intern_lower(metadata.get("domain", "")),
+        )
+        # 파일명 0.4, 카테고리 0.3, 문서 타입 0.2, 도메인 0.1
+        weights = (0.4, 0.3, 0.2, 0.1)
 
-        # 문서 타입 매칭
-        doc_type = metadata.get("document_type", "").lower()
-        if any(term in doc_type for term in query_lower.split()):
-            score += 0.2
+        offsets = []
+        position = 0
+        for field in fields:
+            offsets.append(position)
+            position += len(field) + 1
 
-        # 도메인 매칭
-        domain = metadata.get("domain", "").lower()
-        if any(term in domain for term in query_lower.split()):
-            score += 0.1
+        matched = [False] * len(fields)
+        for end, _ in automaton.iter(_FIELD_SEP.join(fields)):
+            matched[bisect_right(offsets, end) - 1] = True
 
+        score = sum(weight for weight, hit in zip(weights, matched) if hit)
         return min(score, 1.0)
 
     def _merge_search_results(
         self, vector_results: List[SearchResult], keyword_results: List[SearchResult]
     ) -> List[SearchResult]:
-        """벡터 + 키워드 검색 결과 병합"""
-        # ID별 결과 매핑
-        vector_map = {r.id: r for r in vector_results}
-        keyword_map = {r.id: r for r in keyword_results}
-
-        # 모든 고유 ID
-        all_ids = set(vector_map.keys()) | set(keyword_map.keys())
-
-        merged_results = []
-        for doc_id in all_ids:
-            vector_result = vector_map.get(doc_id)
-            keyword_result = keyword_map.get(doc_id)
-
-            if vector_result and keyword_result:
-                # 두 결과 모두 존재
-                result = vector_result
-                result.keyword_score = keyword_result.keyword_score
-            elif vector_result:
-                # 벡터 결과만 존재
-                result = vector_result
-                result.keyword_score = 0.0
-            else:
-                # 키워드 결과만 존재
-                result = keyword_result
-                result.vector_score = 0.0
+        """벡터 + 키워드 검색 결과 병합 (벡터 결과 우선, 삽입 순서 유지)"""
+        merged: Dict[str, SearchResult] = {r.id: r for r in vector_results}
 
-            merged_results.append(result)
+        for r in keyword_results:
+            result = merged.setdefault(r.id, r)
+            if result is not r:
+                result.keyword_score = r.keyword_score
+                result.content_lower = r.content_lower
 
-        return merged_results
+        return list(merged.values())
 
     def _merge_multi_modal_results(
         self,
@@ -780,119 +1707,114 @@ class CloudRegiXSearchEngine:
         keyword_results: List[SearchResult],
         metadata_results: List[SearchResult],
     ) -> List[SearchResult]:
-        """멀티모달 검색 결과 병합"""
-        # ID별 결과 매핑
-        vector_map = {r.id: r for r in vector_results}
-        keyword_map = {r.id: r for r in keyword_results}
-        metadata_map = {r.id: r for r in metadata_results}
-
-        # 모든 고유 ID
-        all_ids = (
-            set(vector_map.keys()) | set(keyword_map.keys()) | set(metadata_map.keys())
-        )
-
-        merged_results = []
-        for doc_id in all_ids:
-            # 기본 결과 선택 (벡터 우선)
-            base_result = (
-                vector_map.get(doc_id)
-                or keyword_map.get(doc_id)
-                or metadata_map.get(doc_id)
-            )
+        """멀티모달 검색 결과 병합 (벡터 > 키워드 > 메타데이터 우선, 삽입 순서 유지)"""
+        merged = self._merge_search_results(vector_results, keyword_results)
+        merged_map: Dict[str, SearchResult] = {r.id: r for r in merged}
 
-            if base_result:
-                # 각 점수 병합
-                base_result.vector_score = vector_map.get(
-                    doc_id, SearchResult("", "", {})
-                ).vector_score
-                base_result.keyword_score = keyword_map.get(
-                    doc_id, SearchResult("", "", {})
-                ).keyword_score
-                base_result.metadata_score = metadata_map.get(
-                    doc_id, SearchResult("", "", {})
-                ).metadata_score
+        for r in metadata_results:
+            merged_map.setdefault(r.id, r).metadata_score = r.metadata_score
 
-                merged_results.append(base_result)
-
-        return merged_results
+        return list(merged_map.values())
 
     def _enhance_relevance_scores(
-        self, query: str, results: List[SearchResult]
-    ) -> List[SearchResult]:
+        self, query: str, batch: SearchResultBatch
+    ) -> SearchResultBatch:
         """관련성 점수 강화 (CloudRegiX 고유 알고리즘)"""
-        if not results:
-            return results
+        if not len(batch):
+            return batch
 
         query_lower = query.lower()
-        query_words = set(query_lower.split())
+        query_words = frozenset(query_lower.split())
+        long_query_words = [word for word in query_words if len(word) > 2]
 
-        for result in results:
-            content_lower = result.content.lower()
-            content_words = set(content_lower.split())
-            metadata = result.metadata
+        # 3글자 이상 쿼리 단어는 오토마톤 한 번의 순회로 부분 매칭 개수 계산
+        query_automaton = (
+            _build_automaton(long_query_words) if long_query_words else None
+        )
+
+        # 쿼리에 등장한 도메인의 키워드 정규식만 미리 선별
+        active_domain_patterns = [
+            pattern
+            for pattern in self._domain_re.values()
+            if pattern.search(query_lower) is not None
+        ]
 
-            relevance_score = 0.0
+        # 문서별 특징(일치 개수, 길이, 태그)만 수집하고 가중합은 수치 커널에서 계산
+        features = np.zeros((len(batch), len(RELEVANCE_FEATURES)), dtype=np.float64)
+
+        for idx, (content, content_lower, metadata) in enumerate(
+            zip(batch.contents, batch.contents_lower, batch.metadatas)
+        ):
+            if content_lower is None:
+                content_lower = content.lower()
+            row = features[idx]
 
             # 1. 정확한 키워드 매칭 (30% 가중치)
-            exact_matches = query_words & content_words
-            relevance_score += len(exact_matches) * self.config.exact_match_weight
+            row[0] = len(query_words.intersection(content_lower.split()))
 
             # 2. 부분 키워드 매칭 (20% 가중치)
-            for word in query_words:
-                if len(word) > 2 and word in content_lower:
-                    relevance_score += self.config.partial_match_weight
+            if query_automaton is not None:
+                row[1] = len(
+                    {word for _, (word, _) in query_automaton.iter(content_lower)}
+                )
 
             # 3. 도메인 키워드 가중치 (40% 가중치)
-            for domain, keywords in self.domain_keywords.items():
-                if any(kw in query_lower for kw in keywords):
-                    for keyword in keywords:
-                        if keyword in content_lower:
-                            relevance_score += self.config.domain_keyword_weight
-                            break
+            row[2] = sum(
+                1
+                for pattern in active_domain_patterns
+                if pattern.search(content_lower) is not None
+            )
 
             # 4. 메타데이터 기반 점수 (30% 가중치)
-            filename = metadata.get("filename", "").lower()
-            category = metadata.get("category", "").lower()
-
-            for word in query_words:
-                if len(word) > 2 and word in filename:
-                    relevance_score += self.config.metadata_match_weight
+            filename = _intern_lower(metadata.get("filename", ""))
+            if query_automaton is not None and filename:
+                row[3] = len({word for _, (word, _) in query_automaton.iter(filename)})
 
             # 5. 내용 품질 점수 (10% 가중치)
-            content_length = len(result.content)
-            if content_length > 2000:
-                relevance_score += self.config.content_quality_weight
-            elif content_length > 1000:
-                relevance_score += self.config.content_quality_weight * 0.5
+            row[4] = len(content)
 
-            # 6. 최신성 점수 (5% 가중치)
-            if any(year in filename for year in ["2023", "2024", "2025"]):
-                relevance_score += self.config.recency_weight
+            # 6~7. 최신성(5%) / 출처 신뢰도(10%) 점수 (문서별 태그 재사용)
+            row[5], row[6] = self._get_doc_tags(filename)
 
-            # 7. 출처 신뢰도 점수 (10% 가중치)
-            authority_sources = ["금융보안원", "금융위원회", "kisa", "한국인터넷진흥원"]
-            if any(source in filename for source in authority_sources):
-                relevance_score += self.config.authority_weight
+        # 가중합 및 점수 정규화 (0.0 ~ 1.0)
+        relevance_scores = _relevance_kernel(features, self._relevance_weights)
+        batch.relevance = relevance_scores
 
-            # 점수 정규화 (0.0 ~ 1.0)
-            result.relevance_score = min(relevance_score, 1.0)
+        # 관련성 점수로 정렬 (동점 시 기존 순서 유지)
+        return batch.take(np.argsort(-relevance_scores, kind="stable"))
 
-        # 관련성 점수로 정렬
-        results.sort(key=lambda x: x.relevance_score, reverse=True)
+    def _get_doc_tags(self, filename: str) -> Tuple[bool, bool]:
+        """파일명의 (최신성, 출처 신뢰도) 태그 반환 (LRU 캐시)"""
+        with self._doc_tags_lock:
+            tags = self._doc_tags.get(filename)
+            if tags is not None:
+                self._doc_tags.move_to_end(filename)
+                return tags
 
-        return results
+        tags = (
+            _RECENCY_RE.search(filename) is not None,
+            _AUTHORITY_RE.search(filename) is not None,
+        )
+        with self._doc_tags_lock:
+            self._doc_tags[filename] = tags
+            if len(self._doc_tags) > DOC_TAG_CACHE_SIZE:
+                self._doc_tags.popitem(last=False)
+        return tags
 
     def _select_best_documents(
-        self, results: List[SearchResult], query_analysis: Dict
+        self, batch: SearchResultBatch, query_analysis: Dict
     ) -> List[SearchResult]:
-        """최적 문서 선택 전략"""
-        if not results:
-            return results
+        """최적 문서 선택 전략 (선택된 문서만 SearchResult로 변환)"""
+        if not len(batch):
+            return []
 
-        # 관련성 수준별 분류
-        high_relevance = [r for r in results if r.relevance_score >= 0.6]
-        medium_relevance = [r for r in results if 0.4 <= r.relevance_score < 0.6]
-        low_relevance = [r for r in results if 0.2 <= r.relevance_score < 0.4]
+        # 관련성 수준별 분류 (행 인덱스)
+        relevance = batch.relevance
+        high_relevance = np.flatnonzero(relevance >= 0.6).tolist()
+        medium_relevance = np.flatnonzero(
+            (relevance >= 0.4) & (relevance < 0.6)
+        ).tolist()
+        low_relevance = np.flatnonzero((relevance >= 0.2) & (relevance < 0.4)).tolist()
 
         # 쿼리 복잡도에 따른 선택 전략
         if query_analysis["complexity"] == QueryComplexity.HIGH:
@@ -922,9 +1844,8 @@ class CloudRegiXSearchEngine:
             )
             selection_strategy = "all_levels"
 
-        # 순위 재설정
-        for i, doc in enumerate(selected_docs):
-            doc.rank = i + 1
+        # 순위를 매겨 SearchResult로 변환
+        selected_docs = batch.to_results(selected_docs)
 
         self.logger.info(
             f"문서 선택 전략: {selection_strategy}, 선택된 문서: {len(selected_docs)}개"
@@ -932,41 +1853,58 @@ class CloudRegiXSearchEngine:
 
         return selected_docs
 
-    def _compose_final_result(
+    def _build_public_response(
         self,
         query: str,
         method: SearchMethod,
         results: List[SearchResult],
         query_analysis: Dict,
         execution_time: float,
-    ) -> Dict[str, Any]:
-        """최종 결과 구성"""
-        # 결과를 딕셔너리 형태로 변환
-        result_dicts = []
-        for result in results:
-            result_dict = {
-                "id": result.id,
-                "content": result.content,
-                "metadata": result.metadata,
-                "scores": {
-                    "vector_score": result.vector_score,
-                    "keyword_score": result.keyword_score,
-                    "metadata_score": result.metadata_score,
-                    "relevance_score": result.relevance_score,
-                    "final_score": result.final_score,
-                },
-                "rank": result.rank,
-                "distance": result.distance,
-            }
-            result_dicts.append(result_dict)
+        as_json_bytes: bool = False,
+    ) -> Union[Dict[str, Any], bytes]:
+        """
+        외부 API용 최종 응답 구성 (결과 딕셔너리, 소스 분포, 점수 통계)
 
-        # 소스 분포 계산
+        as_json_bytes=True면 결과 딕셔너리 목록을 만들지 않고 SearchResult를
+        그대로 담아 orjson 직렬화 중에 변환합니다.
+        """
+        # 결과 딕셔너리 변환, 소스 분포, 관련성 점수 통계를 한 번의 순회로 계산
+        # (결과가 많으면 점수 통계는 NumPy 배열 리덕션으로 계산)
+        result_count = len(results)
+        vectorized_stats = result_count >= NUMPY_STATS_MIN_RESULTS
+        result_dicts = []
         source_distribution = {}
+        total_relevance = 0.0
+        max_relevance = float("-inf")
+        min_relevance = float("inf")
         for result in results:
+            if not as_json_bytes:
+                result_dicts.append(result.to_dict())
+
             source = result.metadata.get("source_file", "unknown")
             source_distribution[source] = source_distribution.get(source, 0) + 1
 
-        return {
+            if not vectorized_stats:
+                relevance_score = result.relevance_score
+                total_relevance += relevance_score
+                if relevance_score > max_relevance:
+                    max_relevance = relevance_score
+                if relevance_score < min_relevance:
+                    min_relevance = relevance_score
+
+        if vectorized_stats:
+            relevance_scores = np.fromiter(
+                map(_get_relevance_score, results),
+                dtype=np.float64,
+                count=result_count,
+            )
+            total_relevance = float(relevance_scores.sum())
+            max_relevance = float(relevance_scores.max())
+            min_relevance = float(relevance_scores.min())
+        elif not result_count:
+            max_relevance = min_relevance = 0.0
+
+        response = {
             "query": query,
             "method": method.value,
             "query_analysis": {
@@ -975,9 +1913,9 @@ class CloudRegiXSearchEngine:
                 "domain_matches": query_analysis["domain_matches"],
                 "has_technical_terms": query_analysis["has_technical_terms"],
             },
-            "results": result_dicts,
+            "results": results if as_json_bytes else result_dicts,
             "metadata": {
-                "total_results": len(results),
+                "total_results": result_count,
                 "execution_time_seconds": execution_time,
                 "search_config": {
                     "vector_weight": self.config.vector_weight,
@@ -987,53 +1925,76 @@ class CloudRegiXSearchEngine:
                 "source_distribution": source_distribution,
                 "score_statistics": {
                     "avg_relevance": (
-                        sum(r.relevance_score for r in results) / len(results)
-                        if results
-                        else 0.0
-                    ),
-                    "max_relevance": (
-                        max(r.relevance_score for r in results) if results else 0.0
-                    ),
-                    "min_relevance": (
-                        min(r.relevance_score for r in results) if results else 0.0
+                        total_relevance / result_count if result_count else 0.0
                     ),
+                    "max_relevance": max_relevance,
+                    "min_relevance": min_relevance,
                 },
             },
             "success": True,
         }
 
+        if as_json_bytes:
+            return orjson.dumps(
+                response,
+                default=_search_result_default,
+                option=orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        return response
+
     def _error_result(self, query: str, error_message: str) -> Dict[str, Any]:
         """오류 결과"""
-        return {"query": query, "results": [], "error": error_message, "success": False}
+        return {**self._ERROR_TEMPLATE, "query": query, "error": error_message}
 
     def _update_stats(self, execution_time: float):
-        """통계 업데이트"""
-        self.stats["total_searches"] += 1
-
-        # 평균 응답 시간 계산
-        total_time = (
-            self.stats["avg_search_time"] * (self.stats["total_searches"] - 1)
-            + execution_time
-        )
-        self.stats["avg_search_time"] = total_time / self.stats["total_searches"]
+        """통계 업데이트 (결과 캐시로 응답한 검색 포함)"""
+        with self._stats_lock:
+            self.stats["total_searches"] += 1
+
+            # 평균 응답 시간 점진 갱신 (avg += (t - avg) / n)
+            n = self.stats["total_searches"]
+            self.stats["avg_search_time"] += (
+                execution_time - self.stats["avg_search_time"]
+            ) / n
+
+    def close(self):
+        """하위 검색용 스레드 풀, 임베딩 배치 스레드 및 FTS5 연결 종료"""
+        self._executor.shutdown(wait=False)
+        if self._batched_embedder is not None:
+            self._batched_embedder.close()
+        if self._fts_conn is not None:
+            self._fts_conn.close()
+
+    def __del__(self):
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
 
     def get_collection_info(self) -> Dict[str, Any]:
         """컬렉션 정보 조회"""
         try:
-            count = self.collection.count()
-
-            # 샘플 메타데이터 조회
-            sample = self.collection.peek(limit=5)
-            sample_metadata_keys = []
-            if sample and sample.get("metadatas"):
-                sample_metadata_keys = (
-                    list(sample["metadatas"][0].keys()) if sample["metadatas"] else []
-                )
+            now = time.monotonic()
+            cached = self._collection_info_cache
+            if cached is not None and now - cached[0] <= COLLECTION_INFO_TTL:
+                _, count, sample_metadata_keys = cached
+            else:
+                count = self.collection.count()
+
+                # 샘플 메타데이터 조회
+                sample = self.collection.peek(limit=5)
+                sample_metadata_keys = []
+                if sample and sample.get("metadatas"):
+                    sample_metadata_keys = (
+                        list(sample["metadatas"][0].keys())
+                        if sample["metadatas"]
+                        else []
+                    )
+                self._collection_info_cache = (now, count, sample_metadata_keys)
 
             return {
                 "collection_name": self.collection_name,
                 "total_documents": count,
-                "sample_metadata_keys": sample_metadata_keys,
+                "sample_metadata_keys": list(sample_metadata_keys),
                 "vectorstore_path": self.vectorstore_path,
             }
         except Exception as e:
@@ -1045,11 +2006,10 @@ class CloudRegiXSearchEngine:
             "total_searches": self.stats["total_searches"],
             "average_search_time": self.stats["avg_search_time"],
             "cache_hits": self.stats["cache_hits"],
-            "supported_methods": [method.value for method in SearchMethod],
-            "domain_keywords_count": sum(
-                len(keywords) for keywords in self.domain_keywords.values()
-            ),
-            "synonyms_count": len(self.synonyms),
+            "result_cache_hits": self.stats["result_cache_hits"],
+            "supported_methods": list(_SUPPORTED_METHODS),
+            "domain_keywords_count": self._domain_keywords_count,
+            "synonyms_count": self._synonyms_count,
         }
 
 
@@ -1077,6 +2037,12 @@ def create_search_engine(
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _get_engine(vectorstore_path: str, collection_name: str) -> CloudRegiXSearchEngine:
+    """경로/컬렉션별 검색 엔진 재사용 (ChromaDB 클라이언트 및 임베딩 초기화 1회)"""
+    return create_search_engine(vectorstore_path, collection_name)
+
+
 def simple_search(
     vectorstore_path: str,
     query: str,
@@ -1097,7 +2063,7 @@ def simple_search(
     Returns:
         검색 결과 딕셔너리
     """
-    search_engine = create_search_engine(vectorstore_path, collection_name)
+    search_engine = _get_engine(vectorstore_path, collection_name)
     search_method = SearchMethod(method)
 
     return search_engine.search(
@@ -1137,5 +2103,7 @@ if __name__ == "__main__":
 
     for i, doc in enumerate(result["results"][:3], 1):
         print(f"\n{i}. [관련성: {doc['scores']['relevance_score']:.3f}]")
-        print(f"   내용: {doc['content'][:200]}...")
+        content = doc["content"]
+        preview = content if len(content) <= 200 else content[:200] + "..."
+        print(f"   내용: {preview}")
         print(f"   소스: {doc['metadata'].get('source_file', 'unknown')}")
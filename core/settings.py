@@ -1,12 +1,22 @@
+import functools
+
+import httpx
 from dotenv import load_dotenv
 from langchain_openai import AzureChatOpenAI, AzureOpenAIEmbeddings
-from langchain_anthropic import ChatAnthropic
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 load_dotenv()
 
+# Azure OpenAI LLM/임베딩 동기 클라이언트가 공유하는 HTTP/2 커넥션 풀
+# (타임아웃은 openai SDK 기본값과 동일)
+# 비동기 클라이언트의 커넥션 풀은 처음 사용한 이벤트 루프에 묶이므로 공유하지 않고
+# SDK 기본값(인스턴스별 생성)을 사용합니다.
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+_HTTP_CLIENT = httpx.Client(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+
 
-class config(BaseSettings):
+class Config(BaseSettings):
     AOAI_API_KEY: str
     AOAI_ENDPOINT: str
     AOAI_API_VERSION: str
@@ -25,6 +35,7 @@ class config(BaseSettings):
             azure_deployment="gpt-4o",
             temperature=0.7,
             streaming=True,
+            http_client=_HTTP_CLIENT,
         )
 
     def get_claude_llm(self):
@@ -34,6 +45,9 @@ class config(BaseSettings):
         Returns:
             ChatAnthropic 객체
         """
+        # Claude를 쓰지 않는 프로세스의 import 시간을 줄이기 위해 지연 import
+        from langchain_anthropic import ChatAnthropic
+
         return ChatAnthropic(
             model="claude-sonnet-4-20250514",
             api_key=self.ANTHROPIC_API_KEY,
@@ -49,15 +63,30 @@ class config(BaseSettings):
             openai_api_version=self.AOAI_API_VERSION,
             api_key=self.AOAI_API_KEY,
             azure_endpoint=self.AOAI_ENDPOINT,
+            http_client=_HTTP_CLIENT,
         )
 
 
-config = config()
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Config:
+    """
+    검증된 설정 인스턴스 반환 메서드
+    .env 읽기와 필드 검증이 프로세스당 한 번만 수행되도록 캐시
+
+    Returns:
+        Config 객체
+    """
+    return Config()
+
+
+config = get_settings()
 
 
+@functools.lru_cache(maxsize=1)
 def get_llm():
     """
     Azure OpenAI LLM 인스턴스 반환 메서드
+    모든 Agent가 동일한 인스턴스(HTTP 커넥션 풀)를 공유하도록 캐시
 
     Returns:
         AzureChatOpenAI 객체
@@ -65,9 +94,11 @@ def get_llm():
     return config.get_llm()
 
 
+@functools.lru_cache(maxsize=1)
 def get_claude_llm():
     """
     Claude 4.0 Sonnet LLM 인스턴스 반환 메서드
+    슬라이드 생성 등 호출마다 클라이언트를 새로 만들지 않도록 캐시
 
     Returns:
         ChatAnthropic 객체
@@ -75,9 +106,11 @@ def get_claude_llm():
     return config.get_claude_llm()
 
 
+@functools.lru_cache(maxsize=1)
 def get_embeddings():
     """
     Azure OpenAI Embeddings 인스턴스 반환 메서드
+    검색 도구 간 임베딩 클라이언트를 공유하도록 캐시
 
     Returns:
         AzureOpenAIEmbeddings 객체
@@ -6,18 +6,40 @@
 사용법:
 1. 벡터화할 문서들을 data_source/raw/ 디렉토리에 저장
 2. python standalone_vectorization.py 실행
+   (임베딩 차원 불일치 처리: --on-dim-mismatch new|drop|abort, 기본값 new)
 
 지원 파일 형식: PDF, DOCX, XLSX, TXT
 """
 
 import os
+import argparse
 import sys
+import io
 import json
+import multiprocessing
 import time
 import uuid
+import hashlib
 import re
+import queue
+import sqlite3
+import threading
+import unicodedata
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import (
+    List,
+    Dict,
+    Any,
+    Optional,
+    Deque,
+    Tuple,
+    Generator,
+    Iterable,
+    Iterator,
+    Literal,
+)
 from datetime import datetime
 import logging
 
@@ -31,6 +53,8 @@ try:
     from chromadb.types import Collection
     from chromadb.utils import embedding_functions
     import fitz  # PyMuPDF
+    import numpy as np
+    import orjson
     from docx import Document
     import pandas as pd
     from config.llm import get_embeddings
@@ -38,9 +62,25 @@ try:
     from vectorstore.stores.chroma_store import ChromaStore
 except ImportError as e:
     print(f"❌ 필요한 라이브러리를 설치해주세요: {e}")
-    print("pip install chromadb pymupdf python-docx pandas openpyxl")
+    print("pip install chromadb pymupdf python-docx pandas openpyxl orjson")
     sys.exit(1)
 
+# Excel 읽기 엔진: python-calamine(Rust 기반)이 있으면 사용, 없으면 pandas 기본값
+try:
+    import python_calamine  # noqa: F401
+
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
+
+# 임베딩 배치 토큰 계산: tiktoken이 있으면 사용, 없으면 UTF-8 바이트 수(토큰 수 상한)로 추정
+try:
+    import tiktoken
+
+    TOKEN_ENCODING = tiktoken.encoding_for_model("text-embedding-3-small")
+except Exception:
+    TOKEN_ENCODING = None
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -49,12 +89,195 @@ logging.basicConfig(
 )
 logger = logging.getLogger("VectorizationScript")
 
+# 텍스트 전처리/문장 분할/카테고리 추출 정규식
+_WS_RE = re.compile(r"\s+")
+_CTRL_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]")
+_REPEAT_RE = re.compile(r"(.)\1{50,}")
+_REPEAT_REPL = r"\1" * 10
+_SENTENCE_RE = re.compile(r"[.!?]\s+|[。！？]\s*")
+_CATEGORY_RE = re.compile(r"\[([^\]]+)\]")
+
+# 문장 구분자 없이 긴 텍스트를 강제로 나눌 때 사용할 공백 문자
+_FORCED_SPLIT_CHARS = (" ", "\n", "\t")
+
+# 뒤따르는 공백과 함께여야 문장 구분자가 되는 구두점 (블록 끝에서는 확정 불가)
+_PENDING_TERMINATORS = (".", "!", "?")
+
+# 금융 도메인으로 분류할 카테고리 키워드
+_FINANCIAL_KEYWORDS = ("금융", "법률", "신용정보", "KISA", "NIST", "ISMS")
+
+# 배치 임베딩 동시 요청 수, 저장 대기 포함 최대 진행 배치 수, 429 재시도 횟수
+EMBEDDING_MAX_WORKERS = 4
+EMBEDDING_MAX_IN_FLIGHT = EMBEDDING_MAX_WORKERS * 2
+EMBEDDING_MAX_RETRIES = 5
+
+# 임베딩 배포의 분당 토큰/요청 한도 (Azure OpenAI 배포 할당량에 맞게 조정)
+EMBEDDING_TPM_LIMIT = 350_000
+EMBEDDING_RPM_LIMIT = 2_100
+
+# 파이프라인 단계 설정: 파싱 프로세스 수, 진행 중 파싱 작업 수, 저장 대기 파일 수
+PARSE_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+PARSE_MAX_IN_FLIGHT = PARSE_WORKERS * 2
+PIPELINE_QUEUE_SIZE = 4
+
+# 임베딩 차원 불일치 처리 방식 (new: 새 컬렉션, drop: 기존 삭제, abort: 중단)
+DimMismatchPolicy = Literal["new", "drop", "abort"]
+DIM_MISMATCH_POLICIES = ("new", "drop", "abort")
+
+# 컬렉션별 검증된 임베딩 차원/모델 기록 파일 (persist_directory 하위)
+COLLECTION_META_FILENAME = ".meta.json"
+EMBEDDING_MODEL_NAME = "text-embedding-3-small"
+EMBEDDING_DIMENSION = 1536
+
+# TXT 파일 스트리밍 읽기 블록 크기 (문자 수)
+TXT_READ_BLOCK_SIZE = 1 << 20
+
+# 파일 간 청크를 모아 한 번에 저장하는 ChromaDB add 단위
+CHROMA_ADD_BATCH_SIZE = 250
+
+# 임베딩 요청 1회당 토큰/입력 수 상한 (Azure OpenAI 제한보다 약간 낮게)
+EMBEDDING_MAX_BATCH_TOKENS = 240_000
+EMBEDDING_MAX_BATCH_INPUTS = 2048
+
+
+class _TokenBucket:
+    """
+    분당 한도 기반 속도 제한기 (per_minute/60의 속도로 충전)
+
+    한 번에 최대 burst_seconds 동안의 한도까지 연속 사용을 허용하며,
+    버킷 용량보다 큰 요청은 버킷이 가득 찼을 때 통과시키고 초과분을 이후 대기로 갚습니다.
+    """
+
+    def __init__(self, per_minute: float, burst_seconds: float = 10.0):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate * burst_seconds)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, cost: float = 1.0):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                needed = min(cost, self.capacity)
+                if self.tokens >= needed:
+                    self.tokens -= cost
+                    return
+                wait = (needed - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def _sqlite_pragmas(unsafe_fast: bool) -> List[str]:
+    """
+    일괄 적재용 SQLite PRAGMA 목록
+
+    기본값은 WAL + synchronous=NORMAL로 내구성을 유지하며, unsafe_fast=True면
+    일회성 적재 스크립트용으로 fsync와 파일 잠금 해제를 생략합니다.
+    """
+    if unsafe_fast:
+        return [
+            "PRAGMA journal_mode = MEMORY",
+            "PRAGMA synchronous = OFF",
+            "PRAGMA temp_store = MEMORY",
+            "PRAGMA locking_mode = EXCLUSIVE",
+            "PRAGMA cache_size = -262144",
+        ]
+    return [
+        "PRAGMA journal_mode = WAL",
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA cache_size = -262144",
+    ]
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Azure OpenAI 요청 제한(429) 오류 여부"""
+    return getattr(error, "status_code", None) == 429
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """429 응답의 Retry-After 헤더 값 (초)"""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+# 키워드 검색용 SQLite FTS5 보조 인덱스 (CloudRegiXSearchEngine과 동일한 스키마)
+# 한글 복합어 속 키워드도 찾을 수 있도록 부분 문자열 검색이 되는 trigram 토크나이저 사용
+FTS_DB_FILENAME = "fts.db"
+FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5("
+    "id UNINDEXED, collection UNINDEXED, content, metadata_json UNINDEXED, "
+    "tokenize='trigram')"
+)
+
+
+# 임베딩 중복 요청 방지용 청크 내용 해시 (FTS5 인덱스와 같은 파일에 저장)
+CONTENT_HASH_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS content_hashes ("
+    "collection TEXT NOT NULL, hash TEXT NOT NULL, "
+    "PRIMARY KEY (collection, hash)) WITHOUT ROWID"
+)
+
+
+def _ensure_trigram_fts(conn: sqlite3.Connection):
+    """
+    FTS5 인덱스 테이블 생성
+
+    이전 버전이 만든 unicode61 토크나이저 인덱스는 저장된 본문을 그대로 옮겨
+    trigram 인덱스로 다시 만듭니다.
+    """
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'docs'").fetchone()
+    if row is not None and "trigram" not in row[0].lower():
+        logger.info("FTS5 인덱스를 trigram 토크나이저로 다시 생성합니다.")
+        with conn:
+            conn.execute("ALTER TABLE docs RENAME TO docs_unicode61")
+            conn.execute(FTS_SCHEMA)
+            conn.execute(
+                "INSERT INTO docs (id, collection, content, metadata_json) "
+                "SELECT id, collection, content, metadata_json FROM docs_unicode61"
+            )
+            conn.execute("DROP TABLE docs_unicode61")
+    conn.execute(FTS_SCHEMA)
+
+
+def _content_hash(content: str) -> str:
+    """전처리된 청크 내용의 해시 (중복 임베딩 판별용)"""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _iter_files(root: Path, extensions: Iterable[str]) -> Iterator[Path]:
+    """
+    root 하위(재귀)에서 지정 확장자 파일을 찾습니다.
+
+    os.scandir 한 번의 순회로 디렉토리 항목 정보를 재사용하여 파일별 stat 호출이 없습니다.
+    """
+    extensions = tuple(ext.lower() for ext in extensions)
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+                elif entry.name.lower().endswith(extensions) and entry.is_file():
+                    yield Path(entry.path)
+
 
 class DocumentParser:
     """문서 파싱 클래스"""
 
     def __init__(self):
         self.supported_extensions = {".pdf", ".docx", ".xlsx", ".xls", ".txt"}
+        # 본문을 블록 단위로 지연 읽기하는 형식 (content 대신 content_blocks 반환)
+        self.streamed_extensions = {".txt"}
 
     def parse_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """파일을 파싱하여 텍스트와 메타데이터를 추출합니다."""
@@ -79,17 +302,12 @@ class DocumentParser:
 
     def _parse_pdf(self, file_path: Path) -> Dict[str, Any]:
         """PDF 파일 파싱"""
-        doc = fitz.open(str(file_path))
-        text_content = ""
-
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            text_content += page.get_text() + "\n"
-
-        doc.close()
+        # 형식 감지 생략, 페이지 객체는 텍스트 추출 직후 해제
+        with fitz.open(str(file_path), filetype="pdf") as doc:
+            pages = [page.get_text("text") for page in doc]
 
         return {
-            "content": text_content.strip(),
+            "content": "\n".join(pages).strip(),
             "metadata": {
                 "file_name": file_path.name,
                 "file_type": "pdf",
@@ -101,10 +319,7 @@ class DocumentParser:
     def _parse_docx(self, file_path: Path) -> Dict[str, Any]:
         """DOCX 파일 파싱"""
         doc = Document(str(file_path))
-        text_content = ""
-
-        for paragraph in doc.paragraphs:
-            text_content += paragraph.text + "\n"
+        text_content = "\n".join(paragraph.text for paragraph in doc.paragraphs)
 
         return {
             "content": text_content.strip(),
@@ -118,15 +333,17 @@ class DocumentParser:
 
     def _parse_excel(self, file_path: Path) -> Dict[str, Any]:
         """Excel 파일 파싱"""
-        df = pd.read_excel(str(file_path), sheet_name=None)
-        text_content = ""
+        df = pd.read_excel(str(file_path), sheet_name=None, engine=EXCEL_ENGINE)
 
+        # 시트별 표를 탭 구분 텍스트로 직렬화 (to_string의 열 정렬 패딩 생략)
+        buf = io.StringIO()
         for sheet_name, sheet_df in df.items():
-            text_content += f"[시트: {sheet_name}]\n"
-            text_content += sheet_df.to_string(index=False) + "\n\n"
+            buf.write(f"[시트: {sheet_name}]\n")
+            sheet_df.to_csv(buf, sep="\t", index=False)
+            buf.write("\n\n")
 
         return {
-            "content": text_content.strip(),
+            "content": buf.getvalue().strip(),
             "metadata": {
                 "file_name": file_path.name,
                 "file_type": "excel",
@@ -136,12 +353,9 @@ class DocumentParser:
         }
 
     def _parse_txt(self, file_path: Path) -> Dict[str, Any]:
-        """TXT 파일 파싱"""
-        with open(file_path, "r", encoding="utf-8") as f:
-            text_content = f.read()
-
+        """TXT 파일 파싱 (본문은 TXT_READ_BLOCK_SIZE 단위로 지연 읽기)"""
         return {
-            "content": text_content.strip(),
+            "content_blocks": self._read_text_blocks(file_path),
             "metadata": {
                 "file_name": file_path.name,
                 "file_type": "txt",
@@ -150,6 +364,12 @@ class DocumentParser:
             },
         }
 
+    @staticmethod
+    def _read_text_blocks(file_path: Path) -> Iterator[str]:
+        """파일 전체를 메모리에 올리지 않고 고정 크기 블록으로 읽기"""
+        with open(file_path, "r", encoding="utf-8") as f:
+            yield from iter(lambda: f.read(TXT_READ_BLOCK_SIZE), "")
+
 
 class DocumentChunker:
     """문서 청킹 클래스"""
@@ -165,65 +385,113 @@ class DocumentChunker:
         if not content or len(content.strip()) == 0:
             return []
 
+        return self.chunk_stream(iter([content]), metadata)
+
+    def chunk_parsed(self, parsed_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """파싱 결과를 청크로 분할합니다 (지연 읽기 본문은 블록 단위로 처리)."""
+        if "content_blocks" in parsed_data:
+            return self.chunk_stream(
+                parsed_data["content_blocks"], parsed_data["metadata"]
+            )
+        return self.chunk_document(parsed_data["content"], parsed_data["metadata"])
+
+    def chunk_stream(
+        self, text_blocks: Iterable[str], metadata: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """텍스트 블록 스트림을 읽으면서 청크로 분할합니다."""
         # 문장 단위로 분할
-        sentences = self._split_into_sentences(content)
+        sentences = self._iter_sentences(text_blocks)
         chunks = []
-        current_chunk = ""
+        # 청크 문장 목록 (청크 경계에서만 한 번 결합하여 반복 문자열 연결 방지)
+        current_parts: List[str] = []
         current_size = 0
 
         for sentence in sentences:
             sentence_size = len(sentence)
 
             # 청크 크기 초과 시 새로운 청크 생성
-            if current_size + sentence_size > self.chunk_size and current_chunk:
-                chunks.append(
-                    {
-                        "content": current_chunk.strip(),
-                        "metadata": {
-                            **metadata,
-                            "chunk_index": len(chunks),
-                            "chunk_size": len(current_chunk.strip()),
-                        },
-                    }
-                )
+            if current_size + sentence_size > self.chunk_size and current_parts:
+                current_chunk = " ".join(current_parts)
+                chunk_content = current_chunk.strip()
+                chunk_metadata = metadata.copy()
+                chunk_metadata["chunk_index"] = len(chunks)
+                chunk_metadata["chunk_size"] = len(chunk_content)
+                chunks.append({"content": chunk_content, "metadata": chunk_metadata})
 
                 # 오버랩 처리
                 if self.chunk_overlap > 0:
                     overlap_text = current_chunk[-self.chunk_overlap :]
-                    current_chunk = overlap_text + " " + sentence
-                    current_size = len(current_chunk)
+                    current_parts = [overlap_text, sentence]
+                    current_size = len(overlap_text) + 1 + sentence_size
                 else:
-                    current_chunk = sentence
+                    current_parts = [sentence]
                     current_size = sentence_size
             else:
-                current_chunk += " " + sentence if current_chunk else sentence
+                current_parts.append(sentence)
                 current_size += sentence_size
 
         # 마지막 청크 추가
-        if current_chunk.strip():
-            chunks.append(
-                {
-                    "content": current_chunk.strip(),
-                    "metadata": {
-                        **metadata,
-                        "chunk_index": len(chunks),
-                        "chunk_size": len(current_chunk.strip()),
-                    },
-                }
-            )
+        chunk_content = " ".join(current_parts).strip()
+        if chunk_content:
+            chunk_metadata = metadata.copy()
+            chunk_metadata["chunk_index"] = len(chunks)
+            chunk_metadata["chunk_size"] = len(chunk_content)
+            chunks.append({"content": chunk_content, "metadata": chunk_metadata})
 
         return chunks
 
-    def _split_into_sentences(self, text: str) -> List[str]:
-        """텍스트를 문장 단위로 분할합니다."""
-        # 한국어와 영어 문장 분할 패턴
-        sentence_endings = re.compile(r"[.!?]\s+|[。！？]\s*")
-        sentences = sentence_endings.split(text)
-
-        # 빈 문장 제거
-        sentences = [s.strip() for s in sentences if s.strip()]
-
-        return sentences
+    def _iter_sentences(self, text_blocks: Iterable[str]) -> Iterator[str]:
+        """
+        텍스트 블록 스트림을 문장 단위로 분할합니다.
+
+        문장 구분자 없이 chunk_size보다 긴 구간은 블록 경계와 관계없이 모두
+        마지막 공백(없으면 chunk_size)에서 강제로 나눕니다. 블록 끝의 미완성 구간은
+        해당 문장에 속한 것이 확정된 부분까지만 미리 나누고 나머지를 다음 블록 앞에
+        이어 붙이므로, 전체 텍스트를 한 번에 분할한 결과와 동일합니다.
+        """
+        remainder = ""
+        for block in text_blocks:
+            # 직전 블록이 구분자로 끝났으면 이어지는 공백도 그 구분자에 포함
+            text = remainder + block if remainder else block.lstrip()
+            start = 0
+            # 한국어와 영어 문장 분할 패턴 (구분자 사이 구간만 잘라 중간 리스트 생성 없음)
+            for match in _SENTENCE_RE.finditer(text):
+                yield from self._split_segment(text, start, match.start(), final=True)
+                start = match.end()
+
+            # 미완성 구간은 끝의 구두점(다음 블록의 공백과 함께 구분자가 될 수 있음)을
+            # 제외하고 나누어, 이월되는 텍스트가 chunk_size를 넘지 않도록 함
+            end = len(text) - 1 if text.endswith(_PENDING_TERMINATORS) else len(text)
+            start = yield from self._split_segment(text, start, end, final=False)
+            remainder = text[start:]
+
+        yield from self._split_segment(remainder, 0, len(remainder), final=True)
+
+    def _split_segment(
+        self, text: str, start: int, end: int, final: bool
+    ) -> Generator[str, None, int]:
+        """
+        text[start:end] 구간을 chunk_size 이하의 문장 조각으로 생성합니다.
+
+        남은 길이가 chunk_size를 넘는 동안 마지막 공백(없으면 chunk_size)에서 자르고,
+        final이면 남은 구간까지 생성합니다. 생성하지 않은 구간의 시작 위치를 반환합니다.
+        """
+        while end - start > self.chunk_size:
+            limit = start + self.chunk_size
+            cut = max(text.rfind(ws, start, limit) for ws in _FORCED_SPLIT_CHARS)
+            if cut <= start:
+                cut = limit
+            sentence = text[start:cut].strip()
+            if sentence:
+                yield sentence
+            start = cut
+
+        if final:
+            sentence = text[start:end].strip()
+            if sentence:
+                yield sentence
+            start = end
+        return start
 
 
 class VectorStore:
@@ -233,9 +501,26 @@ class VectorStore:
         self,
         collection_name: str = "cloudregix_documents",
         persist_directory: str = "data_source/vectorstore",
+        unsafe_fast: bool = False,
+        on_dim_mismatch: DimMismatchPolicy = "new",
+        tpm_limit: int = EMBEDDING_TPM_LIMIT,
+        rpm_limit: int = EMBEDDING_RPM_LIMIT,
     ):
+        if on_dim_mismatch not in DIM_MISMATCH_POLICIES:
+            raise ValueError(
+                f"on_dim_mismatch는 {DIM_MISMATCH_POLICIES} 중 하나여야 합니다: "
+                f"{on_dim_mismatch}"
+            )
+
         self.collection_name = collection_name
         self.persist_directory = persist_directory
+        self.unsafe_fast = unsafe_fast
+        self.on_dim_mismatch = on_dim_mismatch
+
+        # 임베딩 요청 속도 제한 (모든 add_documents 호출과 작업 스레드가 공유)
+        self.tpm_limit = tpm_limit
+        self._token_limiter = _TokenBucket(tpm_limit)
+        self._request_limiter = _TokenBucket(rpm_limit)
 
         # config/llm.py의 get_embeddings() 함수 사용
         self.embedding_model = get_embeddings()
@@ -246,12 +531,23 @@ class VectorStore:
         # ChromaDB 클라이언트 직접 초기화
         os.makedirs(persist_directory, exist_ok=True)
         self.client = chromadb.PersistentClient(path=persist_directory)
+        self._tune_chroma_sqlite()
 
         # 컬렉션 생성 또는 가져오기
         self.collection = self.client.get_or_create_collection(
             name=collection_name, metadata={"hnsw:space": "cosine"}
         )
 
+        # 키워드 검색용 FTS5 보조 인덱스 (파이프라인 저장 스레드에서도 기록)
+        self.fts_conn = sqlite3.connect(
+            os.path.join(persist_directory, FTS_DB_FILENAME), check_same_thread=False
+        )
+        for pragma in _sqlite_pragmas(unsafe_fast):
+            self.fts_conn.execute(pragma)
+        _ensure_trigram_fts(self.fts_conn)
+        self.fts_conn.execute(CONTENT_HASH_SCHEMA)
+        self.fts_conn.commit()
+
         # 임베딩 모델 정보 로깅
         logger.info(f"임베딩 설정 확인:")
         logger.info(f"  - 모델: text-embedding-3-small (config/llm.py)")
@@ -262,8 +558,40 @@ class VectorStore:
         logger.info(f"저장 위치: {persist_directory}")
 
         # 기존 컬렉션 정보 확인
+        self._collection_meta_recorded = False
         self._check_existing_collection()
 
+        # 이미 저장된 청크 해시 (컬렉션 확인 이후의 최종 컬렉션 기준)
+        self._hash_lock = threading.Lock()
+        self._seen_hashes = {
+            row[0]
+            for row in self.fts_conn.execute(
+                "SELECT hash FROM content_hashes WHERE collection = ?",
+                (self.collection_name,),
+            )
+        }
+        if self._seen_hashes:
+            logger.info(f"기존 청크 해시 {len(self._seen_hashes)}개를 불러왔습니다.")
+
+    def _tune_chroma_sqlite(self):
+        """
+        ChromaDB 내부 SQLite 연결에 일괄 적재용 PRAGMA를 적용합니다.
+
+        Python 구현 시스템 DB(chromadb < 1.0)에서만 연결에 접근할 수 있으며,
+        Rust 백엔드는 자체 연결 설정(WAL)을 사용하므로 건너뜁니다.
+        """
+        conn_pool = getattr(getattr(self.client, "_sysdb", None), "_conn_pool", None)
+        if conn_pool is None:
+            logger.info("ChromaDB SQLite PRAGMA 조정 생략 (백엔드가 연결을 관리)")
+            return
+
+        try:
+            conn = conn_pool.connect()
+            for pragma in _sqlite_pragmas(self.unsafe_fast):
+                conn.execute(pragma)
+        except Exception as e:
+            logger.warning(f"ChromaDB SQLite PRAGMA 적용 실패: {e}")
+
     def _check_existing_collection(self):
         """기존 컬렉션의 임베딩 차원을 확인합니다."""
         try:
@@ -271,18 +599,22 @@ class VectorStore:
             if existing_count > 0:
                 logger.info(f"기존 컬렉션에 {existing_count}개의 문서가 있습니다.")
 
+                # 이전 실행에서 검증된 차원이 기록되어 있으면 샘플 조회 생략
+                if self._load_collection_meta().get("dim") == EMBEDDING_DIMENSION:
+                    logger.info("✅ 임베딩 차원이 일치합니다. (검증 기록 사용)")
+                    self._collection_meta_recorded = True
+                    return
+
                 # 기존 데이터의 첫 번째 문서를 가져와서 차원 확인
-                sample_data = self.collection.get(
-                    limit=1, include=["embeddings", "metadatas"]
-                )
+                sample_data = self.collection.get(limit=1, include=["embeddings"])
 
                 if (
                     sample_data
-                    and sample_data["embeddings"]
+                    and sample_data["embeddings"] is not None
                     and len(sample_data["embeddings"]) > 0
                 ):
                     existing_dimension = len(sample_data["embeddings"][0])
-                    expected_dimension = 1536  # text-embedding-3-small의 차원
+                    expected_dimension = EMBEDDING_DIMENSION
 
                     logger.info(f"기존 데이터 임베딩 차원: {existing_dimension}")
                     logger.info(f"현재 설정 임베딩 차원: {expected_dimension}")
@@ -297,11 +629,14 @@ class VectorStore:
                         )
 
                         # 기존 데이터의 메타데이터에서 모델 정보 확인
+                        sample_metadata = self.collection.get(
+                            limit=1, include=["metadatas"]
+                        )
                         if (
-                            sample_data["metadatas"]
-                            and len(sample_data["metadatas"]) > 0
+                            sample_metadata["metadatas"]
+                            and len(sample_metadata["metadatas"]) > 0
                         ):
-                            metadata = sample_data["metadatas"][0]
+                            metadata = sample_metadata["metadatas"][0]
                             existing_model = metadata.get("embedding_model", "unknown")
                             logger.info(f"기존 데이터 임베딩 모델: {existing_model}")
 
@@ -311,6 +646,7 @@ class VectorStore:
                         )
                     else:
                         logger.info("✅ 임베딩 차원이 일치합니다.")
+                        self._record_collection_meta()
                 else:
                     logger.info("기존 데이터에서 임베딩 정보를 확인할 수 없습니다.")
             else:
@@ -319,118 +655,224 @@ class VectorStore:
         except Exception as e:
             logger.warning(f"기존 컬렉션 확인 중 오류: {e}")
 
-    def _handle_dimension_mismatch(self, existing_dim: int, expected_dim: int):
-        """임베딩 차원 불일치 시 해결 방법을 제시합니다."""
-        print("\n" + "=" * 60)
-        print("⚠️  임베딩 차원 불일치 문제 감지")
-        print("=" * 60)
-        print(f"기존 벡터 데이터: {existing_dim}차원")
-        print(f"현재 설정 모델: {expected_dim}차원")
-        print("\n해결 방법:")
-        print("1. 새로운 컬렉션 이름 사용 (권장)")
-        print("2. 기존 벡터 데이터 삭제 후 재생성")
-        print("3. 작업 중단")
+    def _collection_meta_path(self) -> str:
+        return os.path.join(self.persist_directory, COLLECTION_META_FILENAME)
 
-        while True:
-            choice = input("\n선택하세요 (1/2/3): ").strip()
+    def _load_collection_meta(self) -> Dict[str, Any]:
+        """현재 컬렉션의 검증 기록을 읽습니다 (없으면 빈 딕셔너리)."""
+        try:
+            with open(self._collection_meta_path(), "r", encoding="utf-8") as f:
+                return json.load(f).get(self.collection_name, {})
+        except (OSError, ValueError):
+            return {}
 
-            if choice == "1":
-                # 새로운 컬렉션 이름 생성
-                import time
+    def _record_collection_meta(self):
+        """현재 컬렉션의 임베딩 차원/모델을 검증 기록 파일에 저장합니다."""
+        path = self._collection_meta_path()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = {}
+
+        meta[self.collection_name] = {
+            "dim": EMBEDDING_DIMENSION,
+            "model": EMBEDDING_MODEL_NAME,
+        }
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2)
+            self._collection_meta_recorded = True
+        except OSError as e:
+            logger.warning(f"컬렉션 검증 기록 저장 실패: {e}")
 
-                timestamp = int(time.time())
-                new_collection_name = (
-                    f"{self.collection_name}_v{expected_dim}_{timestamp}"
-                )
-                logger.info(f"새로운 컬렉션 이름으로 변경: {new_collection_name}")
+    def _handle_dimension_mismatch(self, existing_dim: int, expected_dim: int):
+        """
+        임베딩 차원 불일치를 on_dim_mismatch 설정에 따라 처리합니다.
+
+        - "new": 새로운 컬렉션 이름 사용 (기본값)
+        - "drop": 기존 벡터 데이터 삭제 후 재생성
+        - "abort": 작업 중단
+        """
+        logger.warning(
+            f"임베딩 차원 불일치: 기존 {existing_dim}차원, 현재 설정 {expected_dim}차원 "
+            f"(처리 방식: {self.on_dim_mismatch})"
+        )
+
+        if self.on_dim_mismatch == "new":
+            # 새로운 컬렉션 이름 생성
+            timestamp = int(time.time())
+            new_collection_name = f"{self.collection_name}_v{expected_dim}_{timestamp}"
+            logger.info(f"새로운 컬렉션 이름으로 변경: {new_collection_name}")
 
-                # 새로운 컬렉션 생성
-                self.collection_name = new_collection_name
-                self.collection = self.client.get_or_create_collection(
-                    name=new_collection_name, metadata={"hnsw:space": "cosine"}
+            # 새로운 컬렉션 생성
+            self.collection_name = new_collection_name
+            self.collection = self.client.get_or_create_collection(
+                name=new_collection_name, metadata={"hnsw:space": "cosine"}
+            )
+            logger.info("새로운 컬렉션으로 진행합니다.")
+
+        elif self.on_dim_mismatch == "drop":
+            self.client.delete_collection(name=self.collection_name)
+            self.collection = self.client.get_or_create_collection(
+                name=self.collection_name, metadata={"hnsw:space": "cosine"}
+            )
+            with self.fts_conn:
+                self.fts_conn.execute(
+                    "DELETE FROM docs WHERE collection = ?",
+                    (self.collection_name,),
                 )
-                logger.info("새로운 컬렉션으로 진행합니다.")
-                break
-
-            elif choice == "2":
-                confirm = (
-                    input("⚠️  기존 데이터를 모두 삭제하시겠습니까? (yes/no): ")
-                    .strip()
-                    .lower()
+                self.fts_conn.execute(
+                    "DELETE FROM content_hashes WHERE collection = ?",
+                    (self.collection_name,),
                 )
-                if confirm in ["yes", "y"]:
-                    try:
-                        self.client.delete_collection(name=self.collection_name)
-                        self.collection = self.client.get_or_create_collection(
-                            name=self.collection_name, metadata={"hnsw:space": "cosine"}
-                        )
-                        logger.info("기존 컬렉션이 삭제되었습니다.")
-                        break
-                    except Exception as e:
-                        logger.error(f"컬렉션 삭제 중 오류: {e}")
-                        print("컬렉션 삭제에 실패했습니다. 다른 방법을 선택해주세요.")
-                else:
-                    print("삭제를 취소했습니다. 다른 방법을 선택해주세요.")
-
-            elif choice == "3":
-                logger.info("사용자가 작업을 중단했습니다.")
-                raise SystemExit("임베딩 차원 불일치로 인해 작업을 중단합니다.")
+            logger.info("기존 컬렉션이 삭제되었습니다.")
 
-            else:
-                print("올바른 선택지를 입력해주세요 (1, 2, 또는 3).")
+        else:
+            raise SystemExit("임베딩 차원 불일치로 인해 작업을 중단합니다.")
 
     def add_documents(
         self,
         chunks: List[Dict[str, Any]],
         batch_size: int = 1000,
-        batch_delay: float = 0.5,
     ) -> bool:
-        """청크들을 벡터 저장소에 추가합니다. 대용량 파일을 위한 배치 처리 지원."""
+        """
+        청크들을 벡터 저장소에 추가합니다. 대용량 파일을 위한 배치 처리 지원.
+
+        모든 청크가 저장되었을 때만 True를 반환합니다 (add_documents_prefix 참고).
+        """
+        if not chunks:
+            logger.warning("추가할 청크가 없습니다.")
+            return False
+        return self.add_documents_prefix(chunks, batch_size) == len(chunks)
+
+    def add_documents_prefix(
+        self,
+        chunks: List[Dict[str, Any]],
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        청크들을 순서대로 저장하고, 앞에서부터 저장이 완료된 청크 수를 반환합니다.
+
+        배치별 임베딩 요청은 최대 EMBEDDING_MAX_WORKERS개까지 동시에 실행하고,
+        ChromaDB 저장은 배치 순서대로 수행하며 첫 실패 배치에서 중단합니다.
+        요청은 배포의 분당 토큰(TPM)과 요청 수(RPM) 한도에 맞춰 배치 토큰 수만큼
+        속도 제한됩니다. 배치는 토큰 합 기준으로 구성하며 batch_size는 배치당
+        최대 청크 수입니다.
+        """
+        stored_count = 0
         try:
             if not chunks:
-                logger.warning("추가할 청크가 없습니다.")
-                return False
+                return 0
 
             total_chunks = len(chunks)
             logger.info(f"총 {total_chunks}개 청크를 처리합니다.")
 
-            # 배치 크기 조정 (Azure OpenAI API 제한 고려)
-            if total_chunks > batch_size:
+            # 배치 구성 (Azure OpenAI API의 토큰 기반 제한 고려)
+            batch_spans = self._token_batches(chunks, batch_size)
+            total_batches = len(batch_spans)
+            if total_batches > 1:
                 logger.info(
-                    f"대용량 파일 감지: {total_chunks}개 청크를 {batch_size}개씩 배치로 처리합니다."
+                    f"대용량 파일 감지: {total_chunks}개 청크를 {total_batches}개 배치로 처리합니다."
                 )
 
-                # 배치별로 처리
-                for i in range(0, total_chunks, batch_size):
-                    batch_chunks = chunks[i : i + batch_size]
-                    batch_num = (i // batch_size) + 1
-                    total_batches = (total_chunks + batch_size - 1) // batch_size
-
-                    logger.info(
-                        f"배치 {batch_num}/{total_batches} 처리 중... ({len(batch_chunks)}개 청크)"
+            executor = ThreadPoolExecutor(
+                max_workers=EMBEDDING_MAX_WORKERS, thread_name_prefix="embed"
+            )
+            # 진행 중인 배치 수를 제한하여 메모리 사용량 상한 유지 (배치 끝 인덱스와 함께 보관)
+            in_flight: Deque[Tuple[Future, int]] = deque()
+            try:
+                batch_num = 0
+                stopped = False
+                for start, end, batch_tokens in batch_spans:
+                    in_flight.append(
+                        (
+                            executor.submit(
+                                self._embed_batch,
+                                chunks[start:end],
+                                start,
+                                batch_tokens,
+                            ),
+                            end,
+                        )
                     )
+                    if len(in_flight) < EMBEDDING_MAX_IN_FLIGHT:
+                        continue
+                    batch_num += 1
+                    future, batch_end = in_flight.popleft()
+                    if not self._store_batch(future.result(), batch_num, total_batches):
+                        stopped = True
+                        break
+                    stored_count = batch_end
 
-                    if not self._process_batch(batch_chunks, i, batch_delay):
-                        logger.error(f"배치 {batch_num} 처리 실패")
-                        return False
-
+                while in_flight and not stopped:
+                    batch_num += 1
+                    future, batch_end = in_flight.popleft()
+                    if not self._store_batch(future.result(), batch_num, total_batches):
+                        break
+                    stored_count = batch_end
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+                # 저장하지 못하고 남은 배치의 해시는 재처리할 수 있도록 반환
+                for future, _ in in_flight:
+                    if not future.cancelled() and future.result() is not None:
+                        self._release_hashes(future.result()["hashes"])
+
+            if stored_count == total_chunks and total_batches > 1:
                 logger.info(f"모든 배치 처리 완료: {total_chunks}개 청크")
-                return True
-            else:
-                # 작은 파일은 기존 방식으로 처리
-                return self._process_batch(chunks, 0, batch_delay)
 
         except Exception as e:
             logger.error(f"벡터 저장 중 오류 발생: {e}")
-            return False
 
-    def _process_batch(
+        # 첫 저장 성공 시 컬렉션 검증 기록 생성
+        if stored_count and not self._collection_meta_recorded:
+            self._record_collection_meta()
+        return stored_count
+
+    def _token_batches(
+        self, chunks: List[Dict[str, Any]], max_chunks: int
+    ) -> List[Tuple[int, int, int]]:
+        """
+        청크를 순서대로 묶어 임베딩 배치 구간 (시작, 끝, 토큰 수) 목록을 만듭니다.
+
+        배치당 토큰 합이 EMBEDDING_MAX_BATCH_TOKENS(와 분당 토큰 한도), 청크 수가
+        max_chunks(최대 EMBEDDING_MAX_BATCH_INPUTS)를 넘지 않도록 채웁니다.
+        """
+        contents = [chunk["content"] for chunk in chunks]
+        if TOKEN_ENCODING is not None:
+            token_counts = [
+                len(tokens)
+                for tokens in TOKEN_ENCODING.encode_batch(
+                    contents, disallowed_special=()
+                )
+            ]
+        else:
+            token_counts = [len(content.encode("utf-8")) for content in contents]
+
+        max_chunks = min(max_chunks, EMBEDDING_MAX_BATCH_INPUTS)
+        max_tokens = min(EMBEDDING_MAX_BATCH_TOKENS, self.tpm_limit)
+        spans = []
+        start = 0
+        batch_tokens = 0
+        for i, token_count in enumerate(token_counts):
+            if i > start and (
+                batch_tokens + token_count > max_tokens or i - start >= max_chunks
+            ):
+                spans.append((start, i, batch_tokens))
+                start = i
+                batch_tokens = 0
+            batch_tokens += token_count
+        if start < len(token_counts):
+            spans.append((start, len(token_counts), batch_tokens))
+        return spans
+
+    def _embed_batch(
         self,
         chunks: List[Dict[str, Any]],
-        start_index: int = 0,
-        batch_delay: float = 0.5,
-    ) -> bool:
-        """청크 배치를 처리합니다."""
+        start_index: int,
+        batch_tokens: int,
+    ) -> Optional[Dict[str, Any]]:
+        """청크 배치를 전처리하고 임베딩을 생성합니다 (작업 스레드에서 실행)."""
         try:
             # 청크 내용 추출 및 전처리
             chunk_contents = []
@@ -440,88 +882,208 @@ class VectorStore:
                 content = self._preprocess_text(content)
                 chunk_contents.append(content)
 
-            # 빈 내용 필터링
+            # 빈 내용 및 이미 저장(또는 다른 배치에서 처리 중)된 중복 내용 필터링
             valid_chunks = []
             valid_contents = []
+            valid_hashes = []
+            duplicate_count = 0
             for i, (chunk, content) in enumerate(zip(chunks, chunk_contents)):
-                if content and len(content.strip()) > 10:  # 최소 길이 확인
-                    valid_chunks.append(chunk)
-                    valid_contents.append(content)
-                else:
+                if not content or len(content.strip()) <= 10:  # 최소 길이 확인
                     logger.warning(f"빈 청크 건너뛰기: 인덱스 {start_index + i}")
+                    continue
+
+                content_hash = _content_hash(content)
+                with self._hash_lock:
+                    if content_hash in self._seen_hashes:
+                        duplicate_count += 1
+                        continue
+                    self._seen_hashes.add(content_hash)
+                valid_chunks.append(chunk)
+                valid_contents.append(content)
+                valid_hashes.append(content_hash)
+
+            if duplicate_count:
+                logger.info(f"중복 청크 {duplicate_count}개의 임베딩을 건너뜁니다.")
+
+            # 저장 대기 중인 배치의 임베딩은 연속된 (n, dim) float32 배열로 보관
+            # (float 객체 리스트 대비 메모리 약 1/8, ChromaDB에 변환 없이 그대로 전달)
+            try:
+                embeddings = (
+                    np.ascontiguousarray(
+                        self._embed_with_retry(valid_contents, batch_tokens),
+                        dtype=np.float32,
+                    )
+                    if valid_chunks
+                    else np.empty((0, EMBEDDING_DIMENSION), dtype=np.float32)
+                )
+            except Exception:
+                self._release_hashes(valid_hashes)
+                raise
+
+            return {
+                "chunks": valid_chunks,
+                "contents": valid_contents,
+                "hashes": valid_hashes,
+                "embeddings": embeddings,
+                "start_index": start_index,
+            }
+
+        except Exception as e:
+            logger.error(f"배치 처리 중 오류 발생: {e}")
+            return None
+
+    def _release_hashes(self, hashes: List[str]):
+        """저장하지 못한 청크의 해시를 중복 판별 대상에서 제외합니다."""
+        with self._hash_lock:
+            self._seen_hashes.difference_update(hashes)
+
+    def _embed_with_retry(
+        self, contents: List[str], batch_tokens: int
+    ) -> List[List[float]]:
+        """
+        임베딩 요청 (429 응답 시 Retry-After 또는 지수 백오프 후 재시도)
+
+        매 시도마다 요청 1건과 배치 토큰 수(필터링 전 기준 상한)를 한도에서 차감합니다.
+        """
+        embed_documents = self.embedding_model.embed_documents
+        for attempt in range(1, EMBEDDING_MAX_RETRIES + 1):
+            self._request_limiter.acquire()
+            self._token_limiter.acquire(batch_tokens)
+            try:
+                # config/llm.py의 get_embeddings()를 사용하여 임베딩 생성
+                return embed_documents(contents)
+            except Exception as e:
+                if attempt == EMBEDDING_MAX_RETRIES or not _is_rate_limited(e):
+                    raise
+                delay = _retry_after_seconds(e) or min(2**attempt, 60)
+                logger.warning(
+                    f"임베딩 요청 제한(429), {delay:.1f}초 후 재시도 "
+                    f"({attempt}/{EMBEDDING_MAX_RETRIES})"
+                )
+                time.sleep(delay)
 
-            if not valid_chunks:
-                logger.warning("유효한 청크가 없습니다.")
-                return True  # 빈 청크는 성공으로 처리
+    def _store_batch(
+        self,
+        batch: Optional[Dict[str, Any]],
+        batch_num: int,
+        total_batches: int,
+    ) -> bool:
+        """임베딩이 완료된 배치를 ChromaDB와 FTS5 인덱스에 저장합니다."""
+        if batch is None:
+            logger.error(f"배치 {batch_num} 처리 실패")
+            return False
 
-            # config/llm.py의 get_embeddings()를 사용하여 임베딩 생성
-            embeddings = self.embedding_model.embed_documents(valid_contents)
+        valid_chunks = batch["chunks"]
+        if not valid_chunks:
+            logger.warning("유효한 청크가 없습니다.")
+            return True  # 빈 청크는 성공으로 처리
 
-            # 벡터스토어에 저장할 데이터 준비
-            doc_id = str(uuid.uuid4())
+        if total_batches > 1:
+            logger.info(
+                f"배치 {batch_num}/{total_batches} 저장 중... ({len(valid_chunks)}개 청크)"
+            )
+
+        try:
+            valid_contents = batch["contents"]
+            content_hashes = batch["hashes"]
+            embeddings = batch["embeddings"]
+            start_index = batch["start_index"]
+
+            # 벡터스토어에 저장할 데이터 준비 (배치에 여러 파일이 섞일 수 있어 파일별 doc_id)
+            # 배치 공통 값은 한 번만 계산
+            embedded_at = datetime.now().isoformat()
+            total_chunks = len(valid_chunks)
+            file_fields: Dict[str, Tuple[str, str, str, str]] = {}
             ids = []
             documents = []
             metadatas = []
 
             for i, chunk in enumerate(valid_chunks):
-                chunk_id = f"{doc_id}_chunk_{start_index + i}"
-                ids.append(chunk_id)
-                documents.append(valid_contents[i])
-
                 # 기존 시스템과 동일한 메타데이터 구조
                 metadata = chunk["metadata"].copy()
-
-                # 카테고리 추출 (기존 시스템과 동일한 로직)
                 source_filename = metadata.get("file_name", "")
-                category = self._extract_category(source_filename)
-
-                # 도메인 결정 (기존 시스템과 동일한 로직)
-                domain = "general"
-                financial_keywords = [
-                    "금융",
-                    "법률",
-                    "신용정보",
-                    "KISA",
-                    "NIST",
-                    "ISMS",
-                ]
-                if any(keyword in category for keyword in financial_keywords):
-                    domain = "financial"
-
-                metadata.update(
-                    {
-                        "doc_id": doc_id,
-                        "chunk_id": chunk_id,
-                        "chunk_index": start_index + i,
-                        "source_file": source_filename,
-                        "category": category,
-                        "domain": domain,
-                        "document_type": "chunked_other",
-                        "embedded_at": datetime.now().isoformat(),
-                        "chunk_size": len(valid_contents[i]),
-                        "total_chunks": len(valid_chunks),
-                        "embedding_model": "get_embeddings",
-                        "embedding_dimension": 1536,
-                    }
-                )
+
+                fields = file_fields.get(source_filename)
+                if fields is None:
+                    doc_id = str(uuid.uuid4())
+
+                    # 카테고리 추출 (기존 시스템과 동일한 로직)
+                    category = self._extract_category(source_filename)
+
+                    # 도메인 결정 (기존 시스템과 동일한 로직)
+                    domain = (
+                        "financial"
+                        if any(keyword in category for keyword in _FINANCIAL_KEYWORDS)
+                        else "general"
+                    )
+
+                    fields = (doc_id, f"{doc_id}_chunk_", category, domain)
+                    file_fields[source_filename] = fields
+                doc_id, id_prefix, category, domain = fields
+
+                chunk_id = id_prefix + str(start_index + i)
+                ids.append(chunk_id)
+                documents.append(valid_contents[i])
+
+                metadata["doc_id"] = doc_id
+                metadata["chunk_id"] = chunk_id
+                metadata["chunk_index"] = metadata.get("chunk_index", start_index + i)
+                metadata["source_file"] = source_filename
+                metadata["category"] = category
+                metadata["domain"] = domain
+                metadata["document_type"] = "chunked_other"
+                metadata["embedded_at"] = embedded_at
+                metadata["chunk_size"] = len(valid_contents[i])
+                metadata["total_chunks"] = total_chunks
+                metadata["embedding_model"] = "get_embeddings"
+                metadata["embedding_dimension"] = EMBEDDING_DIMENSION
+                metadata["content_hash"] = content_hashes[i]
 
                 metadatas.append(metadata)
 
-            # ChromaDB에 직접 저장
+            # ChromaDB에 직접 저장 (float32 2D 배열을 리스트 변환 없이 전달)
             self.collection.add(
                 ids=ids, documents=documents, embeddings=embeddings, metadatas=metadatas
             )
-
-            # 배치 간 대기 (API 안정성을 위해)
-            if batch_delay > 0:
-                time.sleep(batch_delay)
+            self._add_to_fts_index(ids, documents, metadatas)
 
             return True
 
         except Exception as e:
+            self._release_hashes(batch["hashes"])
             logger.error(f"배치 처리 중 오류 발생: {e}")
+            logger.error(f"배치 {batch_num} 처리 실패")
             return False
 
+    def _add_to_fts_index(
+        self,
+        ids: List[str],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+    ):
+        """저장한 청크를 키워드 검색용 FTS5 인덱스에 함께 기록합니다."""
+        with self.fts_conn:
+            self.fts_conn.executemany(
+                "INSERT INTO docs (id, collection, content, metadata_json) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        chunk_id,
+                        self.collection_name,
+                        document,
+                        json.dumps(metadata, ensure_ascii=False),
+                    )
+                    for chunk_id, document, metadata in zip(ids, documents, metadatas)
+                ],
+            )
+            self.fts_conn.executemany(
+                "INSERT OR IGNORE INTO content_hashes (collection, hash) VALUES (?, ?)",
+                [
+                    (self.collection_name, metadata["content_hash"])
+                    for metadata in metadatas
+                ],
+            )
+
     def _preprocess_text(self, text: str) -> str:
         """텍스트 전처리를 수행합니다."""
         if not text:
@@ -530,30 +1092,26 @@ class VectorStore:
         # 인코딩 문제 해결
         try:
             # 유니코드 정규화
-            import unicodedata
-
             text = unicodedata.normalize("NFKC", text)
         except:
             pass
 
         # 특수 문자 처리
-        import re
-
         # 연속된 공백 제거
-        text = re.sub(r"\s+", " ", text)
+        text = _WS_RE.sub(" ", text)
 
         # 제어 문자 제거 (줄바꿈과 탭 제외)
-        text = re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]", "", text)
+        text = _CTRL_RE.sub("", text)
 
         # 너무 긴 연속된 문자 제거 (스팸 방지)
-        text = re.sub(r"(.)\1{50,}", r"\1" * 10, text)
+        text = _REPEAT_RE.sub(_REPEAT_REPL, text)
 
         return text.strip()
 
     def _extract_category(self, filename: str) -> str:
         """파일명에서 카테고리를 추출합니다."""
         # [기관명] 패턴 추출
-        match = re.search(r"\[([^\]]+)\]", filename)
+        match = _CATEGORY_RE.search(filename)
         if match:
             return f"[{match.group(1)}]"
         return "기타"
@@ -581,13 +1139,21 @@ class VectorizationPipeline:
         collection_name: str = "cloudregix_documents",
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
+        on_dim_mismatch: DimMismatchPolicy = "new",
+        tpm_limit: int = EMBEDDING_TPM_LIMIT,
+        rpm_limit: int = EMBEDDING_RPM_LIMIT,
     ):
         self.input_dir = Path(input_dir)
         self.parser = DocumentParser()
         self.chunker = DocumentChunker(
             chunk_size=chunk_size, chunk_overlap=chunk_overlap
         )
-        self.vector_store = VectorStore(collection_name)
+        self.vector_store = VectorStore(
+            collection_name,
+            on_dim_mismatch=on_dim_mismatch,
+            tpm_limit=tpm_limit,
+            rpm_limit=rpm_limit,
+        )
 
         # 입력 디렉토리 생성
         self.input_dir.mkdir(parents=True, exist_ok=True)
@@ -625,42 +1191,51 @@ class VectorizationPipeline:
             "total_chunks": 0,
         }
 
-        for file_path in files:
-            try:
-                logger.info(f"처리 중: {file_path.relative_to(self.input_dir)}")
+        # 파싱(프로세스 풀) → 청킹 → 임베딩/저장(전용 스레드) 단계를 겹쳐 실행
+        results_lock = threading.Lock()
+        store_queue: "queue.Queue[Optional[Tuple[Path, List[Dict[str, Any]]]]]" = (
+            queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        )
+        store_thread = threading.Thread(
+            target=self._store_worker,
+            args=(store_queue, results, results_lock),
+            name="vector-store",
+            daemon=True,
+        )
+        store_thread.start()
 
-                # 1. 파일 파싱
-                parsed_data = self.parser.parse_file(file_path)
-                if not parsed_data:
-                    results["failed_files"] += 1
-                    results["failed_file_list"].append(str(file_path))
-                    continue
+        def record_failure(file_path: Path):
+            with results_lock:
+                results["failed_files"] += 1
+                results["failed_file_list"].append(str(file_path))
 
-                # 2. 문서 청킹
-                chunks = self.chunker.chunk_document(
-                    parsed_data["content"], parsed_data["metadata"]
-                )
+        try:
+            for file_path, parsed_data in self._parse_files(files):
+                try:
+                    logger.info(f"처리 중: {file_path.relative_to(self.input_dir)}")
 
-                if not chunks:
-                    logger.warning(f"청크가 생성되지 않았습니다: {file_path.name}")
-                    results["failed_files"] += 1
-                    results["failed_file_list"].append(str(file_path))
-                    continue
+                    # 1. 파일 파싱 결과 확인
+                    if not parsed_data:
+                        record_failure(file_path)
+                        continue
 
-                # 3. 벡터 저장 (적응형 배치 크기)
-                batch_size = self._calculate_batch_size(len(chunks))
-                if self.vector_store.add_documents(chunks, batch_size=batch_size):
-                    results["processed_files"] += 1
-                    results["total_chunks"] += len(chunks)
-                    logger.info(f"완료: {file_path.name} ({len(chunks)}개 청크)")
-                else:
-                    results["failed_files"] += 1
-                    results["failed_file_list"].append(str(file_path))
+                    # 2. 문서 청킹
+                    chunks = self.chunker.chunk_parsed(parsed_data)
 
-            except Exception as e:
-                logger.error(f"파일 처리 중 오류 ({file_path.name}): {e}")
-                results["failed_files"] += 1
-                results["failed_file_list"].append(str(file_path))
+                    if not chunks:
+                        logger.warning(f"청크가 생성되지 않았습니다: {file_path.name}")
+                        record_failure(file_path)
+                        continue
+
+                    # 3. 벡터 저장 단계로 전달 (큐가 가득 차면 대기)
+                    store_queue.put((file_path, chunks))
+
+                except Exception as e:
+                    logger.error(f"파일 처리 중 오류 ({file_path.name}): {e}")
+                    record_failure(file_path)
+        finally:
+            store_queue.put(None)
+            store_thread.join()
 
         # 실행 시간 계산
         end_time = time.time()
@@ -678,34 +1253,108 @@ class VectorizationPipeline:
 
         return results
 
-    def _calculate_batch_size(self, chunk_count: int) -> int:
-        """청크 수에 따라 적응형 배치 크기를 계산합니다."""
-        if chunk_count > 5000:
-            return 300  # 매우 큰 파일
-        elif chunk_count > 2000:
-            return 500  # 큰 파일
-        elif chunk_count > 1000:
-            return 800  # 중간 파일
-        else:
-            return 1000  # 작은 파일
+    def _parse_files(self, files: List[Path]):
+        """
+        파일들을 프로세스 풀에서 병렬 파싱하여 입력 순서대로 반환합니다.
+
+        진행 중인 파싱 작업 수를 PARSE_MAX_IN_FLIGHT로 제한하여
+        파싱 결과가 메모리에 과도하게 쌓이지 않도록 합니다.
+
+        Yields:
+            (파일 경로, 파싱 결과 또는 None)
+        """
+        # 저장 스레드와 임베딩 스레드 풀이 이미 실행 중이므로 fork 대신 spawn으로
+        # 작업 프로세스를 시작 (fork 시 다른 스레드가 잡고 있던 잠금이 복제될 수 있음)
+        with ProcessPoolExecutor(
+            max_workers=PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as parse_pool:
+            in_flight: Deque[Tuple[Path, Future]] = deque()
+            for file_path in files:
+                # 지연 읽기 형식은 프로세스 간 전달할 수 없으므로 현재 프로세스에서 파싱
+                if file_path.suffix.lower() in self.parser.streamed_extensions:
+                    future = Future()
+                    future.set_result(self.parser.parse_file(file_path))
+                else:
+                    future = parse_pool.submit(self.parser.parse_file, file_path)
+                in_flight.append((file_path, future))
+                if len(in_flight) >= PARSE_MAX_IN_FLIGHT:
+                    yield self._parse_result(*in_flight.popleft())
+            while in_flight:
+                yield self._parse_result(*in_flight.popleft())
+
+    def _parse_result(
+        self, file_path: Path, future: Future
+    ) -> Tuple[Path, Optional[Dict[str, Any]]]:
+        """파싱 작업 결과 조회 (작업 프로세스 오류는 파싱 실패로 처리)"""
+        try:
+            return file_path, future.result()
+        except Exception as e:
+            logger.error(f"파일 파싱 중 오류 발생 ({file_path}): {e}")
+            return file_path, None
+
+    def _store_worker(
+        self,
+        store_queue: "queue.Queue[Optional[Tuple[Path, List[Dict[str, Any]]]]]",
+        results: Dict[str, Any],
+        results_lock: threading.Lock,
+    ):
+        """
+        청킹된 파일을 큐에서 받아 임베딩 후 저장합니다 (None 수신 시 종료).
+
+        작은 파일마다 ChromaDB 쓰기 트랜잭션이 발생하지 않도록 여러 파일의 청크를
+        CHROMA_ADD_BATCH_SIZE개 이상 모아서 저장합니다. 저장은 순서대로 진행되므로
+        저장 완료된 청크 수로 파일별 청크 구간의 저장 여부를 판단합니다.
+        """
+        pending_chunks: List[Dict[str, Any]] = []
+        pending_files: List[Tuple[Path, int]] = []
+
+        def flush():
+            if not pending_chunks:
+                return
+            try:
+                stored_count = self.vector_store.add_documents_prefix(
+                    pending_chunks, batch_size=CHROMA_ADD_BATCH_SIZE
+                )
+            except Exception as e:
+                logger.error(f"벡터 저장 중 오류 발생: {e}")
+                stored_count = 0
+
+            with results_lock:
+                file_end = 0
+                for file_path, chunk_count in pending_files:
+                    # 파일의 청크가 모두 저장 완료 구간 안에 있어야 성공
+                    file_end += chunk_count
+                    if file_end <= stored_count:
+                        results["processed_files"] += 1
+                        results["total_chunks"] += chunk_count
+                        logger.info(f"완료: {file_path.name} ({chunk_count}개 청크)")
+                    else:
+                        results["failed_files"] += 1
+                        results["failed_file_list"].append(str(file_path))
+
+            pending_chunks.clear()
+            pending_files.clear()
+
+        while True:
+            item = store_queue.get()
+            if item is None:
+                flush()
+                return
+
+            file_path, chunks = item
+            pending_chunks.extend(chunks)
+            pending_files.append((file_path, len(chunks)))
+            if len(pending_chunks) >= CHROMA_ADD_BATCH_SIZE:
+                flush()
 
     def _find_files_recursive(self) -> List[Path]:
         """처리할 파일들을 재귀적으로 찾습니다 (하위 디렉토리 포함)."""
-        files = []
-
         # 지원하는 확장자
         supported_extensions = self.parser.supported_extensions
 
-        # 재귀적으로 파일 검색
-        for ext in supported_extensions:
-            # 직접 파일 검색
-            files.extend(self.input_dir.glob(f"*{ext}"))
-            # 하위 디렉토리 파일 검색
-            files.extend(self.input_dir.glob(f"**/*{ext}"))
-
-        # 중복 제거 및 정렬
-        files = list(set(files))
-        files.sort()
+        # 한 번의 재귀 탐색으로 지원 확장자 파일 수집 및 정렬
+        files = sorted(_iter_files(self.input_dir, supported_extensions))
 
         logger.info(f"파일 검색 완료: {len(files)}개 파일 발견")
         for file_path in files:
@@ -738,7 +1387,7 @@ class VectorizationPipeline:
             logger.info(f"저장 위치: {stats.get('persist_directory', 'N/A')}")
 
     def retry_failed_files(
-        self, failed_files: List[str], batch_delay: float = 0.5
+        self, failed_files: List[str], batch_size: int = 500
     ) -> Dict[str, Any]:
         """실패한 파일들을 재처리합니다."""
         logger.info("=" * 60)
@@ -763,7 +1412,6 @@ class VectorizationPipeline:
             }
 
         logger.info(f"재처리할 파일 수: {len(failed_paths)}")
-        logger.info(f"배치 지연 시간: {batch_delay}초")
 
         # 파일별 처리
         results = {
@@ -786,9 +1434,7 @@ class VectorizationPipeline:
                     continue
 
                 # 2. 문서 청킹
-                chunks = self.chunker.chunk_document(
-                    parsed_data["content"], parsed_data["metadata"]
-                )
+                chunks = self.chunker.chunk_parsed(parsed_data)
 
                 if not chunks:
                     logger.warning(f"청크가 생성되지 않았습니다: {file_path.name}")
@@ -796,17 +1442,11 @@ class VectorizationPipeline:
                     results["failed_file_list"].append(str(file_path))
                     continue
 
-                # 3. 벡터 저장 (배치 크기를 더 작게 설정)
+                # 3. 벡터 저장 (요청 속도는 VectorStore의 TPM/RPM 제한기가 조절)
                 logger.info(
                     f"대용량 파일 처리: {file_path.name} ({len(chunks)}개 청크)"
                 )
-                batch_size = (
-                    200 if batch_delay > 0.8 else 500
-                )  # 극한 최적화 모드에서는 더 작은 배치
-
-                if self.vector_store.add_documents(
-                    chunks, batch_size=batch_size, batch_delay=batch_delay
-                ):
+                if self.vector_store.add_documents(chunks, batch_size=batch_size):
                     results["processed_files"] += 1
                     results["total_chunks"] += len(chunks)
                     logger.info(f"재처리 완료: {file_path.name} ({len(chunks)}개 청크)")
@@ -858,8 +1498,39 @@ class VectorizationPipeline:
             logger.info(f"벡터 저장소 총 문서 수: {stats.get('document_count', 0)}")
 
 
+def _save_results(results: Dict[str, Any], output_file: Path):
+    """
+    파이프라인 결과를 JSON 파일로 저장합니다.
+
+    결과는 집계 값과 실패 파일 목록뿐이므로 한 번에 직렬화한 뒤 한 번의 쓰기로 기록합니다.
+    orjson은 UTF-8로 직접 직렬화하므로 한글 파일명도 이스케이프 없이 기록됩니다.
+    """
+    output_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+
+
 def main():
     """메인 실행 함수"""
+    arg_parser = argparse.ArgumentParser(description="독립적인 문서 벡터화 스크립트")
+    arg_parser.add_argument(
+        "--on-dim-mismatch",
+        choices=DIM_MISMATCH_POLICIES,
+        default="new",
+        help="기존 컬렉션과 임베딩 차원이 다를 때 처리 방식 (기본값: new)",
+    )
+    arg_parser.add_argument(
+        "--tpm-limit",
+        type=int,
+        default=EMBEDDING_TPM_LIMIT,
+        help=f"임베딩 배포의 분당 토큰 한도 (기본값: {EMBEDDING_TPM_LIMIT})",
+    )
+    arg_parser.add_argument(
+        "--rpm-limit",
+        type=int,
+        default=EMBEDDING_RPM_LIMIT,
+        help=f"임베딩 배포의 분당 요청 한도 (기본값: {EMBEDDING_RPM_LIMIT})",
+    )
+    args = arg_parser.parse_args()
+
     print("🚀 독립적인 문서 벡터화 스크립트")
     print("=" * 60)
 
@@ -912,13 +1583,16 @@ def main():
 
         # 재처리 실행
         try:
-            pipeline = VectorizationPipeline()
+            pipeline = VectorizationPipeline(
+                on_dim_mismatch=args.on_dim_mismatch,
+                tpm_limit=args.tpm_limit,
+                rpm_limit=args.rpm_limit,
+            )
             results = pipeline.retry_failed_files(failed_files)
 
             # 결과 파일 저장
             output_file = Path("retry_vectorization_results.json")
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
+            _save_results(results, output_file)
 
             print(f"\n📄 재처리 결과가 저장되었습니다: {output_file}")
 
@@ -955,14 +1629,9 @@ def main():
         print("디렉토리를 생성하고 문서 파일들을 넣어주세요.")
         return
 
-    # 파일 확인 (하위 디렉토리 포함)
+    # 파일 확인 (하위 디렉토리 포함, 한 번의 탐색으로 각 파일을 한 번씩 수집)
     supported_exts = {".pdf", ".docx", ".xlsx", ".xls", ".txt"}
-    files = []
-    for ext in supported_exts:
-        files.extend(input_dir.glob(f"*{ext}"))
-        files.extend(input_dir.glob(f"**/*{ext}"))
-
-    files = list(set(files))  # 중복 제거
+    files = list(_iter_files(input_dir, supported_exts))
 
     if not files:
         print(f"\n❌ 처리할 파일이 없습니다: {input_dir}")
@@ -982,13 +1651,16 @@ def main():
 
     # 벡터화 실행
     try:
-        pipeline = VectorizationPipeline()
+        pipeline = VectorizationPipeline(
+            on_dim_mismatch=args.on_dim_mismatch,
+            tpm_limit=args.tpm_limit,
+            rpm_limit=args.rpm_limit,
+        )
         results = pipeline.run()
 
         # 결과 파일 저장
         output_file = Path("vectorization_results.json")
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        _save_results(results, output_file)
 
         print(f"\n📄 결과가 저장되었습니다: {output_file}")
 
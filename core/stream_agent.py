@@ -1,3 +1,5 @@
+from typing import Any, Dict, Generator
+
 from core import BaseAgent
 
 
@@ -9,3 +11,23 @@ class StreamAgent(BaseAgent):
     def __init__(self, name: str):
         super().__init__(name)
         self.streaming = True
+
+    def stream(self, inputs: Dict[str, Any]) -> Generator[str, None, None]:
+        """
+        LLM 응답을 토큰 단위로 스트리밍하는 메서드
+
+        전체 응답을 기다리지 않고 생성되는 즉시 토큰을 전달하여
+        첫 토큰까지의 지연(TTFT)을 줄입니다.
+        결합된 전체 텍스트는 호출 측에서 postprocess로 전달합니다.
+
+        Args:
+            inputs (Dict[str, Any]): 입력 데이터
+
+        Yields:
+            str: LLM 응답 토큰
+        """
+        inputs = self.preprocess(inputs)
+        prompt = self._create_prompt(inputs)
+        for chunk in self.llm.stream(prompt):
+            if chunk.content:
+                yield chunk.content
@@ -7,15 +7,60 @@ FastMCP 서버와 Model Context Protocol을 통해 통신하는 클라이언트
 langchain-mcp-adapters 라이브러리를 사용하여 올바른 MCP 프로토콜로 통신
 """
 
+import atexit
 import logging
-from typing import Dict, Any, List
+import threading
+from typing import Dict, Any, List, Optional, Tuple
 import asyncio
+import anyio
+import httpx
+from langchain_core.tools import BaseTool
 from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import load_mcp_tools
 from mcp import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
 
 logger = logging.getLogger(__name__)
 
+# MCP 서버 HTTP 연결 풀 설정 (keep-alive로 TCP/TLS 연결 재사용)
+MCP_HTTP_TIMEOUT = 30.0
+MCP_CONNECT_TIMEOUT = 5.0
+_MCP_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# 세션 재연결이 필요한 전송 계층 오류 (도구 실행 오류는 제외)
+_CONNECTION_ERRORS = (
+    httpx.TransportError,
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+)
+
+
+def _create_http_client(
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[httpx.Timeout] = None,
+    auth: Optional[httpx.Auth] = None,
+) -> httpx.AsyncClient:
+    """
+    MCP 전송 계층용 httpx.AsyncClient 생성 (httpx_client_factory)
+
+    전송 계층이 지정한 읽기 타임아웃(SSE 대기 포함)은 유지하고, 연결 타임아웃을
+    짧게 두며 풀 대기 타임아웃은 두지 않습니다. HTTPS 서버와는 HTTP/2로 협상하여
+    동시 도구 호출이 하나의 연결을 공유합니다.
+    """
+    read_timeout = timeout.read if timeout is not None else MCP_HTTP_TIMEOUT
+    return httpx.AsyncClient(
+        headers=headers,
+        auth=auth,
+        follow_redirects=True,
+        timeout=httpx.Timeout(read_timeout, connect=MCP_CONNECT_TIMEOUT, pool=None),
+        limits=_MCP_HTTP_LIMITS,
+        http2=True,
+    )
+
 
 class MCPClient:
     """langchain-mcp-adapters를 통한 MCP 서버와 통신하는 클라이언트"""
@@ -32,6 +77,7 @@ class MCPClient:
         self.read_stream = None
         self.write_stream = None
         self.client_session = None
+        self._transport = None
 
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 시작"""
@@ -47,10 +93,13 @@ class MCPClient:
         try:
             logger.info(f"🔗 MCP 서버에 연결 중: {self.mcp_server_url}")
 
-            # streamablehttp_client를 사용하여 연결
-            self.read_stream, self.write_stream, _ = await streamablehttp_client(
-                self.mcp_server_url
-            ).__aenter__()
+            # streamablehttp_client를 사용하여 연결 (연결 해제 시 정리하도록 보관)
+            self._transport = streamablehttp_client(
+                self.mcp_server_url, httpx_client_factory=_create_http_client
+            )
+            self.read_stream, self.write_stream, _ = (
+                await self._transport.__aenter__()
+            )
             self.client_session = ClientSession(self.read_stream, self.write_stream)
             await self.client_session.__aenter__()
 
@@ -67,9 +116,11 @@ class MCPClient:
         try:
             if self.client_session:
                 await self.client_session.__aexit__(None, None, None)
-            if self.read_stream and self.write_stream:
-                # streamablehttp_client 정리는 자동으로 처리됨
-                pass
+                self.client_session = None
+            if self._transport:
+                # HTTP 클라이언트와 연결 풀 정리
+                await self._transport.__aexit__(None, None, None)
+                self._transport = None
             logger.info("🔌 MCP 서버 연결 해제")
         except Exception as e:
             logger.error(f"❌ 연결 해제 중 오류: {str(e)}")
@@ -122,6 +173,22 @@ class MCPClient:
                 "mcp_context": {"status": "error", "tool_name": tool_name},
             }
 
+    async def call_tools_batch(
+        self, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 MCP 도구를 같은 세션에서 동시에 호출
+
+        Args:
+            calls: (도구 이름, 매개변수) 목록
+
+        Returns:
+            호출 순서와 같은 순서의 도구 실행 결과 목록
+        """
+        return await asyncio.gather(
+            *(self.call_tool(tool_name, **arguments) for tool_name, arguments in calls)
+        )
+
     async def search_documents(self, query: str, top_k: int = 5) -> Dict[str, Any]:
         """
         문서 검색 도구 호출
@@ -228,65 +295,30 @@ class SyncMCPClient:
         """
         self.mcp_server_url = mcp_server_url
         self.multi_client = MultiServerMCPClient(
-            {"default": {"url": mcp_server_url, "transport": "streamable_http"}}
+            {
+                "default": {
+                    "url": mcp_server_url,
+                    "transport": "streamable_http",
+                    "httpx_client_factory": _create_http_client,
+                }
+            }
         )
 
+        # 장기 유지 MCP 세션과 이름별 도구 캐시 (백그라운드 이벤트 루프에서만 사용)
+        self._session_lock: Optional[asyncio.Lock] = None
+        self._session_stop: Optional[asyncio.Event] = None
+        self._session_task: Optional[asyncio.Task] = None
+        self._tool_cache: Dict[str, BaseTool] = {}
+
     def _run_async(self, coro):
-        """비동기 함수를 동기적으로 실행"""
-        try:
-            # 현재 실행 중인 이벤트 루프가 있는지 확인
-            loop = asyncio.get_running_loop()
-            # 이미 실행 중인 루프가 있으면 새 스레드에서 실행
-            import concurrent.futures
-            import threading
-
-            def run_in_thread():
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    return new_loop.run_until_complete(coro)
-                finally:
-                    new_loop.close()
-
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(run_in_thread)
-                return future.result()
-
-        except RuntimeError:
-            # 실행 중인 이벤트 루프가 없으면 새로 생성
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(coro)
-            finally:
-                loop.close()
+        """비동기 함수를 백그라운드 이벤트 루프에서 실행하고 결과를 기다림"""
+        return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
 
     def search_documents(self, query: str, top_k: int = 5) -> Dict[str, Any]:
         """동기식 문서 검색"""
-
-        async def _search():
-            try:
-                # MultiServerMCPClient를 사용하여 도구 가져오기
-                tools = await self.multi_client.get_tools()
-
-                # search_documents 도구 찾기
-                search_tool = None
-                for tool in tools:
-                    if tool.name == "search_documents":
-                        search_tool = tool
-                        break
-
-                if not search_tool:
-                    return {"error": "search_documents 도구를 찾을 수 없습니다"}
-
-                # 도구 실행
-                result = await search_tool.ainvoke({"query": query, "top_k": top_k})
-                return {"result": result, "status": "success"}
-
-            except Exception as e:
-                return {"error": f"검색 실패: {str(e)}"}
-
-        return self._run_async(_search())
+        return self._run_async(
+            self._call_tool("search_documents", {"query": query, "top_k": top_k}, "검색")
+        )
 
     def summarize_report(
         self,
@@ -294,32 +326,13 @@ class SyncMCPClient:
         title: str = "클라우드 전환 제안서",
     ) -> Dict[str, Any]:
         """동기식 클라우드 전환 제안서 요약"""
-
-        async def _summarize():
-            try:
-                tools = await self.multi_client.get_tools()
-
-                summary_tool = None
-                for tool in tools:
-                    if tool.name == "summarize_report":
-                        summary_tool = tool
-                        break
-
-                if not summary_tool:
-                    return {"error": "summarize_report 도구를 찾을 수 없습니다"}
-
-                result = await summary_tool.ainvoke(
-                    {
-                        "content": content,
-                        "title": title,
-                    }
-                )
-                return {"result": result, "status": "success"}
-
-            except Exception as e:
-                return {"error": f"클라우드 전환 제안서 요약 실패: {str(e)}"}
-
-        return self._run_async(_summarize())
+        return self._run_async(
+            self._call_tool(
+                "summarize_report",
+                {"content": content, "title": title},
+                "클라우드 전환 제안서 요약",
+            )
+        )
 
     def create_slide_draft(
         self,
@@ -327,69 +340,147 @@ class SyncMCPClient:
         user_input: str,
     ) -> Dict[str, Any]:
         """동기식 슬라이드 초안 생성"""
-
-        async def _create_slide():
-            try:
-                tools = await self.multi_client.get_tools()
-
-                slide_tool = None
-                for tool in tools:
-                    if tool.name == "create_slide_draft":
-                        slide_tool = tool
-                        break
-
-                if not slide_tool:
-                    return {"error": "create_slide_draft 도구를 찾을 수 없습니다"}
-
-                result = await slide_tool.ainvoke(
-                    {
-                        "search_results": search_results,
-                        "user_input": user_input,
-                    }
-                )
-                return {"result": result, "status": "success"}
-
-            except Exception as e:
-                return {"error": f"슬라이드 초안 생성 실패: {str(e)}"}
-
-        return self._run_async(_create_slide())
+        return self._run_async(
+            self._call_tool(
+                "create_slide_draft",
+                {"search_results": search_results, "user_input": user_input},
+                "슬라이드 초안 생성",
+            )
+        )
 
     def get_tool_status(self) -> Dict[str, Any]:
         """동기식 도구 상태 확인"""
+        return self._run_async(
+            self._call_tool("get_tool_status", {}, "도구 상태 확인")
+        )
 
-        async def _get_status():
-            try:
-                tools = await self.multi_client.get_tools()
-
-                status_tool = None
-                for tool in tools:
-                    if tool.name == "get_tool_status":
-                        status_tool = tool
-                        break
+    def batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        동기식 다중 도구 호출 (유지 중인 세션에서 동시에 실행)
 
-                if not status_tool:
-                    return {"error": "get_tool_status 도구를 찾을 수 없습니다"}
+        Args:
+            calls: (도구 이름, 매개변수) 목록
 
-                result = await status_tool.ainvoke({})
-                return {"result": result, "status": "success"}
+        Returns:
+            호출 순서와 같은 순서의 도구 실행 결과 목록
+        """
 
-            except Exception as e:
-                return {"error": f"도구 상태 확인 실패: {str(e)}"}
+        async def _batch():
+            return await asyncio.gather(
+                *(
+                    self._call_tool(tool_name, arguments, f"{tool_name} 호출")
+                    for tool_name, arguments in calls
+                )
+            )
 
-        return self._run_async(_get_status())
+        return self._run_async(_batch())
 
     def health_check(self) -> bool:
         """동기식 헬스 체크"""
 
         async def _health():
             try:
-                tools = await self.multi_client.get_tools()
-                return len(tools) > 0
+                return len(await self._get_tools()) > 0
             except Exception:
+                await self._close_session()
                 return False
 
         return self._run_async(_health())
 
+    def shutdown(self):
+        """유지 중인 MCP 세션 종료"""
+        self._run_async(self._close_session())
+
+    async def _call_tool(
+        self, tool_name: str, arguments: Dict[str, Any], action: str
+    ) -> Dict[str, Any]:
+        """
+        캐시된 도구로 MCP 도구 호출
+
+        세션은 여러 요청이 공유하므로 연결 오류일 때만 닫아 다음 호출에서 재연결하고,
+        도구 자체의 오류(잘못된 매개변수 등)는 세션을 유지한 채 오류로 반환합니다.
+        """
+        try:
+            tool = (await self._get_tools()).get(tool_name)
+            if tool is None:
+                return {"error": f"{tool_name} 도구를 찾을 수 없습니다"}
+
+            result = await tool.ainvoke(arguments)
+            return {"result": result, "status": "success"}
+
+        except Exception as e:
+            if _is_connection_error(e):
+                await self._close_session()
+            return {"error": f"{action} 실패: {str(e)}"}
+
+    async def _get_tools(self) -> Dict[str, BaseTool]:
+        """
+        MCP 세션을 열고 도구 목록을 한 번만 조회하여 이름별로 캐시
+        """
+        if self._session_lock is None:
+            self._session_lock = asyncio.Lock()
+
+        async with self._session_lock:
+            if self._session_task is None or self._session_task.done():
+                ready = asyncio.get_running_loop().create_future()
+                self._session_stop = asyncio.Event()
+                self._session_task = asyncio.create_task(
+                    self._hold_session(ready, self._session_stop)
+                )
+                self._tool_cache = await ready
+        return self._tool_cache
+
+    async def _hold_session(self, ready: asyncio.Future, stop: asyncio.Event):
+        """
+        MCP 세션을 열어 종료 요청 전까지 유지하는 작업
+
+        streamable HTTP 전송은 연 작업에서 닫아야 하므로 전용 작업이 세션을 소유합니다.
+        """
+        try:
+            async with self.multi_client.session("default") as session:
+                tools = await load_mcp_tools(session)
+                ready.set_result({tool.name: tool for tool in tools})
+                await stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"MCP 세션 종료 중 오류: {str(e)}")
+
+    async def _close_session(self):
+        """유지 중인 MCP 세션 종료 및 도구 캐시 초기화"""
+        task, self._session_task = self._session_task, None
+        self._tool_cache = {}
+        if task is not None and not task.done():
+            self._session_stop.set()
+            await task
+
+
+def _is_connection_error(error: BaseException) -> bool:
+    """MCP 세션을 다시 열어야 하는 전송/연결 오류인지 확인"""
+    if isinstance(error, McpError):
+        return error.error.code == CONNECTION_CLOSED
+    return isinstance(error, _CONNECTION_ERRORS)
+
+
+# 동기 호출을 처리하는 전용 백그라운드 이벤트 루프 (MCP 세션과 연결 풀 유지)
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """백그라운드 이벤트 루프 반환 (최초 호출 시 전용 스레드에서 시작)"""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_background_loop.run_forever,
+                name="mcp-client-loop",
+                daemon=True,
+            ).start()
+    return _background_loop
+
 
 # 전역 MCP 클라이언트 인스턴스
 _mcp_client = None
@@ -400,4 +491,5 @@ def get_mcp_client() -> SyncMCPClient:
     global _mcp_client
     if _mcp_client is None:
         _mcp_client = SyncMCPClient("http://localhost:8001/tools")
+        atexit.register(_mcp_client.shutdown)
     return _mcp_client
@@ -6,14 +6,10 @@
 RAG 검색 및 보고서 요약 도구들을 MCP 프로토콜로 제공합니다.
 """
 
-import sys
 import os
 from typing import Dict, Any, List
 import logging
 
-# 현재 디렉토리를 Python 패스에 추가
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from fastmcp import FastMCP
 from tools import RAGRetrieverTool, ReportSummaryTool, SlideDraftTool
 
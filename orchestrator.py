@@ -190,6 +190,7 @@ class CloudGovernanceOrchestrator:
                 "execution_steps": execution_steps,
                 "execution_plan": execution_steps,
                 "dependency_graph": dependency_graph,
+                "needs_rag": plan_result.get("needs_rag", True),  # RAG 검색 필요 여부
                 "execution_results": [],  # 단계별 결과를 누적할 리스트 추가
                 "router_result": router_result,  # 전체 router 결과도 저장
             }
@@ -353,11 +354,20 @@ class CloudGovernanceOrchestrator:
                 "progress": 0.9,
             }
 
-            # 5단계: Answer Agent - 최종 응답 생성
+            # 5단계: Answer Agent - 최종 응답 생성 (토큰 단위 스트리밍)
             logger.info(f"\n✨ [STEP 5] Answer Agent 실행 중...")
-            final_response = self._generate_final_response(
+            answer_input = self._build_answer_input(
                 execution_results, trace_analysis, execution_context
             )
+            answer_tokens = []
+            for token in self.answer_agent.stream(answer_input):
+                answer_tokens.append(token)
+                yield {
+                    "type": "answer_delta",
+                    "stage": "final_response",
+                    "content": token,
+                }
+            final_response = self.answer_agent.postprocess("".join(answer_tokens))
             logger.info(f"   ✅ [ANSWER] 최종 응답 생성 완료")
 
             total_time = time.time() - start_time
@@ -641,6 +651,18 @@ class CloudGovernanceOrchestrator:
         context: Dict[str, Any],
     ) -> Dict[str, Any]:
         """최종 응답 생성"""
+        answer_input = self._build_answer_input(
+            execution_results, trace_analysis, context
+        )
+        return self.answer_agent(answer_input)
+
+    def _build_answer_input(
+        self,
+        execution_results: List[Dict[str, Any]],
+        trace_analysis: Dict[str, Any],
+        context: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Answer Agent 입력 구성"""
         # 성공한 결과들에서 최종 답변 추출
         successful_results = [
             r for r in execution_results if r.get("status") == "success"
@@ -671,7 +693,7 @@ class CloudGovernanceOrchestrator:
                     break
 
         # Answer Agent 입력 구성
-        answer_input = {
+        return {
             "agent_type": "hybrid_execution",
             "intent": context.get("intent"),  # Router Agent에서 받은 intent 전달
             "answer_content": answer_content,
@@ -689,8 +711,6 @@ class CloudGovernanceOrchestrator:
             "slide_html": slide_html,
         }
 
-        return self.answer_agent(answer_input)
-
     def _create_error_response(
         self, error_message: str, execution_time: float
     ) -> Dict[str, Any]:
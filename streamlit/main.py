@@ -1080,8 +1080,29 @@ def process_streaming_response(
                     elif "chunk" in json_data:
                         chunk_data = json_data.get("chunk", {})
 
+                        # 답변 토큰 스트리밍 처리 (클라이언트 측에서 결합)
+                        if chunk_data.get("type") == "answer_delta":
+                            chat_answer += chunk_data.get("content", "")
+                            st.session_state.chat_response = chat_answer
+
+                            # 기본 안내 텍스트 숨기기
+                            if guide_placeholder:
+                                guide_placeholder.empty()
+
+                            if chat_placeholder:
+                                with chat_placeholder.container():
+                                    st.markdown(
+                                        f"""
+                                        <div class="custom-response-box">
+                                            <h3 style="color: #ffffff; margin-bottom: 12px;">💬 응답</h3>
+                                            <p style="color: #ffffff;">{chat_answer}</p>
+                                        </div>
+                                        """,
+                                        unsafe_allow_html=True,
+                                    )
+
                         # 답변 텍스트 처리
-                        if chunk_data.get("type") == "answer":
+                        elif chunk_data.get("type") == "answer":
                             answer_text = chunk_data.get("content", "")
                             if answer_text:
                                 chat_answer = answer_text
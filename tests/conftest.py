@@ -0,0 +1,11 @@
+"""
+테스트 공통 설정
+
+core.settings는 import 시점에 설정을 검증하므로, .env가 없는 환경에서도
+에이전트 모듈을 import할 수 있도록 더미 값을 채웁니다 (실제 호출은 하지 않음).
+"""
+
+import os
+
+for _key in ("AOAI_API_KEY", "AOAI_ENDPOINT", "AOAI_API_VERSION", "ANTHROPIC_API_KEY"):
+    os.environ.setdefault(_key, "test")
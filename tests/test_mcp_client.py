@@ -0,0 +1,97 @@
+"""
+SyncMCPClient 세션 공유 동작 테스트
+
+실제 MCP 서버 없이 세션/도구 로딩을 가짜 객체로 대체하여 검증합니다.
+"""
+
+import asyncio
+import contextlib
+
+import pytest
+
+mcp_client = pytest.importorskip("mcp_client")
+
+
+class _FakeTool:
+    """지정한 예외를 던지거나 인자를 그대로 돌려주는 도구"""
+
+    def __init__(self, name, error=None):
+        self.name = name
+        self.error = error
+
+    async def ainvoke(self, arguments):
+        await asyncio.sleep(0.01)
+        if self.error is not None:
+            raise self.error
+        return {"tool": self.name, "arguments": arguments}
+
+
+class _FakeMultiClient:
+    """열고 닫은 세션 수를 기록하는 MultiServerMCPClient 대체 객체"""
+
+    def __init__(self):
+        self.opened = 0
+        self.closed = 0
+
+    @contextlib.asynccontextmanager
+    async def session(self, server_name):
+        self.opened += 1
+        try:
+            yield object()
+        finally:
+            self.closed += 1
+
+
+@pytest.fixture
+def client(monkeypatch):
+    tools = [
+        _FakeTool("search_documents"),
+        _FakeTool("summarize_report", error=ValueError("잘못된 매개변수")),
+        _FakeTool("get_tool_status"),
+        _FakeTool("create_slide_draft", error=ConnectionError("연결 끊김")),
+    ]
+
+    async def fake_load_mcp_tools(session):
+        return tools
+
+    monkeypatch.setattr(mcp_client, "load_mcp_tools", fake_load_mcp_tools)
+    sync_client = mcp_client.SyncMCPClient()
+    sync_client.multi_client = _FakeMultiClient()
+    yield sync_client
+    sync_client.shutdown()
+
+
+def test_batch_tool_error_keeps_sibling_results(client):
+    results = client.batch(
+        [
+            ("search_documents", {"query": "클라우드", "top_k": 3}),
+            ("summarize_report", {"content": "본문", "title": "제목"}),
+            ("get_tool_status", {}),
+        ]
+    )
+
+    assert results[0] == {
+        "result": {
+            "tool": "search_documents",
+            "arguments": {"query": "클라우드", "top_k": 3},
+        },
+        "status": "success",
+    }
+    assert "잘못된 매개변수" in results[1]["error"]
+    assert results[2]["status"] == "success"
+
+    # 도구 오류는 공유 세션을 닫지 않음
+    assert client.multi_client.opened == 1
+    assert client.multi_client.closed == 0
+    assert client.search_documents("후속 질의")["status"] == "success"
+    assert client.multi_client.opened == 1
+
+
+def test_connection_error_reconnects_on_next_call(client):
+    result = client.create_slide_draft([], "초안")
+
+    assert "연결 끊김" in result["error"]
+    assert client.multi_client.closed == 1
+
+    assert client.get_tool_status()["status"] == "success"
+    assert client.multi_client.opened == 2
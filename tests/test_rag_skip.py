@@ -0,0 +1,74 @@
+"""
+RAG 검색 생략 경로 테스트
+
+LLM/MCP 연결 없이 에이전트 인스턴스를 만들어 플래너의 RAG 필요 여부 판단과
+실행기의 rag_retriever 생략 동작을 검증합니다.
+"""
+
+import pytest
+
+planner_agent = pytest.importorskip("agents.planner_agent")
+react_executor_agent = pytest.importorskip("agents.react_executor_agent")
+
+
+class _FakeMCPClient:
+    """search_documents 호출 횟수를 기록하는 MCP 클라이언트 대체 객체"""
+
+    def __init__(self):
+        self.search_calls = 0
+
+    def search_documents(self, query, top_k=5):
+        self.search_calls += 1
+        return {"result": {"results": [{"content": query}]}, "status": "success"}
+
+
+def _planner(intent, user_input, key_entities=()):
+    planner = object.__new__(planner_agent.PlannerAgent)
+    planner._current_intent = intent
+    planner._current_user_input = user_input
+    planner._current_key_entities = list(key_entities)
+    return planner
+
+
+def _executor(needs_rag):
+    executor = object.__new__(react_executor_agent.ReActExecutorAgent)
+    executor.mcp_client = _FakeMCPClient()
+    executor._current_context = {"needs_rag": needs_rag}
+    return executor
+
+
+@pytest.mark.parametrize(
+    "intent, user_input, key_entities, expected",
+    [
+        ("general", "안녕하세요 오늘 날씨 어때요", [], False),
+        ("question", "시스템 상태", [], False),
+        ("question", "ISMS-P 인증", ["ISMS-P"], True),
+        ("question", "클라우드 보안 인증 기준은 무엇인가요", [], True),
+        ("slide_generation", "보안 슬라이드", [], True),
+    ],
+)
+def test_needs_rag(intent, user_input, key_entities, expected):
+    assert _planner(intent, user_input, key_entities)._needs_rag() is expected
+
+
+def test_rag_retriever_skipped_when_not_needed():
+    executor = _executor(needs_rag=False)
+
+    result = executor._execute_tool(
+        {"tool_name": "rag_retriever", "tool_params": {"query": "시스템 상태"}}
+    )
+
+    assert executor.mcp_client.search_calls == 0
+    assert result["status"] == "success"
+    assert result["result"] == {"result": {"results": []}, "status": "skipped"}
+
+
+def test_rag_retriever_searches_when_needed():
+    executor = _executor(needs_rag=True)
+
+    result = executor._execute_tool(
+        {"tool_name": "rag_retriever", "tool_params": {"query": "클라우드 보안"}}
+    )
+
+    assert executor.mcp_client.search_calls == 1
+    assert result["result"]["status"] == "success"
@@ -0,0 +1,212 @@
+"""
+CloudRegiXSearchEngine 키워드 검색 테스트
+
+ChromaDB 없이 컬렉션을 가짜 객체로 대체하여 후보 조회와 점수 계산을 검증합니다.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+search_engine = pytest.importorskip("core.search_engine")
+
+
+def _matches(where_document, document):
+    """ChromaDB where_document 조건 평가 ($contains는 대소문자 구분)"""
+    if where_document is None:
+        return True
+    if "$or" in where_document:
+        return any(_matches(clause, document) for clause in where_document["$or"])
+    return where_document["$contains"] in document
+
+
+class _FakeCollection:
+    """삽입 순서대로 문서를 돌려주는 ChromaDB 컬렉션 대체 객체"""
+
+    def __init__(self, documents, delay=0.0):
+        self.ids = [f"doc{i}" for i in range(len(documents))]
+        self.documents = list(documents)
+        self.delay = delay
+        self.get_calls = []
+
+    def count(self):
+        return len(self.ids)
+
+    def get(
+        self,
+        ids=None,
+        where=None,
+        where_document=None,
+        include=None,
+        limit=None,
+        offset=0,
+    ):
+        self.get_calls.append({"ids": ids, "where_document": where_document})
+        time.sleep(self.delay)
+        rows = [
+            i
+            for i, (doc_id, document) in enumerate(zip(self.ids, self.documents))
+            if (ids is None or doc_id in ids) and _matches(where_document, document)
+        ]
+        rows = rows[offset : None if limit is None else offset + limit]
+        return {
+            "ids": [self.ids[i] for i in rows],
+            "documents": [self.documents[i] for i in rows],
+            "metadatas": [{"filename": f"{self.ids[i]}.txt"} for i in rows],
+        }
+
+
+def _write_fts_index(vectorstore_path, documents, tokenize="trigram"):
+    """벡터화 스크립트와 같은 스키마로 FTS5 보조 인덱스 생성"""
+    conn = sqlite3.connect(vectorstore_path / search_engine.FTS_DB_FILENAME)
+    with conn:
+        conn.execute(
+            "CREATE VIRTUAL TABLE docs USING fts5(id UNINDEXED, "
+            "collection UNINDEXED, content, metadata_json UNINDEXED, "
+            f"tokenize='{tokenize}')"
+        )
+        conn.executemany(
+            "INSERT INTO docs VALUES (?, 'test', ?, '{}')",
+            [(f"doc{i}", document) for i, document in enumerate(documents)],
+        )
+    conn.close()
+
+
+def _make_engine(documents, vectorstore_path):
+    """ChromaDB/임베딩 초기화 없이 키워드 검색에 필요한 상태만 갖춘 엔진 생성"""
+    engine = object.__new__(search_engine.CloudRegiXSearchEngine)
+    engine.vectorstore_path = str(vectorstore_path)
+    engine.collection_name = "test"
+    engine.collection = _FakeCollection(documents)
+    engine.logger = logging.getLogger("test_search_engine")
+    engine._init_fts_index()
+    engine._init_domain_keywords()
+    engine._keyword_pattern_cache = OrderedDict()
+    engine._keyword_pattern_lock = threading.Lock()
+    engine._result_cache = OrderedDict()
+    engine._result_cache_lock = threading.Lock()
+    engine.stats = {
+        "total_searches": 0,
+        "avg_search_time": 0.0,
+        "cache_hits": 0,
+        "result_cache_hits": 0,
+    }
+    engine._stats_lock = threading.Lock()
+    return engine
+
+
+def _keyword_ids(engine, query, max_results=3):
+    return [r.id for r in engine._keyword_search(query, max_results, None)]
+
+
+def test_keyword_search_ignores_case_of_matches(tmp_path):
+    # 소문자 부분 일치 문서만 사전 필터링되면 대문자 완전 일치 문서를 놓침
+    engine = _make_engine(["cloudnative 설계", "Cloud 보안 점검"], tmp_path)
+
+    assert _keyword_ids(engine, "cloud", max_results=1) == ["doc1"]
+
+
+def test_keyword_search_returns_global_top_k(tmp_path):
+    # 부분 일치 문서가 앞쪽에 많아도 뒤쪽의 완전 일치 문서가 상위에 포함되어야 함
+    documents = [f"재해복구계획 {i}" for i in range(50)] + ["재해복구 절차 수립"]
+    engine = _make_engine(documents, tmp_path)
+
+    assert _keyword_ids(engine, "재해복구", max_results=1) == ["doc50"]
+
+
+def test_caseless_keywords_use_where_document_prefilter(tmp_path):
+    engine = _make_engine(["재해복구 절차", "운영 절차"], tmp_path)
+
+    assert _keyword_ids(engine, "재해복구") == ["doc0"]
+    assert engine.collection.get_calls[-1]["where_document"] == {
+        "$contains": "재해복구"
+    }
+
+
+def test_search_context_shares_in_flight_fetch():
+    collection = _FakeCollection(["클라우드 보안", "재해복구 절차"], delay=0.05)
+    context = search_engine._SearchContext(collection)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        pages = list(pool.map(lambda _: list(context.iter_pages(None)), range(2)))
+
+    assert pages[0] == pages[1]
+    assert len(collection.get_calls) == 1
+
+
+@pytest.mark.parametrize(
+    "document, keywords",
+    [
+        (
+            "the application programming interface spec",
+            ["application", "application programming interface"],
+        ),
+        ("isms-p 인증 기준", ["isms", "isms-p"]),
+    ],
+)
+def test_keyword_inside_longer_match_keeps_full_credit(tmp_path, document, keywords):
+    engine = _make_engine([], tmp_path)
+    matcher = engine._get_keyword_pattern(keywords)
+
+    assert engine._calculate_keyword_score(document, keywords, matcher) == 1.0
+
+
+def test_keyword_without_word_boundary_scores_half(tmp_path):
+    engine = _make_engine([], tmp_path)
+    keywords = ["보안"]
+    matcher = engine._get_keyword_pattern(keywords)
+
+    assert engine._calculate_keyword_score("정보보안 정책", keywords, matcher) == 0.5
+
+
+def test_fts_index_finds_keyword_inside_korean_compound(tmp_path):
+    documents = ["멀티클라우드 전환 전략", "온프레미스 운영 절차"]
+    _write_fts_index(tmp_path, documents)
+    engine = _make_engine(documents, tmp_path)
+
+    assert _keyword_ids(engine, "클라우드") == ["doc0"]
+    # 후보는 FTS5 인덱스가 찾은 문서 ID로만 조회
+    assert engine.collection.get_calls[-1]["ids"] == ["doc0"]
+
+
+def test_short_korean_keyword_in_compound_falls_back_to_scan(tmp_path):
+    # trigram은 2글자 키워드를 찾지 못하므로 FTS5 결과로 확정하지 않음
+    documents = ["정보보안 정책 수립", "온프레미스 운영 절차"]
+    _write_fts_index(tmp_path, documents)
+    engine = _make_engine(documents, tmp_path)
+
+    results = engine._keyword_search("보안", 3, None)
+
+    assert [r.id for r in results] == ["doc0"]
+    assert all(call["ids"] is None for call in engine.collection.get_calls)
+
+
+def test_word_token_fts_index_is_not_used(tmp_path):
+    documents = ["멀티클라우드 전환 전략"]
+    _write_fts_index(tmp_path, documents, tokenize="unicode61 remove_diacritics 2")
+    engine = _make_engine(documents, tmp_path)
+
+    assert engine._fts_conn is None
+    assert _keyword_ids(engine, "클라우드") == ["doc0"]
+
+
+def test_result_cache_hit_is_counted_as_served_search(tmp_path):
+    engine = _make_engine([], tmp_path)
+    engine._store_result(
+        ("클라우드", "hybrid", 3, None),
+        {"query": "클라우드", "method": "hybrid", "results": [], "success": True},
+    )
+
+    response = engine.search("클라우드", method="hybrid", max_results=3)
+    statistics = engine.get_search_statistics()
+
+    assert response["results"] == []
+    assert type(response["method"]) is str
+    assert statistics["total_searches"] == 1
+    assert statistics["result_cache_hits"] == 1
+    assert statistics["cache_hits"] == 0
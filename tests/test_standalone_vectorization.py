@@ -0,0 +1,36 @@
+"""
+DocumentChunker 문장 분할 테스트
+
+블록 단위로 읽은 텍스트와 전체 텍스트의 분할 결과가 같은지 검증합니다.
+벡터화 스크립트는 import 시 필수 라이브러리가 없으면 종료하므로 먼저 확인합니다.
+"""
+
+import pytest
+
+for _module in ("chromadb", "fitz", "docx", "pandas", "orjson", "config.llm"):
+    pytest.importorskip(_module)
+
+standalone_vectorization = pytest.importorskip("core.standalone_vectorization")
+
+
+def _split_blocks(text, size):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "x. " + "A" * 300 + ". end.",
+        "첫 문장입니다. " + "로그 " * 120 + "마지막 문장! 끝",
+        "A." + " " * 5 + "B" * 250 + "。C?  D",
+    ],
+)
+@pytest.mark.parametrize("block_size", [1, 7, 100, 150])
+def test_block_wise_split_matches_whole_text(text, block_size):
+    chunker = standalone_vectorization.DocumentChunker(chunk_size=100)
+
+    whole = list(chunker._iter_sentences([text]))
+    block_wise = list(chunker._iter_sentences(_split_blocks(text, block_size)))
+
+    assert block_wise == whole
+    assert all(len(sentence) <= chunker.chunk_size for sentence in whole)